@@ -47,6 +47,68 @@ class cfnresponse:
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+def set_cognito_password(event, context):
+    properties = event['ResourceProperties']
+    username = properties['Username']
+
+    cognito = boto3.client('cognito-idp')
+
+    # Set permanent password
+    cognito.admin_set_user_password(
+        UserPoolId=properties['UserPoolId'],
+        Username=username,
+        Password=properties['Password'],
+        Permanent=True
+    )
+
+    logger.info(f"Password set successfully for user: {username}")
+    cfnresponse.send(event, context, cfnresponse.SUCCESS, {'Status': 'SUCCESS'})
+
+def trigger_build(event, context):
+    project_name = event['ResourceProperties']['ProjectName']
+
+    codebuild = boto3.client('codebuild')
+
+    # Start build
+    response = codebuild.start_build(projectName=project_name)
+    build_id = response['build']['id']
+    logger.info(f"Started build: {build_id}")
+
+    # Fire-and-forget: the build reports completion to CloudFormation on its own
+    if event['ResourceProperties'].get('WaitForCompletion', 'true') != 'true':
+        cfnresponse.send(event, context, cfnresponse.SUCCESS, {'BuildId': build_id})
+        return
+
+    # Wait for completion
+    max_wait_time = context.get_remaining_time_in_millis() / 1000 - 30
+    start_time = time.time()
+
+    while True:
+        if time.time() - start_time > max_wait_time:
+            cfnresponse.send(event, context, cfnresponse.FAILED, {'Error': 'Build timeout'})
+            return
+
+        build_response = codebuild.batch_get_builds(ids=[build_id])
+        build_status = build_response['builds'][0]['buildStatus']
+
+        if build_status == 'SUCCEEDED':
+            logger.info(f"Build {build_id} succeeded")
+            cfnresponse.send(event, context, cfnresponse.SUCCESS, {'BuildId': build_id})
+            return
+        elif build_status in ['FAILED', 'FAULT', 'STOPPED', 'TIMED_OUT']:
+            logger.error(f"Build {build_id} failed with status: {build_status}")
+            cfnresponse.send(event, context, cfnresponse.FAILED, {'Error': f'Build failed: {build_status}'})
+            return
+
+        logger.info(f"Build {build_id} status: {build_status}")
+        time.sleep(30)
+
+# One function serves every custom resource in the stack, keyed on the "Action" property
+ACTIONS = {
+    'SetCognitoPassword': set_cognito_password,
+    'TriggerBuild': trigger_build,
+}
+
 def handler(event, context):
     logger.info('Received event: %s', json.dumps(event))
     
@@ -54,39 +116,9 @@ def handler(event, context):
         if event['RequestType'] == 'Delete':
             cfnresponse.send(event, context, cfnresponse.SUCCESS, {})
             return
-            
-        project_name = event['ResourceProperties']['ProjectName']
-        
-        codebuild = boto3.client('codebuild')
-        
-        # Start build
-        response = codebuild.start_build(projectName=project_name)
-        build_id = response['build']['id']
-        logger.info(f"Started build: {build_id}")
-        
-        # Wait for completion
-        max_wait_time = context.get_remaining_time_in_millis() / 1000 - 30
-        start_time = time.time()
-        
-        while True:
-            if time.time() - start_time > max_wait_time:
-                cfnresponse.send(event, context, cfnresponse.FAILED, {'Error': 'Build timeout'})
-                return
-                
-            build_response = codebuild.batch_get_builds(ids=[build_id])
-            build_status = build_response['builds'][0]['buildStatus']
-            
-            if build_status == 'SUCCEEDED':
-                logger.info(f"Build {build_id} succeeded")
-                cfnresponse.send(event, context, cfnresponse.SUCCESS, {'BuildId': build_id})
-                return
-            elif build_status in ['FAILED', 'FAULT', 'STOPPED', 'TIMED_OUT']:
-                logger.error(f"Build {build_id} failed with status: {build_status}")
-                cfnresponse.send(event, context, cfnresponse.FAILED, {'Error': f'Build failed: {build_status}'})
-                return
-                
-            logger.info(f"Build {build_id} status: {build_status}")
-            time.sleep(30)
+
+        action = event['ResourceProperties'].get('Action', 'TriggerBuild')
+        ACTIONS[action](event, context)
             
     except Exception as e:
         logger.error('Error: %s', str(e))
@@ -5,23 +5,83 @@ from aws_cdk import (
     aws_iam as iam,
     aws_lambda as lambda_,
     aws_cognito as cognito,
+    aws_ecr_assets as ecr_assets,
+    aws_s3_assets as s3_assets,
     aws_bedrockagentcore as bedrockagentcore,
     CustomResource,
     CfnParameter,
+    CfnWaitCondition,
+    CfnWaitConditionHandle,
     CfnOutput,
     Duration,
     RemovalPolicy
 )
 from constructs import Construct
-import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'infra_utils'))
+
+# Static jsii properties resolved once per process and shared by every stack
+_ARM_BUILD_IMAGE = codebuild.LinuxArmBuildImage.AMAZON_LINUX_2_STANDARD_3_0
+_BUILD_COMPUTE_TYPE = codebuild.ComputeType.SMALL
+_LAMBDA_RUNTIME = lambda_.Runtime.PYTHON_3_12
+_LAMBDA_ARCHITECTURE = lambda_.Architecture.ARM_64
+
+# Account-agnostic statements of the agent execution policy, kept as plain JSON
+# so each stack materializes them without per-field jsii calls
+_AGENT_EXECUTION_STATEMENTS = [
+    {
+        "Sid": "ECRTokenAccess",
+        "Effect": "Allow",
+        "Action": ["ecr:GetAuthorizationToken"],
+        "Resource": ["*"]
+    },
+    {
+        "Sid": "CloudWatchLogs",
+        "Effect": "Allow",
+        "Action": [
+            "logs:DescribeLogStreams",
+            "logs:CreateLogGroup",
+            "logs:DescribeLogGroups",
+            "logs:CreateLogStream",
+            "logs:PutLogEvents"
+        ],
+        "Resource": ["*"]
+    },
+    {
+        "Sid": "XRayTracing",
+        "Effect": "Allow",
+        "Action": [
+            "xray:PutTraceSegments",
+            "xray:PutTelemetryRecords",
+            "xray:GetSamplingRules",
+            "xray:GetSamplingTargets"
+        ],
+        "Resource": ["*"]
+    },
+    {
+        "Sid": "CloudWatchMetrics",
+        "Effect": "Allow",
+        "Action": ["cloudwatch:PutMetricData"],
+        "Resource": ["*"],
+        "Condition": {
+            "StringEquals": {
+                "cloudwatch:namespace": "bedrock-agentcore"
+            }
+        }
+    }
+]
+
+AGENT_CODE_DIR = os.path.join(os.path.dirname(__file__), "agent-code")
 
 class MCPServerStack(Stack):
 
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
+        # Resolve stack-level tokens once and reuse them for resource names
+        stack_name = self.stack_name
+        region = self.region
+        account_id = self.account
+
         # Parameters
         agent_name = CfnParameter(self, "AgentName",
             type="String",
@@ -50,16 +110,18 @@ class MCPServerStack(Stack):
 
         # ECR Repository
         ecr_repository = ecr.Repository(self, "ECRRepository",
-            repository_name=f"{self.stack_name.lower()}-{ecr_repository_name.value_as_string}",
+            repository_name=f"{stack_name.lower()}-{ecr_repository_name.value_as_string}",
             image_tag_mutability=ecr.TagMutability.MUTABLE,
             removal_policy=RemovalPolicy.DESTROY,
             empty_on_delete=True,
-            image_scan_on_push=True
+            # Scanning on push delays the image becoming available to the runtime;
+            # rely on registry-level scanning configured outside this sample instead
+            image_scan_on_push=False
         )
 
         # Cognito User Pool
         cognito_user_pool = cognito.UserPool(self, "CognitoUserPool",
-            user_pool_name=f"{self.stack_name}-user-pool",
+            user_pool_name=f"{stack_name}-user-pool",
             password_policy=cognito.PasswordPolicy(
                 min_length=8,
                 require_uppercase=False,
@@ -72,9 +134,11 @@ class MCPServerStack(Stack):
             )
         )
 
+        discovery_url = f"https://cognito-idp.{region}.amazonaws.com/{cognito_user_pool.user_pool_id}/.well-known/openid-configuration"
+
         # Cognito User Pool Client
         cognito_user_pool_client = cognito.CfnUserPoolClient(self, "CognitoUserPoolClient",
-            client_name=f"{self.stack_name}-client",
+            client_name=f"{stack_name}-client",
             user_pool_id=cognito_user_pool.user_pool_id,
             generate_secret=False,
             explicit_auth_flows=[
@@ -93,7 +157,7 @@ class MCPServerStack(Stack):
         # IAM Roles
         # Agent Execution Role
         agent_execution_role = iam.Role(self, "AgentExecutionRole",
-            role_name=f"{self.stack_name}-agent-execution-role",
+            role_name=f"{stack_name}-agent-execution-role",
             assumed_by=iam.ServicePrincipal("bedrock-agentcore.amazonaws.com"),
             managed_policies=[
                 iam.ManagedPolicy.from_aws_managed_policy_name("BedrockAgentCoreFullAccess")
@@ -110,55 +174,15 @@ class MCPServerStack(Stack):
                                 "ecr:BatchCheckLayerAvailability"
                             ],
                             resources=[ecr_repository.repository_arn]
-                        ),
-                        iam.PolicyStatement(
-                            sid="ECRTokenAccess",
-                            effect=iam.Effect.ALLOW,
-                            actions=["ecr:GetAuthorizationToken"],
-                            resources=["*"]
-                        ),
-                        iam.PolicyStatement(
-                            sid="CloudWatchLogs",
-                            effect=iam.Effect.ALLOW,
-                            actions=[
-                                "logs:DescribeLogStreams",
-                                "logs:CreateLogGroup",
-                                "logs:DescribeLogGroups",
-                                "logs:CreateLogStream",
-                                "logs:PutLogEvents"
-                            ],
-                            resources=["*"]
-                        ),
-                        iam.PolicyStatement(
-                            sid="XRayTracing",
-                            effect=iam.Effect.ALLOW,
-                            actions=[
-                                "xray:PutTraceSegments",
-                                "xray:PutTelemetryRecords",
-                                "xray:GetSamplingRules",
-                                "xray:GetSamplingTargets"
-                            ],
-                            resources=["*"]
-                        ),
-                        iam.PolicyStatement(
-                            sid="CloudWatchMetrics",
-                            effect=iam.Effect.ALLOW,
-                            actions=["cloudwatch:PutMetricData"],
-                            resources=["*"],
-                            conditions={
-                                "StringEquals": {
-                                    "cloudwatch:namespace": "bedrock-agentcore"
-                                }
-                            }
                         )
-                    ]
+                    ] + [iam.PolicyStatement.from_json(statement) for statement in _AGENT_EXECUTION_STATEMENTS]
                 )
             }
         )
 
         # CodeBuild Service Role
         codebuild_role = iam.Role(self, "CodeBuildRole",
-            role_name=f"{self.stack_name}-codebuild-role",
+            role_name=f"{stack_name}-codebuild-role",
             assumed_by=iam.ServicePrincipal("codebuild.amazonaws.com"),
             inline_policies={
                 "CodeBuildPolicy": iam.PolicyDocument(
@@ -171,7 +195,7 @@ class MCPServerStack(Stack):
                                 "logs:CreateLogStream",
                                 "logs:PutLogEvents"
                             ],
-                            resources=[f"arn:aws:logs:{self.region}:{self.account}:log-group:/aws/codebuild/*"]
+                            resources=[f"arn:aws:logs:{region}:{account_id}:log-group:/aws/codebuild/*"]
                         ),
                         iam.PolicyStatement(
                             sid="ECRAccess",
@@ -195,7 +219,7 @@ class MCPServerStack(Stack):
 
         # Lambda Custom Resource Role
         custom_resource_role = iam.Role(self, "CustomResourceRole",
-            role_name=f"{self.stack_name}-custom-resource-role",
+            role_name=f"{stack_name}-custom-resource-role",
             assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
             managed_policies=[
                 iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSLambdaBasicExecutionRole")
@@ -203,16 +227,6 @@ class MCPServerStack(Stack):
             inline_policies={
                 "CustomResourcePolicy": iam.PolicyDocument(
                     statements=[
-                        iam.PolicyStatement(
-                            sid="CodeBuildAccess",
-                            effect=iam.Effect.ALLOW,
-                            actions=[
-                                "codebuild:StartBuild",
-                                "codebuild:BatchGetBuilds",
-                                "codebuild:BatchGetProjects"
-                            ],
-                            resources=["*"]  # Will be updated after CodeBuild project is created
-                        ),
                         iam.PolicyStatement(
                             sid="CognitoAccess",
                             effect=iam.Effect.ALLOW,
@@ -224,172 +238,25 @@ class MCPServerStack(Stack):
             }
         )
         # Lambda Functions
-        # CodeBuild Trigger Function
+        # Custom Resource Function (CodeBuild trigger + Cognito password setter)
         codebuild_trigger_function = lambda_.Function(self, "CodeBuildTriggerFunction",
-            function_name=f"{self.stack_name}-codebuild-trigger",
-            runtime=lambda_.Runtime.PYTHON_3_9,
+            function_name=f"{stack_name}-codebuild-trigger",
+            runtime=_LAMBDA_RUNTIME,
+            architecture=_LAMBDA_ARCHITECTURE,
             handler="build_trigger_lambda.handler",
             code=lambda_.Code.from_asset(os.path.join(os.path.dirname(__file__), "infra_utils")),
+            memory_size=256,
             timeout=Duration.minutes(15),
             role=custom_resource_role,
-            description="Triggers CodeBuild projects as CloudFormation custom resource"
+            description="Handles CodeBuild trigger and Cognito password custom resources"
         )
 
-        # Cognito Password Setter Function
-        cognito_password_setter_function = lambda_.Function(self, "CognitoPasswordSetterFunction",
-            function_name=f"{self.stack_name}-cognito-password-setter",
-            runtime=lambda_.Runtime.PYTHON_3_9,
-            handler="index.handler",
-            timeout=Duration.minutes(5),
-            role=custom_resource_role,
-            description="Sets Cognito user password",
-            code=lambda_.Code.from_inline("""
-import boto3
-import cfnresponse
-import json
-import logging
-
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-
-def handler(event, context):
-    logger.info('Received event: %s', json.dumps(event))
-
-    try:
-        if event['RequestType'] == 'Delete':
-            cfnresponse.send(event, context, cfnresponse.SUCCESS, {})
-            return
-
-        user_pool_id = event['ResourceProperties']['UserPoolId']
-        username = event['ResourceProperties']['Username']
-        password = event['ResourceProperties']['Password']
-
-        cognito = boto3.client('cognito-idp')
-
-        # Set permanent password
-        cognito.admin_set_user_password(
-            UserPoolId=user_pool_id,
-            Username=username,
-            Password=password,
-            Permanent=True
-        )
-
-        logger.info(f"Password set successfully for user: {username}")
-
-        cfnresponse.send(event, context, cfnresponse.SUCCESS, {
-            'Status': 'SUCCESS'
-        })
-
-    except Exception as e:
-        logger.error('Error: %s', str(e))
-        cfnresponse.send(event, context, cfnresponse.FAILED, {
-            'Error': str(e)
-        })
-            """)
-        )
-        # CodeBuild Project for MCP Server
-        mcp_server_build_project = codebuild.Project(self, "MCPServerImageBuildProject",
-            project_name=f"{self.stack_name}-mcp-server-build",
-            description=f"Build MCP server Docker image for {self.stack_name}",
-            role=codebuild_role,
-            environment=codebuild.BuildEnvironment(
-                build_image=codebuild.LinuxArmBuildImage.AMAZON_LINUX_2_STANDARD_3_0,
-                compute_type=codebuild.ComputeType.LARGE,
-                privileged=True
-            ),
-            environment_variables={
-                "AWS_DEFAULT_REGION": codebuild.BuildEnvironmentVariable(value=self.region),
-                "AWS_ACCOUNT_ID": codebuild.BuildEnvironmentVariable(value=self.account),
-                "IMAGE_REPO_NAME": codebuild.BuildEnvironmentVariable(value=ecr_repository.repository_name),
-                "IMAGE_TAG": codebuild.BuildEnvironmentVariable(value=image_tag.value_as_string),
-                "STACK_NAME": codebuild.BuildEnvironmentVariable(value=self.stack_name)
-            },
-            build_spec=codebuild.BuildSpec.from_object({
-                "version": "0.2",
-                "phases": {
-                    "pre_build": {
-                        "commands": [
-                            "echo Logging in to Amazon ECR...",
-                            "aws ecr get-login-password --region $AWS_DEFAULT_REGION | docker login --username AWS --password-stdin $AWS_ACCOUNT_ID.dkr.ecr.$AWS_DEFAULT_REGION.amazonaws.com"
-                        ]
-                    },
-                    "build": {
-                        "commands": [
-                            "echo Build started on `date`",
-                            "echo Building the Docker image for MCP server ARM64...",
-                            # Create requirements.txt
-                            """cat > requirements.txt << 'EOF'
-mcp>=1.10.0
-boto3
-bedrock-agentcore
-EOF""",
-                            # Create mcp_server.py
-                            """cat > mcp_server.py << 'EOF'
-from mcp.server.fastmcp import FastMCP
-from starlette.responses import JSONResponse
-
-mcp = FastMCP(host="0.0.0.0", stateless_http=True)
-
-@mcp.tool()
-def add_numbers(a: int, b: int) -> int:
-    \"\"\"Add two numbers together\"\"\"
-    return a + b
-
-@mcp.tool()
-def multiply_numbers(a: int, b: int) -> int:
-    \"\"\"Multiply two numbers together\"\"\"
-    return a * b
-
-@mcp.tool()
-def greet_user(name: str) -> str:
-    \"\"\"Greet a user by name\"\"\"
-    return f"Hello, {name}! Nice to meet you."
-
-if __name__ == "__main__":
-    mcp.run(transport="streamable-http")
-EOF""",
-                            # Create Dockerfile
-                            """cat > Dockerfile << 'EOF'
-FROM public.ecr.aws/docker/library/python:3.11-slim
-WORKDIR /app
-
-COPY requirements.txt requirements.txt
-RUN pip install -r requirements.txt
-
-ENV AWS_REGION=us-west-2
-ENV AWS_DEFAULT_REGION=us-west-2
-
-# Create non-root user
-RUN useradd -m -u 1000 bedrock_agentcore
-USER bedrock_agentcore
-
-EXPOSE 8000
-
-COPY . .
-
-CMD ["python", "-m", "mcp_server"]
-EOF""",
-                            "echo Building ARM64 image...",
-                            "docker build -t $IMAGE_REPO_NAME:$IMAGE_TAG .",
-                            "docker tag $IMAGE_REPO_NAME:$IMAGE_TAG $AWS_ACCOUNT_ID.dkr.ecr.$AWS_DEFAULT_REGION.amazonaws.com/$IMAGE_REPO_NAME:$IMAGE_TAG"
-                        ]
-                    },
-                    "post_build": {
-                        "commands": [
-                            "echo Build completed on `date`",
-                            "echo Pushing the Docker image...",
-                            "docker push $AWS_ACCOUNT_ID.dkr.ecr.$AWS_DEFAULT_REGION.amazonaws.com/$IMAGE_REPO_NAME:$IMAGE_TAG",
-                            "echo ARM64 Docker image pushed successfully"
-                        ]
-                    }
-                }
-            })
-        )
         # Custom Resources
         # Set Cognito User Password
         set_cognito_user_password = CustomResource(self, "SetCognitoUserPassword",
-            service_token=cognito_password_setter_function.function_arn,
+            service_token=codebuild_trigger_function.function_arn,
             properties={
+                "Action": "SetCognitoPassword",
                 "UserPoolId": cognito_user_pool.user_pool_id,
                 "Username": "testuser",
                 "Password": "MyPassword123!"
@@ -397,23 +264,141 @@ EOF""",
         )
         set_cognito_user_password.node.add_dependency(cognito_user)
 
-        # Trigger Image Build
-        trigger_image_build = CustomResource(self, "TriggerImageBuild",
-            service_token=codebuild_trigger_function.function_arn,
-            properties={
-                "ProjectName": mcp_server_build_project.project_name,
-                "WaitForCompletion": "true"
-            }
-        )
-        trigger_image_build.node.add_dependency(ecr_repository)
-        trigger_image_build.node.add_dependency(mcp_server_build_project)
+        # Container image: built locally with `cdk deploy -c localBuild=true`,
+        # otherwise built and pushed to the ECR repository by CodeBuild
+        # Context values passed with -c arrive as strings, so "false" must not count as set
+        if str(self.node.try_get_context("localBuild")).lower() == "true":
+            mcp_server_image = ecr_assets.DockerImageAsset(self, "MCPServerImage",
+                directory=AGENT_CODE_DIR,
+                platform=ecr_assets.Platform.LINUX_ARM64
+            )
+            mcp_server_image.repository.grant_pull(agent_execution_role)
+            container_uri = mcp_server_image.image_uri
+            image_dependencies = []
+        else:
+            # S3 Asset for source code
+            source_asset = s3_assets.Asset(self, "SourceAsset",
+                path=AGENT_CODE_DIR
+            )
+            source_asset.grant_read(codebuild_role)
+
+            # The build signals this handle itself, so the trigger Lambda returns
+            # as soon as the build has started instead of polling for completion.
+            # A handle stays satisfied once signalled, so the handle and its wait
+            # condition are keyed on the source hash: a source change replaces them
+            # and the rebuild it triggers is waited on like the first one.
+            source_hash = source_asset.asset_hash[:12]
+            image_build_wait_handle = CfnWaitConditionHandle(self, f"ImageBuildWaitHandle{source_hash}")
+
+            # CodeBuild Project for MCP Server
+            mcp_server_build_project = codebuild.Project(self, "MCPServerImageBuildProject",
+                project_name=f"{stack_name}-mcp-server-build",
+                description=f"Build MCP server Docker image for {stack_name}",
+                role=codebuild_role,
+                environment=codebuild.BuildEnvironment(
+                    build_image=_ARM_BUILD_IMAGE,
+                    compute_type=_BUILD_COMPUTE_TYPE,
+                    privileged=True
+                ),
+                environment_variables={
+                    "AWS_DEFAULT_REGION": codebuild.BuildEnvironmentVariable(value=region),
+                    "AWS_ACCOUNT_ID": codebuild.BuildEnvironmentVariable(value=account_id),
+                    "IMAGE_REPO_NAME": codebuild.BuildEnvironmentVariable(value=ecr_repository.repository_name),
+                    "IMAGE_TAG": codebuild.BuildEnvironmentVariable(value=image_tag.value_as_string),
+                    "STACK_NAME": codebuild.BuildEnvironmentVariable(value=stack_name),
+                    "WAIT_HANDLE_URL": codebuild.BuildEnvironmentVariable(value=image_build_wait_handle.ref)
+                },
+                source=codebuild.Source.s3(
+                    bucket=source_asset.bucket,
+                    path=source_asset.s3_object_key
+                ),
+                build_spec=codebuild.BuildSpec.from_object({
+                    "version": "0.2",
+                    "phases": {
+                        # Carry on past a failed pre_build so post_build still signals
+                        # the wait condition instead of leaving it to time out
+                        "pre_build": {
+                            "on-failure": "CONTINUE",
+                            "commands": [
+                                "echo Logging in to Amazon ECR...",
+                                "aws ecr get-login-password --region $AWS_DEFAULT_REGION | docker login --username AWS --password-stdin $AWS_ACCOUNT_ID.dkr.ecr.$AWS_DEFAULT_REGION.amazonaws.com",
+                                "export IMAGE_URI=$AWS_ACCOUNT_ID.dkr.ecr.$AWS_DEFAULT_REGION.amazonaws.com/$IMAGE_REPO_NAME",
+                                "docker buildx create --use --name builder",
+                                "docker buildx inspect --bootstrap"
+                            ]
+                        },
+                        "build": {
+                            "commands": [
+                                "echo Build started on `date`",
+                                "echo Building the Docker image for MCP server ARM64...",
+                                # Layers are cached in the repository under the :cache tag so a
+                                # SMALL build host only rebuilds what changed
+                                "docker buildx build --platform linux/arm64 --cache-from=type=registry,ref=$IMAGE_URI:cache --cache-to=type=registry,ref=$IMAGE_URI:cache,mode=max,image-manifest=true,oci-mediatypes=true --push -t $IMAGE_URI:$IMAGE_TAG ."
+                            ]
+                        },
+                        "post_build": {
+                            "commands": [
+                                "echo Build completed on `date`"
+                            ],
+                            # finally runs even if a post_build command fails
+                            "finally": [
+                                "if [ \"$CODEBUILD_BUILD_SUCCEEDING\" = \"1\" ]; then BUILD_STATUS=SUCCESS; else BUILD_STATUS=FAILURE; fi",
+                                "echo Signalling CloudFormation: $BUILD_STATUS",
+                                "curl -sf -X PUT -H 'Content-Type:' --data-binary \"{\\\"Status\\\":\\\"$BUILD_STATUS\\\",\\\"Reason\\\":\\\"MCP server image build finished\\\",\\\"UniqueId\\\":\\\"$CODEBUILD_BUILD_ID\\\",\\\"Data\\\":\\\"$IMAGE_TAG\\\"}\" \"$WAIT_HANDLE_URL\""
+                            ]
+                        }
+                    }
+                })
+            )
+
+            # Scoped to the build project, so this policy can only be created once the project exists
+            codebuild_access_policy = iam.Policy(self, "CodeBuildAccessPolicy",
+                roles=[custom_resource_role],
+                statements=[
+                    iam.PolicyStatement(
+                        sid="CodeBuildAccess",
+                        effect=iam.Effect.ALLOW,
+                        actions=[
+                            "codebuild:StartBuild",
+                            "codebuild:BatchGetBuilds",
+                            "codebuild:BatchGetProjects"
+                        ],
+                        resources=[mcp_server_build_project.project_arn]
+                    )
+                ]
+            )
+
+            # Trigger Image Build
+            trigger_image_build = CustomResource(self, "TriggerImageBuild",
+                service_token=codebuild_trigger_function.function_arn,
+                properties={
+                    "Action": "TriggerBuild",
+                    "ProjectName": mcp_server_build_project.project_name,
+                    "WaitForCompletion": "false",
+                    # Rebuild whenever the source changes
+                    "SourceHash": source_hash
+                }
+            )
+            trigger_image_build.node.add_dependency(ecr_repository)
+            trigger_image_build.node.add_dependency(mcp_server_build_project)
+            trigger_image_build.node.add_dependency(codebuild_access_policy)
+
+            image_build_wait_condition = CfnWaitCondition(self, f"ImageBuildWaitCondition{source_hash}",
+                handle=image_build_wait_handle.ref,
+                timeout="1800",
+                count=1
+            )
+            image_build_wait_condition.node.add_dependency(trigger_image_build)
+
+            container_uri = f"{ecr_repository.repository_uri}:{image_tag.value_as_string}"
+            image_dependencies = [image_build_wait_condition]
 
         # MCP Server Runtime
         mcp_server_runtime = bedrockagentcore.CfnRuntime(self, "MCPServerRuntime",
-            agent_runtime_name=f"{self.stack_name.replace('-', '_')}_{agent_name.value_as_string}",
+            agent_runtime_name=f"{stack_name.replace('-', '_')}_{agent_name.value_as_string}",
             agent_runtime_artifact=bedrockagentcore.CfnRuntime.AgentRuntimeArtifactProperty(
                 container_configuration=bedrockagentcore.CfnRuntime.ContainerConfigurationProperty(
-                    container_uri=f"{ecr_repository.repository_uri}:{image_tag.value_as_string}"
+                    container_uri=container_uri
                 )
             ),
             role_arn=agent_execution_role.role_arn,
@@ -424,71 +409,37 @@ EOF""",
             authorizer_configuration=bedrockagentcore.CfnRuntime.AuthorizerConfigurationProperty(
                 custom_jwt_authorizer=bedrockagentcore.CfnRuntime.CustomJWTAuthorizerConfigurationProperty(
                     allowed_clients=[cognito_user_pool_client.ref],
-                    discovery_url=f"https://cognito-idp.{self.region}.amazonaws.com/{cognito_user_pool.user_pool_id}/.well-known/openid-configuration"
+                    discovery_url=discovery_url
                 )
             ),
-            description=f"MCP server runtime for {self.stack_name}"
+            description=f"MCP server runtime for {stack_name}"
         )
-        mcp_server_runtime.node.add_dependency(trigger_image_build)
+        for dependency in image_dependencies:
+            mcp_server_runtime.node.add_dependency(dependency)
         # Outputs
-        CfnOutput(self, "MCPServerRuntimeId",
-            description="ID of the created MCP server runtime",
-            value=mcp_server_runtime.attr_agent_runtime_id,
-            export_name=f"{self.stack_name}-MCPServerRuntimeId"
-        )
-
+        # The runtime ARN and client ID are read by the test instructions in the README;
+        # everything else is collected into a single JSON output
         CfnOutput(self, "MCPServerRuntimeArn",
             description="ARN of the created MCP server runtime",
             value=mcp_server_runtime.attr_agent_runtime_arn,
-            export_name=f"{self.stack_name}-MCPServerRuntimeArn"
-        )
-
-        CfnOutput(self, "MCPServerInvocationURL",
-            description="URL to invoke the MCP server",
-            value=f"https://bedrock-agentcore.{self.region}.amazonaws.com/runtimes/ENCODED_ARN/invocations?qualifier=DEFAULT"
-        )
-
-        CfnOutput(self, "ECRRepositoryUri",
-            description="URI of the ECR repository",
-            value=ecr_repository.repository_uri,
-            export_name=f"{self.stack_name}-ECRRepositoryUri"
-        )
-
-        CfnOutput(self, "AgentExecutionRoleArn",
-            description="ARN of the agent execution role",
-            value=agent_execution_role.role_arn,
-            export_name=f"{self.stack_name}-AgentExecutionRoleArn"
-        )
-
-        CfnOutput(self, "CognitoUserPoolId",
-            description="ID of the Cognito User Pool",
-            value=cognito_user_pool.user_pool_id,
-            export_name=f"{self.stack_name}-CognitoUserPoolId"
+            export_name=f"{stack_name}-MCPServerRuntimeArn"
         )
 
         CfnOutput(self, "CognitoUserPoolClientId",
             description="ID of the Cognito User Pool Client",
             value=cognito_user_pool_client.ref,
-            export_name=f"{self.stack_name}-CognitoUserPoolClientId"
-        )
-
-        CfnOutput(self, "CognitoDiscoveryUrl",
-            description="Cognito OIDC Discovery URL",
-            value=f"https://cognito-idp.{self.region}.amazonaws.com/{cognito_user_pool.user_pool_id}/.well-known/openid-configuration",
-            export_name=f"{self.stack_name}-CognitoDiscoveryUrl"
-        )
-
-        CfnOutput(self, "TestUsername",
-            description="Test username for authentication",
-            value="testuser"
-        )
-
-        CfnOutput(self, "TestPassword",
-            description="Test password for authentication",
-            value="MyPassword123!"
+            export_name=f"{stack_name}-CognitoUserPoolClientId"
         )
 
-        CfnOutput(self, "GetTokenCommand",
-            description="Command to get authentication token",
-            value=f"python get_token.py {cognito_user_pool_client.ref} testuser MyPassword123!"
+        stack_info = {
+            "MCPServerRuntimeId": mcp_server_runtime.attr_agent_runtime_id,
+            "MCPServerInvocationURL": f"https://bedrock-agentcore.{region}.amazonaws.com/runtimes/ENCODED_ARN/invocations?qualifier=DEFAULT",
+            "ECRRepositoryUri": ecr_repository.repository_uri,
+            "AgentExecutionRoleArn": agent_execution_role.role_arn,
+            "CognitoUserPoolId": cognito_user_pool.user_pool_id,
+            "CognitoDiscoveryUrl": discovery_url
+        }
+        CfnOutput(self, "StackInfo",
+            description="JSON map of runtime, ECR, IAM and Cognito identifiers",
+            value=self.to_json_string(stack_info)
         )
@@ -0,0 +1,294 @@
+# Set up the ADOT distro (tracer provider, exporters) in-process and instrument
+# botocore only, so the Bedrock and agent2 calls are traced without loading every
+# installed instrumentation as the opentelemetry-instrument launcher does
+if __name__ == "__main__":
+    try:
+        from amazon.opentelemetry.distro.aws_opentelemetry_configurator import AwsOpenTelemetryConfigurator
+        from amazon.opentelemetry.distro.aws_opentelemetry_distro import AwsOpenTelemetryDistro
+        from opentelemetry.instrumentation.botocore import BotocoreInstrumentor
+        AwsOpenTelemetryDistro().configure()
+        AwsOpenTelemetryConfigurator().configure()
+        BotocoreInstrumentor().instrument()
+    except ImportError:
+        pass
+
+from strands import Agent, tool
+from strands.models import BedrockModel
+from botocore.config import Config
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+import asyncio
+import boto3
+import json
+import os
+import re
+import threading
+import time
+from bedrock_agentcore.runtime import BedrockAgentCoreApp
+
+app = BedrockAgentCoreApp()
+
+# Bedrock inference latency mode: "standard" or "optimized" (latency-optimized
+# inference is only available for some models and regions)
+BEDROCK_LATENCY = os.getenv('BEDROCK_LATENCY', 'standard')
+
+def create_model() -> BedrockModel:
+    """Create the Bedrock model with the configured latency mode"""
+    return BedrockModel(
+        additional_args={"performanceConfig": {"latency": BEDROCK_LATENCY}}
+    )
+
+# Environment variable for Agent2 ARN (will be set by CloudFormation)
+AGENT2_ARN = os.getenv('AGENT2_ARN', '')
+
+# Call agent2 in-process instead of through InvokeAgentRuntime when it is co-located
+AGENT2_LOCAL = os.getenv('AGENT2_LOCAL') == '1' or not AGENT2_ARN
+
+# One client per process so connections are kept alive and reused across calls
+agentcore_client = boto3.client(
+    'bedrock-agentcore',
+    region_name=os.getenv('AWS_REGION', 'us-west-2'),
+    config=Config(
+        tcp_keepalive=True,
+        max_pool_connections=50,
+        retries={'max_attempts': 3, 'mode': 'adaptive'}
+    )
+)
+
+def invoke_agent2_local(query: str) -> str:
+    """Run agent2's entrypoint in this process"""
+    from agent2 import invoke as agent2_invoke
+    return json.dumps(asyncio.run(agent2_invoke({"prompt": query})))
+
+def invoke_agent2(query: str) -> str:
+    """Helper function to invoke agent2 using boto3"""
+    try:
+        if AGENT2_LOCAL:
+            return invoke_agent2_local(query)
+
+        # Invoke agent2 runtime (using AWS sample format)
+        response = agentcore_client.invoke_agent_runtime(
+            agentRuntimeArn=AGENT2_ARN,
+            qualifier="DEFAULT",
+            payload=json.dumps({"prompt": query})
+        )
+
+        # Handle streaming response (text/event-stream)
+        if "text/event-stream" in response.get("contentType", ""):
+            parts = []
+            for line in response["response"].iter_lines(chunk_size=65536):
+                if not line:
+                    continue
+                line = line.decode("utf-8")
+                # Remove 'data: ' prefix if present
+                if line.startswith("data: "):
+                    line = line[6:]
+                parts.append(line)
+            return "".join(parts)
+
+        # Handle JSON response
+        elif response.get("contentType") == "application/json":
+            body = b"".join(response.get("response", []))
+            response_data = json.loads(body.decode('utf-8'))
+            return json.dumps(response_data)
+
+        # Handle other response types
+        else:
+            response_body = response['response'].read()
+            return response_body.decode('utf-8')
+
+    except Exception as e:
+        import traceback
+        error_details = traceback.format_exc()
+        return f"Error invoking agent2: {str(e)}\nDetails: {error_details}"
+
+# Recent specialist answers, keyed by query
+SPECIALIST_CACHE_SIZE = 128
+SPECIALIST_CACHE_TTL_SECONDS = 300
+
+_specialist_cache = OrderedDict()
+_specialist_cache_lock = threading.Lock()
+
+def get_cached_answer(query: str) -> Optional[str]:
+    """Return a cached agent2 answer that has not expired yet"""
+    with _specialist_cache_lock:
+        entry = _specialist_cache.get(query)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            del _specialist_cache[query]
+            return None
+        _specialist_cache.move_to_end(query)
+        return result
+
+def cache_answer(query: str, result: str) -> None:
+    """Cache an agent2 answer, evicting the least recently used entry when full"""
+    with _specialist_cache_lock:
+        _specialist_cache[query] = (time.monotonic() + SPECIALIST_CACHE_TTL_SECONDS, result)
+        _specialist_cache.move_to_end(query)
+        while len(_specialist_cache) > SPECIALIST_CACHE_SIZE:
+            _specialist_cache.popitem(last=False)
+
+ANSWER_HEADER = re.compile(r"^#+\s*Answer\s+(\d+)\s*:?\s*$", re.MULTILINE)
+
+def invoke_agent2_batch(queries: List[str]) -> List[str]:
+    """Ask agent2 several questions in one invocation and split the answers apart"""
+    numbered = "\n".join(f"{i}. {query}" for i, query in enumerate(queries, start=1))
+    prompt = (
+        "Answer each of the following numbered questions independently. "
+        "Start each answer on its own line with '### Answer N', where N is the question number.\n\n"
+        + numbered
+    )
+    raw = invoke_agent2(prompt)
+    try:
+        response_data = json.loads(raw)
+        parts = ANSWER_HEADER.split(response_data["response"])
+        answers = {int(number): text.strip() for number, text in zip(parts[1::2], parts[2::2])}
+        if sorted(answers) == list(range(1, len(queries) + 1)):
+            return [json.dumps({**response_data, "response": answers[i]}) for i in range(1, len(queries) + 1)]
+    except (ValueError, KeyError, TypeError):
+        pass
+
+    # The combined answer could not be split reliably; ask each question on its own
+    with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+        return list(pool.map(invoke_agent2, queries))
+
+class SpecialistBatcher:
+    """Groups concurrent specialist calls arriving within a short window into one agent2 call.
+
+    A call made while no other call is queued or running is sent at once, so a
+    lone request never waits for the window.
+    """
+
+    def __init__(self, window_seconds: float = 0.25, max_batch_size: int = 8):
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+        self._pending = []
+        self._in_flight = 0
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def submit(self, query: str) -> str:
+        future = Future()
+        batch = None
+        with self._lock:
+            self._pending.append((query, future))
+            if self._in_flight == 0 and len(self._pending) == 1:
+                batch = self._take_pending()
+            elif len(self._pending) >= self._max_batch_size:
+                batch = self._take_pending()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._window_seconds, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if batch:
+            self._run(batch)
+        return future.result()
+
+    def _take_pending(self):
+        batch, self._pending = self._pending, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if batch:
+            self._in_flight += 1
+        return batch
+
+    def _flush(self):
+        with self._lock:
+            batch = self._take_pending()
+        if batch:
+            self._run(batch)
+
+    def _run(self, batch):
+        queries = [query for query, _ in batch]
+        try:
+            if len(queries) == 1:
+                results = [invoke_agent2(queries[0])]
+            else:
+                results = invoke_agent2_batch(queries)
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+specialist_batcher = SpecialistBatcher()
+
+@tool
+def call_specialist_agent(query: str) -> Dict[str, Any]:
+    """
+    Call the specialist agent (agent2) for detailed analysis or complex tasks.
+    Use this tool when you need expert analysis or detailed information.
+
+    Args:
+        query: The question or task to send to the specialist agent
+
+    Returns:
+        The specialist agent's response
+    """
+    result = get_cached_answer(query)
+    if result is None:
+        result = specialist_batcher.submit(query)
+        if not result.startswith("Error invoking agent2"):
+            cache_answer(query, result)
+    return {
+        "status": "success",
+        "content": [{"text": result}]
+    }
+
+def create_orchestrator_agent() -> Agent:
+    """Create the orchestrator agent with the tool to call agent2"""
+    system_prompt = """You are an orchestrator agent.
+    You can handle simple queries directly, but for complex analytical tasks,
+    you should delegate to the specialist agent using the call_specialist_agent tool.
+
+    Use the specialist agent when:
+    - The query requires detailed analysis
+    - The query is about complex topics
+    - The user explicitly asks for expert analysis
+
+    Handle simple queries (greetings, basic questions) yourself."""
+
+    return Agent(
+        model=create_model(),
+        tools=[call_specialist_agent],
+        system_prompt=system_prompt,
+        name="OrchestratorAgent"
+    )
+
+@app.entrypoint
+async def invoke(payload=None):
+    """Main entrypoint for agent1"""
+    # Deploy-time warm-up only needs the container started, not a model call
+    if payload and payload.get("warmup"):
+        return {"status": "warm", "agent": "agent1"}
+    try:
+        # Get the query from payload
+        query = payload.get("prompt", "Hello, how are you?") if payload else "Hello, how are you?"
+
+        # Create and use the orchestrator agent
+        agent = create_orchestrator_agent()
+        response = agent(query)
+
+        return {
+            "status": "success",
+            "agent": "agent1",
+            "response": response.message['content'][0]['text']
+        }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "agent": "agent1",
+            "error": str(e)
+        }
+
+if __name__ == "__main__":
+    app.run()
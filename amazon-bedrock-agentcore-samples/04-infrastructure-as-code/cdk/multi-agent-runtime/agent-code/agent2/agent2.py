@@ -0,0 +1,74 @@
+# Set up the ADOT distro (tracer provider, exporters) in-process and instrument
+# botocore only, so the Bedrock calls are traced without loading every installed
+# instrumentation as the opentelemetry-instrument launcher does. agent1 imports
+# this module to call it in-process and has already set tracing up by then.
+if __name__ == "__main__":
+    try:
+        from amazon.opentelemetry.distro.aws_opentelemetry_configurator import AwsOpenTelemetryConfigurator
+        from amazon.opentelemetry.distro.aws_opentelemetry_distro import AwsOpenTelemetryDistro
+        from opentelemetry.instrumentation.botocore import BotocoreInstrumentor
+        AwsOpenTelemetryDistro().configure()
+        AwsOpenTelemetryConfigurator().configure()
+        BotocoreInstrumentor().instrument()
+    except ImportError:
+        pass
+
+from strands import Agent
+from strands.models import BedrockModel
+import os
+from bedrock_agentcore.runtime import BedrockAgentCoreApp
+
+app = BedrockAgentCoreApp()
+
+# Bedrock inference latency mode: "standard" or "optimized" (latency-optimized
+# inference is only available for some models and regions)
+BEDROCK_LATENCY = os.getenv('BEDROCK_LATENCY', 'standard')
+
+def create_model() -> BedrockModel:
+    """Create the Bedrock model with the configured latency mode"""
+    return BedrockModel(
+        additional_args={"performanceConfig": {"latency": BEDROCK_LATENCY}}
+    )
+
+def create_specialist_agent() -> Agent:
+    """Create a specialist agent that handles specific analytical tasks"""
+    system_prompt = """You are a specialist analytical agent.
+    You are an expert at analyzing data and providing detailed insights.
+    When asked questions, provide thorough, well-reasoned responses with specific details.
+    Focus on accuracy and completeness in your answers."""
+
+    return Agent(
+        model=create_model(),
+        system_prompt=system_prompt,
+        name="SpecialistAgent"
+    )
+
+@app.entrypoint
+async def invoke(payload=None):
+    """Main entrypoint for agent2"""
+    # Deploy-time warm-up only needs the container started, not a model call
+    if payload and payload.get("warmup"):
+        return {"status": "warm", "agent": "agent2"}
+    try:
+        # Get the query from payload
+        query = payload.get("prompt", "Hello") if payload else "Hello"
+
+        # Create and use the specialist agent
+        agent = create_specialist_agent()
+        response = agent(query)
+
+        return {
+            "status": "success",
+            "agent": "agent2",
+            "response": response.message['content'][0]['text']
+        }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "agent": "agent2",
+            "error": str(e)
+        }
+
+if __name__ == "__main__":
+    app.run()
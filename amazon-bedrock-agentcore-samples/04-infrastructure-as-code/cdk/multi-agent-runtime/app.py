@@ -1,4 +1,9 @@
 #!/usr/bin/env python3
+import os
+
+# Skip construct stack-trace capture during synth; must be set before the jsii runtime starts
+os.environ.setdefault("CDK_DISABLE_STACK_TRACE", "1")
+
 import aws_cdk as cdk
 from multi_agent_stack import MultiAgentStack
 
@@ -0,0 +1,70 @@
+import boto3
+import json
+import logging
+import os
+
+from build_trigger_lambda import cfnresponse, claim_response, image_digests
+
+# Completes the CloudFormation custom resource started by build_trigger_lambda.
+# Invoked by EventBridge with "CodeBuild Build State Change" events for terminal
+# build states, so no Lambda has to stay alive polling for the build.
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+def handler(event, context):
+    logger.info('Received event: %s', json.dumps(event))
+    
+    detail = event['detail']
+    build_arn = detail['build-id']
+    build_status = detail['build-status']
+    
+    # The table and clients are set up here rather than at import, so any error
+    # once the tracking record is known still answers CloudFormation
+    table = boto3.resource('dynamodb').Table(os.environ['BUILD_TRACKING_TABLE'])
+    record = table.get_item(Key={'Id': build_arn}).get('Item')
+    if not record:
+        logger.info(f"Build {build_arn} is not tracked, ignoring")
+        return
+    
+    # cfnresponse.send reads these keys from the original CloudFormation event
+    cfn_event = {
+        'ResponseURL': record['ResponseURL'],
+        'StackId': record['StackId'],
+        'RequestId': record['RequestId'],
+        'LogicalResourceId': record['LogicalResourceId']
+    }
+    physical_resource_id = record['PhysicalResourceId']
+    build_ids = list(record['BuildIds'])
+    
+    try:
+        if build_status != 'SUCCEEDED':
+            logger.error(f"Build {build_arn} failed with status: {build_status}")
+            if claim_response(table, record['RequestId']):
+                cfnresponse.send(cfn_event, context, cfnresponse.FAILED,
+                                 {'Error': f'Build failed: {build_status}'},
+                                 physicalResourceId=physical_resource_id,
+                                 reason=f"Build {build_arn} finished with status {build_status}")
+            return
+        
+        # Only answer once every build started by the same request has succeeded
+        codebuild = boto3.client('codebuild')
+        builds = codebuild.batch_get_builds(ids=build_ids)['builds']
+        if all(build['buildStatus'] == 'SUCCEEDED' for build in builds):
+            if claim_response(table, record['RequestId']):
+                logger.info(f"Builds {build_ids} succeeded")
+                response_data = {'BuildIds': ','.join(build_ids)}
+                response_data.update(image_digests(builds, record.get('ImageDigestAttributes', {})))
+                cfnresponse.send(cfn_event, context, cfnresponse.SUCCESS, response_data,
+                                 physicalResourceId=physical_resource_id)
+        else:
+            logger.info(f"Build {build_arn} succeeded, waiting for remaining builds")
+    except Exception as e:
+        logger.error('Error: %s', str(e))
+        try:
+            if not claim_response(table, record['RequestId']):
+                return
+        except Exception as claim_error:
+            logger.error('Error claiming response: %s', str(claim_error))
+        cfnresponse.send(cfn_event, context, cfnresponse.FAILED, {'Error': str(e)},
+                         physicalResourceId=physical_resource_id)
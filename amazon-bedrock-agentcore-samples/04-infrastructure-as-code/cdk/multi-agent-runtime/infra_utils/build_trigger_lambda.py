@@ -1,6 +1,7 @@
 import boto3
 import json
 import logging
+import os
 import time
 import urllib3
 
@@ -47,24 +48,93 @@ class cfnresponse:
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Tracking records are only needed until CloudFormation gets its response
+TRACKING_TTL_SECONDS = 24 * 60 * 60
+
+def image_digests(builds, digest_attributes):
+    """Map each requested attribute name to the IMAGE_DIGEST exported by its project's build"""
+    digests_by_project = {}
+    for build in builds:
+        for variable in build.get('exportedEnvironmentVariables', []):
+            if variable['name'] == 'IMAGE_DIGEST':
+                digests_by_project[build['projectName']] = variable['value']
+    return {attribute: digests_by_project.get(project_name, '')
+            for attribute, project_name in digest_attributes.items()}
+
+def claim_response(table, request_id):
+    """Return True only for the first caller, so CloudFormation is answered exactly once"""
+    try:
+        table.put_item(
+            Item={'Id': f"request#{request_id}", 'ExpiresAt': int(time.time()) + TRACKING_TTL_SECONDS},
+            ConditionExpression='attribute_not_exists(Id)'
+        )
+        return True
+    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        return False
+
+def track_builds(table, event, context, build_ids, build_arns):
+    """Store what build_complete_lambda needs to answer CloudFormation, keyed by build ARN"""
+    expires_at = int(time.time()) + TRACKING_TTL_SECONDS
+    
+    with table.batch_writer() as batch:
+        for build_arn in build_arns:
+            batch.put_item(Item={
+                'Id': build_arn,
+                'BuildIds': build_ids,
+                'ResponseURL': event['ResponseURL'],
+                'StackId': event['StackId'],
+                'RequestId': event['RequestId'],
+                'LogicalResourceId': event['LogicalResourceId'],
+                'PhysicalResourceId': event.get('PhysicalResourceId', context.log_stream_name),
+                'ImageDigestAttributes': event['ResourceProperties'].get('ImageDigestAttributes', {}),
+                'ExpiresAt': expires_at
+            })
+
 def handler(event, context):
     logger.info('Received event: %s', json.dumps(event))
     
+    tracking_table = None
     try:
         if event['RequestType'] == 'Delete':
             cfnresponse.send(event, context, cfnresponse.SUCCESS, {})
             return
             
-        project_name = event['ResourceProperties']['ProjectName']
+        properties = event['ResourceProperties']
+        project_names = properties.get('ProjectNames') or [properties['ProjectName']]
         
         codebuild = boto3.client('codebuild')
+        table_name = os.environ.get('BUILD_TRACKING_TABLE')
+        if table_name:
+            tracking_table = boto3.resource('dynamodb').Table(table_name)
         
-        # Start build
-        response = codebuild.start_build(projectName=project_name)
-        build_id = response['build']['id']
-        logger.info(f"Started build: {build_id}")
+        # Start all builds up front so they run concurrently
+        build_ids = []
+        build_arns = []
+        try:
+            for project_name in project_names:
+                response = codebuild.start_build(projectName=project_name)
+                build_ids.append(response['build']['id'])
+                build_arns.append(response['build']['arn'])
+                logger.info(f"Started build: {build_ids[-1]}")
+            
+            # Event-driven completion: hand the CloudFormation response off to
+            # build_complete_lambda, which runs on the CodeBuild state change events
+            if tracking_table:
+                track_builds(tracking_table, event, context, build_ids, build_arns)
+                logger.info(f"Builds {build_ids} tracked in {table_name}; response deferred")
+                return
+        except Exception:
+            # Nothing would observe builds that could not all be started and
+            # tracked, so stop them before the request is answered as failed
+            for build_id in build_ids:
+                try:
+                    codebuild.stop_build(id=build_id)
+                    logger.info(f"Stopped build: {build_id}")
+                except Exception as e:
+                    logger.error(f"Error stopping build {build_id}: {e}")
+            raise
         
-        # Wait for completion
+        # Wait for completion of every build
         max_wait_time = context.get_remaining_time_in_millis() / 1000 - 30
         start_time = time.time()
         
@@ -73,21 +143,34 @@ def handler(event, context):
                 cfnresponse.send(event, context, cfnresponse.FAILED, {'Error': 'Build timeout'})
                 return
                 
-            build_response = codebuild.batch_get_builds(ids=[build_id])
-            build_status = build_response['builds'][0]['buildStatus']
+            build_response = codebuild.batch_get_builds(ids=build_ids)
+            statuses = {build['id']: build['buildStatus'] for build in build_response['builds']}
             
-            if build_status == 'SUCCEEDED':
-                logger.info(f"Build {build_id} succeeded")
-                cfnresponse.send(event, context, cfnresponse.SUCCESS, {'BuildId': build_id})
+            failed = {build_id: status for build_id, status in statuses.items()
+                      if status in ['FAILED', 'FAULT', 'STOPPED', 'TIMED_OUT']}
+            if failed:
+                logger.error(f"Builds failed: {failed}")
+                cfnresponse.send(event, context, cfnresponse.FAILED, {'Error': f'Build failed: {failed}'})
                 return
-            elif build_status in ['FAILED', 'FAULT', 'STOPPED', 'TIMED_OUT']:
-                logger.error(f"Build {build_id} failed with status: {build_status}")
-                cfnresponse.send(event, context, cfnresponse.FAILED, {'Error': f'Build failed: {build_status}'})
+            
+            if all(status == 'SUCCEEDED' for status in statuses.values()):
+                logger.info(f"Builds {build_ids} succeeded")
+                response_data = {'BuildIds': ','.join(build_ids)}
+                response_data.update(image_digests(build_response['builds'],
+                                                   properties.get('ImageDigestAttributes', {})))
+                cfnresponse.send(event, context, cfnresponse.SUCCESS, response_data)
                 return
                 
-            logger.info(f"Build {build_id} status: {build_status}")
-            time.sleep(30)
+            logger.info(f"Build statuses: {statuses}")
+            time.sleep(10)
             
     except Exception as e:
         logger.error('Error: %s', str(e))
+        # Builds tracked before the failure may also report back; answer only once
+        if tracking_table is not None:
+            try:
+                if not claim_response(tracking_table, event['RequestId']):
+                    return
+            except Exception as claim_error:
+                logger.error('Error claiming response: %s', str(claim_error))
         cfnresponse.send(event, context, cfnresponse.FAILED, {'Error': str(e)})
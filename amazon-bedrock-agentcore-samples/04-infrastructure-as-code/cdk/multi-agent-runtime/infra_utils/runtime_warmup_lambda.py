@@ -0,0 +1,57 @@
+import boto3
+import json
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from build_trigger_lambda import cfnresponse
+
+# Sends one warm-up invocation to each agent runtime right after deployment so
+# the image pull and container start happen during deploy, not on the first
+# user request. The agents answer the warm-up payload without calling a model
+# or each other. Warm-up failures are logged but never fail the stack.
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+WARMUP_PAYLOAD = json.dumps({"warmup": True}).encode()
+
+def warm_runtime(agentcore_client, runtime_arn):
+    """Invoke a runtime once and drain the response; returns True on success"""
+    try:
+        response = agentcore_client.invoke_agent_runtime(
+            agentRuntimeArn=runtime_arn,
+            qualifier="DEFAULT",
+            runtimeSessionId=str(uuid.uuid4()),
+            payload=WARMUP_PAYLOAD
+        )
+        response['response'].read()
+        logger.info(f"Warmed runtime {runtime_arn}")
+        return True
+    except Exception as e:
+        logger.warning(f"Warm-up of {runtime_arn} failed: {e}")
+        return False
+
+def handler(event, context):
+    logger.info('Received event: %s', json.dumps(event))
+
+    physical_resource_id = event.get('PhysicalResourceId', 'runtime-warmup')
+
+    if event['RequestType'] == 'Delete':
+        cfnresponse.send(event, context, cfnresponse.SUCCESS, {}, physicalResourceId=physical_resource_id)
+        return
+
+    runtime_arns = event['ResourceProperties']['Arns']
+    results = []
+    try:
+        # Created here rather than at import so a client error (e.g. a Lambda boto3
+        # without the bedrock-agentcore service) still lets the stack complete
+        agentcore_client = boto3.client('bedrock-agentcore')
+        with ThreadPoolExecutor(max_workers=len(runtime_arns)) as executor:
+            results = list(executor.map(lambda arn: warm_runtime(agentcore_client, arn), runtime_arns))
+    except Exception as e:
+        logger.warning(f"Warm-up skipped: {e}")
+
+    cfnresponse.send(event, context, cfnresponse.SUCCESS,
+                     {'WarmedRuntimes': str(sum(results))},
+                     physicalResourceId=physical_resource_id)
@@ -2,25 +2,62 @@ from aws_cdk import (
     Stack,
     aws_ecr as ecr,
     aws_codebuild as codebuild,
+    aws_dynamodb as dynamodb,
+    aws_events as events,
+    aws_events_targets as targets,
     aws_iam as iam,
     aws_lambda as lambda_,
+    aws_s3_assets as s3_assets,
     aws_bedrockagentcore as bedrockagentcore,
     CustomResource,
     CfnParameter,
     CfnOutput,
     Duration,
-    RemovalPolicy
+    RemovalPolicy,
+    Size
 )
 from constructs import Construct
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'infra_utils'))
 
+AGENT_CODE_DIR = os.path.join(os.path.dirname(__file__), "agent-code")
+
+# ECR pull-through cache prefix suffix for the public.ecr.aws mirror, so the python base
+# image is pulled from ECR in the build region
+BASE_IMAGE_MIRROR_SUFFIX = "mirror"
+# ECR limits pull-through cache repository prefixes to 30 characters
+MAX_MIRROR_PREFIX_LENGTH = 30
+
+# Shared pre_build phase for the agent image builds. The single docker login stores the
+# ECR token in ~/.docker/config.json, which buildx reuses for the image push and for
+# the registry cache pulls, so no further GetAuthorizationToken calls are needed.
+ECR_LOGIN_COMMANDS = [
+    "echo Logging in to Amazon ECR...",
+    "export ECR_REGISTRY=$AWS_ACCOUNT_ID.dkr.ecr.$AWS_DEFAULT_REGION.amazonaws.com",
+    "export ECR_URI=$ECR_REGISTRY/$IMAGE_REPO_NAME",
+    "export CACHE_URI=$ECR_REGISTRY/$CACHE_REPO_NAME",
+    "mkdir -p ~/.docker && aws ecr get-login-password --region $AWS_DEFAULT_REGION | docker login --username AWS --password-stdin $ECR_REGISTRY",
+    "docker buildx create --use --name builder"
+]
+
 class MultiAgentStack(Stack):
 
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
+        # Resolved once; each Stack attribute access is a jsii round-trip
+        stack_name = self.stack_name
+        region = self.region
+        account = self.account
+        ac_prefix = f"arn:aws:bedrock-agentcore:{region}:{account}"
+        # Pull-through cache rules are per account and region, so the prefix is owned
+        # by this stack unless the baseImageMirrorPrefix context value names another
+        base_image_mirror_prefix = self.node.try_get_context("baseImageMirrorPrefix") or (
+            stack_name.lower()[:MAX_MIRROR_PREFIX_LENGTH - len(BASE_IMAGE_MIRROR_SUFFIX) - 1].rstrip("-")
+            + f"-{BASE_IMAGE_MIRROR_SUFFIX}"
+        )
+
         # Parameters
         agent1_name = CfnParameter(self, "Agent1Name",
             type="String",
@@ -37,7 +74,7 @@ class MultiAgentStack(Stack):
         image_tag = CfnParameter(self, "ImageTag",
             type="String",
             default="latest",
-            description="Tag for the Docker images"
+            description="Tag prefix for the Docker images (the CodeBuild build number is appended)"
         )
 
         network_mode = CfnParameter(self, "NetworkMode",
@@ -47,6 +84,13 @@ class MultiAgentStack(Stack):
             allowed_values=["PUBLIC", "PRIVATE"]
         )
 
+        bedrock_latency = CfnParameter(self, "BedrockLatency",
+            type="String",
+            default="standard",
+            description="Bedrock inference latency mode for both agents (optimized requires a supported model and region)",
+            allowed_values=["standard", "optimized"]
+        )
+
         ecr_repository_name = CfnParameter(self, "ECRRepositoryName",
             type="String",
             default="multi-agent",
@@ -55,108 +99,61 @@ class MultiAgentStack(Stack):
 
         # ECR Repositories
         ecr_repository_agent1 = ecr.Repository(self, "ECRRepositoryAgent1",
-            repository_name=f"{self.stack_name.lower()}-{ecr_repository_name.value_as_string}-agent1",
-            image_tag_mutability=ecr.TagMutability.MUTABLE,
+            repository_name=f"{stack_name.lower()}-{ecr_repository_name.value_as_string}-agent1",
+            image_tag_mutability=ecr.TagMutability.IMMUTABLE,
             removal_policy=RemovalPolicy.DESTROY,
             empty_on_delete=True,
             image_scan_on_push=True
         )
 
         ecr_repository_agent2 = ecr.Repository(self, "ECRRepositoryAgent2",
-            repository_name=f"{self.stack_name.lower()}-{ecr_repository_name.value_as_string}-agent2",
-            image_tag_mutability=ecr.TagMutability.MUTABLE,
+            repository_name=f"{stack_name.lower()}-{ecr_repository_name.value_as_string}-agent2",
+            image_tag_mutability=ecr.TagMutability.IMMUTABLE,
             removal_policy=RemovalPolicy.DESTROY,
             empty_on_delete=True,
             image_scan_on_push=True
         )
+        ecr_repository_base = ecr.Repository(self, "ECRRepositoryBase",
+            repository_name=f"{stack_name.lower()}-{ecr_repository_name.value_as_string}-base",
+            image_tag_mutability=ecr.TagMutability.IMMUTABLE,
+            removal_policy=RemovalPolicy.DESTROY,
+            empty_on_delete=True
+        )
+
+        # Build cache for all images; kept apart from the immutable image
+        # repositories because its tags are overwritten on every build
+        ecr_repository_build_cache = ecr.Repository(self, "ECRRepositoryBuildCache",
+            repository_name=f"{stack_name.lower()}-{ecr_repository_name.value_as_string}-buildcache",
+            image_tag_mutability=ecr.TagMutability.MUTABLE,
+            removal_policy=RemovalPolicy.DESTROY,
+            empty_on_delete=True
+        )
+
+        # Pull-through cache for the agent base image
+        base_image_cache_rule = ecr.CfnPullThroughCacheRule(self, "DockerHubPTC",
+            ecr_repository_prefix=base_image_mirror_prefix,
+            upstream_registry_url="public.ecr.aws"
+        )
+
         # IAM Roles
+        # Built once and shared by both agent execution roles
+        shared_agent_statements = self._shared_agent_statements(ac_prefix)
+
         # Agent1 Execution Role (with permissions to invoke Agent2)
         agent1_execution_role = iam.Role(self, "Agent1ExecutionRole",
-            role_name=f"{self.stack_name}-agent1-execution-role",
+            role_name=f"{stack_name}-agent1-execution-role",
             assumed_by=iam.ServicePrincipal("bedrock-agentcore.amazonaws.com"),
             managed_policies=[
                 iam.ManagedPolicy.from_aws_managed_policy_name("BedrockAgentCoreFullAccess")
             ],
             inline_policies={
                 "Agent1ExecutionPolicy": iam.PolicyDocument(
-                    statements=[
-                        iam.PolicyStatement(
-                            sid="ECRImageAccess",
-                            effect=iam.Effect.ALLOW,
-                            actions=[
-                                "ecr:BatchGetImage",
-                                "ecr:GetDownloadUrlForLayer",
-                                "ecr:BatchCheckLayerAvailability"
-                            ],
-                            resources=[ecr_repository_agent1.repository_arn]
-                        ),
-                        iam.PolicyStatement(
-                            sid="ECRTokenAccess",
-                            effect=iam.Effect.ALLOW,
-                            actions=["ecr:GetAuthorizationToken"],
-                            resources=["*"]
-                        ),
-                        iam.PolicyStatement(
-                            sid="CloudWatchLogs",
-                            effect=iam.Effect.ALLOW,
-                            actions=[
-                                "logs:DescribeLogStreams",
-                                "logs:CreateLogGroup",
-                                "logs:DescribeLogGroups",
-                                "logs:CreateLogStream",
-                                "logs:PutLogEvents"
-                            ],
-                            resources=["*"]
-                        ),
-                        iam.PolicyStatement(
-                            sid="XRayTracing",
-                            effect=iam.Effect.ALLOW,
-                            actions=[
-                                "xray:PutTraceSegments",
-                                "xray:PutTelemetryRecords",
-                                "xray:GetSamplingRules",
-                                "xray:GetSamplingTargets"
-                            ],
-                            resources=["*"]
-                        ),
-                        iam.PolicyStatement(
-                            sid="CloudWatchMetrics",
-                            effect=iam.Effect.ALLOW,
-                            actions=["cloudwatch:PutMetricData"],
-                            resources=["*"],
-                            conditions={
-                                "StringEquals": {
-                                    "cloudwatch:namespace": "bedrock-agentcore"
-                                }
-                            }
-                        ),
-                        iam.PolicyStatement(
-                            sid="GetAgentAccessToken",
-                            effect=iam.Effect.ALLOW,
-                            actions=[
-                                "bedrock-agentcore:GetWorkloadAccessToken",
-                                "bedrock-agentcore:GetWorkloadAccessTokenForJWT",
-                                "bedrock-agentcore:GetWorkloadAccessTokenForUserId"
-                            ],
-                            resources=[
-                                f"arn:aws:bedrock-agentcore:{self.region}:{self.account}:workload-identity-directory/default",
-                                f"arn:aws:bedrock-agentcore:{self.region}:{self.account}:workload-identity-directory/default/workload-identity/*"
-                            ]
-                        ),
-                        iam.PolicyStatement(
-                            sid="BedrockModelInvocation",
-                            effect=iam.Effect.ALLOW,
-                            actions=[
-                                "bedrock:InvokeModel",
-                                "bedrock:InvokeModelWithResponseStream"
-                            ],
-                            resources=["*"]
-                        ),
+                    statements=[self._ecr_image_access_statement(ecr_repository_agent1.repository_arn)] + shared_agent_statements + [
                         iam.PolicyStatement(
                             sid="InvokeAgent2Runtime",
                             effect=iam.Effect.ALLOW,
                             actions=["bedrock-agentcore:InvokeAgentRuntime"],
-                            resources=[f"arn:aws:bedrock-agentcore:{self.region}:{self.account}:runtime/*"]
+                            resources=[f"{ac_prefix}:runtime/*"]
                         )
                     ]
                 )
@@ -164,93 +161,20 @@ class MultiAgentStack(Stack):
         )
         # Agent2 Execution Role (basic permissions)
         agent2_execution_role = iam.Role(self, "Agent2ExecutionRole",
-            role_name=f"{self.stack_name}-agent2-execution-role",
+            role_name=f"{stack_name}-agent2-execution-role",
             assumed_by=iam.ServicePrincipal("bedrock-agentcore.amazonaws.com"),
             managed_policies=[
                 iam.ManagedPolicy.from_aws_managed_policy_name("BedrockAgentCoreFullAccess")
             ],
             inline_policies={
                 "Agent2ExecutionPolicy": iam.PolicyDocument(
-                    statements=[
-                        iam.PolicyStatement(
-                            sid="ECRImageAccess",
-                            effect=iam.Effect.ALLOW,
-                            actions=[
-                                "ecr:BatchGetImage",
-                                "ecr:GetDownloadUrlForLayer",
-                                "ecr:BatchCheckLayerAvailability"
-                            ],
-                            resources=[ecr_repository_agent2.repository_arn]
-                        ),
-                        iam.PolicyStatement(
-                            sid="ECRTokenAccess",
-                            effect=iam.Effect.ALLOW,
-                            actions=["ecr:GetAuthorizationToken"],
-                            resources=["*"]
-                        ),
-                        iam.PolicyStatement(
-                            sid="CloudWatchLogs",
-                            effect=iam.Effect.ALLOW,
-                            actions=[
-                                "logs:DescribeLogStreams",
-                                "logs:CreateLogGroup",
-                                "logs:DescribeLogGroups",
-                                "logs:CreateLogStream",
-                                "logs:PutLogEvents"
-                            ],
-                            resources=["*"]
-                        ),
-                        iam.PolicyStatement(
-                            sid="XRayTracing",
-                            effect=iam.Effect.ALLOW,
-                            actions=[
-                                "xray:PutTraceSegments",
-                                "xray:PutTelemetryRecords",
-                                "xray:GetSamplingRules",
-                                "xray:GetSamplingTargets"
-                            ],
-                            resources=["*"]
-                        ),
-                        iam.PolicyStatement(
-                            sid="CloudWatchMetrics",
-                            effect=iam.Effect.ALLOW,
-                            actions=["cloudwatch:PutMetricData"],
-                            resources=["*"],
-                            conditions={
-                                "StringEquals": {
-                                    "cloudwatch:namespace": "bedrock-agentcore"
-                                }
-                            }
-                        ),
-                        iam.PolicyStatement(
-                            sid="GetAgentAccessToken",
-                            effect=iam.Effect.ALLOW,
-                            actions=[
-                                "bedrock-agentcore:GetWorkloadAccessToken",
-                                "bedrock-agentcore:GetWorkloadAccessTokenForJWT",
-                                "bedrock-agentcore:GetWorkloadAccessTokenForUserId"
-                            ],
-                            resources=[
-                                f"arn:aws:bedrock-agentcore:{self.region}:{self.account}:workload-identity-directory/default",
-                                f"arn:aws:bedrock-agentcore:{self.region}:{self.account}:workload-identity-directory/default/workload-identity/*"
-                            ]
-                        ),
-                        iam.PolicyStatement(
-                            sid="BedrockModelInvocation",
-                            effect=iam.Effect.ALLOW,
-                            actions=[
-                                "bedrock:InvokeModel",
-                                "bedrock:InvokeModelWithResponseStream"
-                            ],
-                            resources=["*"]
-                        )
-                    ]
+                    statements=[self._ecr_image_access_statement(ecr_repository_agent2.repository_arn)] + shared_agent_statements
                 )
             }
         )
         # CodeBuild Service Role
         codebuild_role = iam.Role(self, "CodeBuildRole",
-            role_name=f"{self.stack_name}-codebuild-role",
+            role_name=f"{stack_name}-codebuild-role",
             assumed_by=iam.ServicePrincipal("codebuild.amazonaws.com"),
             inline_policies={
                 "CodeBuildPolicy": iam.PolicyDocument(
@@ -263,7 +187,13 @@ class MultiAgentStack(Stack):
                                 "logs:CreateLogStream",
                                 "logs:PutLogEvents"
                             ],
-                            resources=[f"arn:aws:logs:{self.region}:{self.account}:log-group:/aws/codebuild/*"]
+                            resources=[f"arn:aws:logs:{region}:{account}:log-group:/aws/codebuild/*"]
+                        ),
+                        iam.PolicyStatement(
+                            sid="ECRTokenAccess",
+                            effect=iam.Effect.ALLOW,
+                            actions=["ecr:GetAuthorizationToken"],
+                            resources=["*"]
                         ),
                         iam.PolicyStatement(
                             sid="ECRAccess",
@@ -272,7 +202,6 @@ class MultiAgentStack(Stack):
                                 "ecr:BatchCheckLayerAvailability",
                                 "ecr:GetDownloadUrlForLayer",
                                 "ecr:BatchGetImage",
-                                "ecr:GetAuthorizationToken",
                                 "ecr:PutImage",
                                 "ecr:InitiateLayerUpload",
                                 "ecr:UploadLayerPart",
@@ -281,8 +210,21 @@ class MultiAgentStack(Stack):
                             resources=[
                                 ecr_repository_agent1.repository_arn,
                                 ecr_repository_agent2.repository_arn,
-                                "*"
+                                ecr_repository_base.repository_arn,
+                                ecr_repository_build_cache.repository_arn
                             ]
+                        ),
+                        iam.PolicyStatement(
+                            sid="ECRPullThroughCache",
+                            effect=iam.Effect.ALLOW,
+                            actions=[
+                                "ecr:CreateRepository",
+                                "ecr:BatchImportUpstreamImage",
+                                "ecr:BatchCheckLayerAvailability",
+                                "ecr:GetDownloadUrlForLayer",
+                                "ecr:BatchGetImage"
+                            ],
+                            resources=[f"arn:aws:ecr:{region}:{account}:repository/{base_image_mirror_prefix}/*"]
                         )
                     ]
                 )
@@ -291,7 +233,7 @@ class MultiAgentStack(Stack):
 
         # Lambda Custom Resource Role
         custom_resource_role = iam.Role(self, "CustomResourceRole",
-            role_name=f"{self.stack_name}-custom-resource-role",
+            role_name=f"{stack_name}-custom-resource-role",
             assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
             managed_policies=[
                 iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSLambdaBasicExecutionRole")
@@ -304,6 +246,7 @@ class MultiAgentStack(Stack):
                             effect=iam.Effect.ALLOW,
                             actions=[
                                 "codebuild:StartBuild",
+                                "codebuild:StopBuild",
                                 "codebuild:BatchGetBuilds",
                                 "codebuild:BatchGetProjects"
                             ],
@@ -313,421 +256,410 @@ class MultiAgentStack(Stack):
                 )
             }
         )
-        # Lambda Function for CodeBuild Trigger
+        # Tracks in-flight builds so the custom resource can be answered from
+        # CodeBuild state change events instead of a polling Lambda
+        build_tracking_table = dynamodb.Table(self, "BuildTrackingTable",
+            partition_key=dynamodb.Attribute(name="Id", type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            time_to_live_attribute="ExpiresAt",
+            removal_policy=RemovalPolicy.DESTROY
+        )
+        build_tracking_table.grant_read_write_data(custom_resource_role)
+
+        # Lambda Function for CodeBuild Trigger (returns once the builds are started)
         build_trigger_lambda = lambda_.Function(self, "CodeBuildTriggerFunction",
-            function_name=f"{self.stack_name}-codebuild-trigger",
-            runtime=lambda_.Runtime.PYTHON_3_9,
+            function_name=f"{stack_name}-codebuild-trigger",
+            runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
+            memory_size=512,
+            ephemeral_storage_size=Size.mebibytes(512),
+            tracing=lambda_.Tracing.DISABLED,
             handler="build_trigger_lambda.handler",
             code=lambda_.Code.from_asset(os.path.join(os.path.dirname(__file__), "infra_utils")),
-            timeout=Duration.minutes(15),
+            timeout=Duration.minutes(1),
             role=custom_resource_role,
-            description="Triggers CodeBuild projects as CloudFormation custom resource"
+            environment={
+                "BUILD_TRACKING_TABLE": build_tracking_table.table_name
+            }
         )
-        # Agent2 Build Project (build first as it's independent)
-        agent2_build_project = codebuild.Project(self, "Agent2ImageBuildProject",
-            project_name=f"{self.stack_name}-agent2-build",
-            description=f"Build agent2 Docker image for {self.stack_name}",
-            role=codebuild_role,
-            environment=codebuild.BuildEnvironment(
-                build_image=codebuild.LinuxArmBuildImage.AMAZON_LINUX_2_STANDARD_3_0,
-                compute_type=codebuild.ComputeType.LARGE,
-                privileged=True
-            ),
-            environment_variables={
-                "AWS_DEFAULT_REGION": codebuild.BuildEnvironmentVariable(value=self.region),
-                "AWS_ACCOUNT_ID": codebuild.BuildEnvironmentVariable(value=self.account),
-                "IMAGE_REPO_NAME": codebuild.BuildEnvironmentVariable(value=ecr_repository_agent2.repository_name),
-                "IMAGE_TAG": codebuild.BuildEnvironmentVariable(value=image_tag.value_as_string),
-                "STACK_NAME": codebuild.BuildEnvironmentVariable(value=self.stack_name)
-            },
-            build_spec=codebuild.BuildSpec.from_object({
-                "version": "0.2",
-                "phases": {
-                    "pre_build": {
-                        "commands": [
-                            "echo Logging in to Amazon ECR...",
-                            "aws ecr get-login-password --region $AWS_DEFAULT_REGION | docker login --username AWS --password-stdin $AWS_ACCOUNT_ID.dkr.ecr.$AWS_DEFAULT_REGION.amazonaws.com"
-                        ]
-                    },
-                    "build": {
-                        "commands": [
-                            "echo Build started on `date`",
-                            "echo Building the Docker image for agent2 ARM64...",
-                            # Create requirements.txt
-                            """cat > requirements.txt << 'EOF'
-strands-agents
-boto3>=1.40.0
-botocore>=1.40.0
-bedrock-agentcore
-EOF""",
-                            # Create agent2.py
-                            """cat > agent2.py << 'EOF'
-from strands import Agent
-import os
-from bedrock_agentcore.runtime import BedrockAgentCoreApp
-
-app = BedrockAgentCoreApp()
-
-def create_specialist_agent() -> Agent:
-    \"\"\"Create a specialist agent that handles specific analytical tasks\"\"\"
-    system_prompt = \"\"\"You are a specialist analytical agent.
-    You are an expert at analyzing data and providing detailed insights.
-    When asked questions, provide thorough, well-reasoned responses with specific details.
-    Focus on accuracy and completeness in your answers.\"\"\"
-
-    return Agent(
-        system_prompt=system_prompt,
-        name="SpecialistAgent"
-    )
-
-@app.entrypoint
-async def invoke(payload=None):
-    \"\"\"Main entrypoint for agent2\"\"\"
-    try:
-        # Get the query from payload
-        query = payload.get("prompt", "Hello") if payload else "Hello"
-
-        # Create and use the specialist agent
-        agent = create_specialist_agent()
-        response = agent(query)
-
-        return {
-            "status": "success",
-            "agent": "agent2",
-            "response": response.message['content'][0]['text']
-        }
-
-    except Exception as e:
-        return {
-            "status": "error",
-            "agent": "agent2",
-            "error": str(e)
-        }
-
-if __name__ == "__main__":
-    app.run()
-EOF""",
-                            # Create Dockerfile
-                            """cat > Dockerfile << 'EOF'
-FROM public.ecr.aws/docker/library/python:3.11-slim
-WORKDIR /app
-
-COPY requirements.txt requirements.txt
-RUN pip install -r requirements.txt
-RUN pip install aws-opentelemetry-distro>=0.10.1
 
-# Create non-root user
-RUN useradd -m -u 1000 bedrock_agentcore
-USER bedrock_agentcore
-
-EXPOSE 8080
-EXPOSE 8000
+        # Lambda Function that answers CloudFormation when the builds finish
+        build_complete_lambda = lambda_.Function(self, "CodeBuildCompleteFunction",
+            function_name=f"{stack_name}-codebuild-complete",
+            runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
+            memory_size=512,
+            ephemeral_storage_size=Size.mebibytes(512),
+            tracing=lambda_.Tracing.DISABLED,
+            handler="build_complete_lambda.handler",
+            code=lambda_.Code.from_asset(os.path.join(os.path.dirname(__file__), "infra_utils")),
+            timeout=Duration.minutes(1),
+            role=custom_resource_role,
+            environment={
+                "BUILD_TRACKING_TABLE": build_tracking_table.table_name
+            }
+        )
 
-COPY . .
+        # S3 Assets for agent source code
+        base_source_asset = s3_assets.Asset(self, "BaseImageSourceAsset",
+            path=os.path.join(AGENT_CODE_DIR, "base")
+        )
+        base_source_asset.grant_read(codebuild_role)
 
-CMD ["opentelemetry-instrument", "python", "-m", "agent2"]
-EOF""",
-                            "echo Building ARM64 image...",
-                            "docker build -t $IMAGE_REPO_NAME:$IMAGE_TAG .",
-                            "docker tag $IMAGE_REPO_NAME:$IMAGE_TAG $AWS_ACCOUNT_ID.dkr.ecr.$AWS_DEFAULT_REGION.amazonaws.com/$IMAGE_REPO_NAME:$IMAGE_TAG"
-                        ]
-                    },
-                    "post_build": {
-                        "commands": [
-                            "echo Build completed on `date`",
-                            "echo Pushing the Docker image...",
-                            "docker push $AWS_ACCOUNT_ID.dkr.ecr.$AWS_DEFAULT_REGION.amazonaws.com/$IMAGE_REPO_NAME:$IMAGE_TAG",
-                            "echo ARM64 Docker image pushed successfully"
-                        ]
-                    }
-                }
-            })
+        # agent1 is built from the whole agent-code directory so its image can bundle agent2
+        agent1_source_asset = s3_assets.Asset(self, "Agent1SourceAsset",
+            path=AGENT_CODE_DIR
         )
-        # Agent1 Build Project (orchestrator that calls agent2)
-        agent1_build_project = codebuild.Project(self, "Agent1ImageBuildProject",
-            project_name=f"{self.stack_name}-agent1-build",
-            description=f"Build agent1 Docker image for {self.stack_name}",
-            role=codebuild_role,
-            environment=codebuild.BuildEnvironment(
-                build_image=codebuild.LinuxArmBuildImage.AMAZON_LINUX_2_STANDARD_3_0,
-                compute_type=codebuild.ComputeType.LARGE,
-                privileged=True
-            ),
-            environment_variables={
-                "AWS_DEFAULT_REGION": codebuild.BuildEnvironmentVariable(value=self.region),
-                "AWS_ACCOUNT_ID": codebuild.BuildEnvironmentVariable(value=self.account),
-                "IMAGE_REPO_NAME": codebuild.BuildEnvironmentVariable(value=ecr_repository_agent1.repository_name),
-                "IMAGE_TAG": codebuild.BuildEnvironmentVariable(value=image_tag.value_as_string),
-                "STACK_NAME": codebuild.BuildEnvironmentVariable(value=self.stack_name)
-            },
-            build_spec=codebuild.BuildSpec.from_object({
-                "version": "0.2",
-                "phases": {
-                    "pre_build": {
-                        "commands": [
-                            "echo Logging in to Amazon ECR...",
-                            "aws ecr get-login-password --region $AWS_DEFAULT_REGION | docker login --username AWS --password-stdin $AWS_ACCOUNT_ID.dkr.ecr.$AWS_DEFAULT_REGION.amazonaws.com"
-                        ]
-                    },
-                    "build": {
-                        "commands": [
-                            "echo Build started on `date`",
-                            "echo Building the Docker image for agent1 ARM64...",
-                            # Create requirements.txt
-                            """cat > requirements.txt << 'EOF'
-strands-agents
-boto3>=1.40.0
-botocore>=1.40.0
-bedrock-agentcore
-EOF""",
-                            # Create agent1.py - this is a large block, so I'll split it
-                            """cat > agent1.py << 'EOF'
-from strands import Agent, tool
-from typing import Dict, Any
-import boto3
-import json
-import os
-from bedrock_agentcore.runtime import BedrockAgentCoreApp
-
-app = BedrockAgentCoreApp()
-
-# Environment variable for Agent2 ARN (will be set by CloudFormation)
-AGENT2_ARN = os.getenv('AGENT2_ARN', '')
-
-def invoke_agent2(query: str) -> str:
-    \"\"\"Helper function to invoke agent2 using boto3\"\"\"
-    import uuid
-    try:
-        # Get region from environment or use default
-        region = os.getenv('AWS_REGION', 'us-west-2')
-        agentcore_client = boto3.client('bedrock-agentcore', region_name=region)
-
-        # Invoke agent2 runtime (using AWS sample format)
-        response = agentcore_client.invoke_agent_runtime(
-            agentRuntimeArn=AGENT2_ARN,
-            qualifier="DEFAULT",
-            payload=json.dumps({"prompt": query})
-        )
-
-        # Handle streaming response (text/event-stream)
-        if "text/event-stream" in response.get("contentType", ""):
-            result = ""
-            for line in response["response"].iter_lines(chunk_size=10):
-                if line:
-                    line = line.decode("utf-8")
-                    # Remove 'data: ' prefix if present
-                    if line.startswith("data: "):
-                        line = line[6:]
-                    result += line
-            return result
-
-        # Handle JSON response
-        elif response.get("contentType") == "application/json":
-            content = []
-            for chunk in response.get("response", []):
-                content.append(chunk.decode('utf-8'))
-            response_data = json.loads(''.join(content))
-            return json.dumps(response_data)
-
-        # Handle other response types
-        else:
-            response_body = response['response'].read()
-            return response_body.decode('utf-8')
-
-    except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        return f"Error invoking agent2: {str(e)}\\nDetails: {error_details}"
-
-@tool
-def call_specialist_agent(query: str) -> Dict[str, Any]:
-    \"\"\"
-    Call the specialist agent (agent2) for detailed analysis or complex tasks.
-    Use this tool when you need expert analysis or detailed information.
-
-    Args:
-        query: The question or task to send to the specialist agent
-
-    Returns:
-        The specialist agent's response
-    \"\"\"
-    result = invoke_agent2(query)
-    return {
-        "status": "success",
-        "content": [{"text": result}]
-    }
-
-def create_orchestrator_agent() -> Agent:
-    \"\"\"Create the orchestrator agent with the tool to call agent2\"\"\"
-    system_prompt = \"\"\"You are an orchestrator agent.
-    You can handle simple queries directly, but for complex analytical tasks,
-    you should delegate to the specialist agent using the call_specialist_agent tool.
-
-    Use the specialist agent when:
-    - The query requires detailed analysis
-    - The query is about complex topics
-    - The user explicitly asks for expert analysis
-
-    Handle simple queries (greetings, basic questions) yourself.\"\"\"
-
-    return Agent(
-        tools=[call_specialist_agent],
-        system_prompt=system_prompt,
-        name="OrchestratorAgent"
-    )
-
-@app.entrypoint
-async def invoke(payload=None):
-    \"\"\"Main entrypoint for agent1\"\"\"
-    try:
-        # Get the query from payload
-        query = payload.get("prompt", "Hello, how are you?") if payload else "Hello, how are you?"
-
-        # Create and use the orchestrator agent
-        agent = create_orchestrator_agent()
-        response = agent(query)
-
-        return {
-            "status": "success",
-            "agent": "agent1",
-            "response": response.message['content'][0]['text']
-        }
+        agent1_source_asset.grant_read(codebuild_role)
 
-    except Exception as e:
-        return {
-            "status": "error",
-            "agent": "agent1",
-            "error": str(e)
+        agent2_source_asset = s3_assets.Asset(self, "Agent2SourceAsset",
+            path=os.path.join(AGENT_CODE_DIR, "agent2")
+        )
+        agent2_source_asset.grant_read(codebuild_role)
+
+        # Environment shared by every image build project
+        build_environment_variables = {
+            "AWS_DEFAULT_REGION": codebuild.BuildEnvironmentVariable(value=region),
+            "AWS_ACCOUNT_ID": codebuild.BuildEnvironmentVariable(value=account),
+            "CACHE_REPO_NAME": codebuild.BuildEnvironmentVariable(value=ecr_repository_build_cache.repository_name),
+            "IMAGE_TAG": codebuild.BuildEnvironmentVariable(value=image_tag.value_as_string),
+            "STACK_NAME": codebuild.BuildEnvironmentVariable(value=stack_name),
+            "DOCKER_BUILDKIT": codebuild.BuildEnvironmentVariable(value="1"),
+            "BASE_REGISTRY_PREFIX": codebuild.BuildEnvironmentVariable(value=base_image_mirror_prefix)
         }
 
-if __name__ == "__main__":
-    app.run()
-EOF""",
-                            # Create Dockerfile
-                            """cat > Dockerfile << 'EOF'
-FROM public.ecr.aws/docker/library/python:3.11-slim
-WORKDIR /app
-
-COPY requirements.txt requirements.txt
-RUN pip install -r requirements.txt
-RUN pip install aws-opentelemetry-distro>=0.10.1
-
-# Create non-root user
-RUN useradd -m -u 1000 bedrock_agentcore
-USER bedrock_agentcore
-
-EXPOSE 8080
-EXPOSE 8000
-
-COPY . .
+        # Base Image Build Project (python and the dependencies shared by both agents)
+        base_build_project = self._image_build_project("BaseImageBuildProject",
+            stack_name=stack_name,
+            image_name="base",
+            role=codebuild_role,
+            source_asset=base_source_asset,
+            repository=ecr_repository_base,
+            environment_variables=build_environment_variables,
+            build_args="--build-arg BASE_REGISTRY=$ECR_REGISTRY/$BASE_REGISTRY_PREFIX"
+        )
 
-CMD ["opentelemetry-instrument", "python", "-m", "agent1"]
-EOF""",
-                            "echo Building ARM64 image...",
-                            "docker build -t $IMAGE_REPO_NAME:$IMAGE_TAG .",
-                            "docker tag $IMAGE_REPO_NAME:$IMAGE_TAG $AWS_ACCOUNT_ID.dkr.ecr.$AWS_DEFAULT_REGION.amazonaws.com/$IMAGE_REPO_NAME:$IMAGE_TAG"
-                        ]
-                    },
-                    "post_build": {
-                        "commands": [
-                            "echo Build completed on `date`",
-                            "echo Pushing the Docker image...",
-                            "docker push $AWS_ACCOUNT_ID.dkr.ecr.$AWS_DEFAULT_REGION.amazonaws.com/$IMAGE_REPO_NAME:$IMAGE_TAG",
-                            "echo ARM64 Docker image pushed successfully"
-                        ]
-                    }
+        # Route terminal build states of all projects to the completion Lambda. Project
+        # names are spelled out because the agent projects depend on the base image build,
+        # which itself waits for this rule
+        build_state_rule = events.Rule(self, "BuildStateChangeRule",
+            event_pattern=events.EventPattern(
+                source=["aws.codebuild"],
+                detail_type=["CodeBuild Build State Change"],
+                detail={
+                    "project-name": [
+                        f"{stack_name}-base-build",
+                        f"{stack_name}-agent1-build",
+                        f"{stack_name}-agent2-build"
+                    ],
+                    "build-status": ["SUCCEEDED", "FAILED", "FAULT", "STOPPED", "TIMED_OUT"]
                 }
-            })
+            ),
+            targets=[targets.LambdaFunction(build_complete_lambda)]
         )
-        # Custom Resources to trigger builds
-        trigger_agent2_build = CustomResource(self, "TriggerAgent2ImageBuild",
+
+        # Custom Resource to build the base image before the agent images
+        trigger_base_image_build = CustomResource(self, "TriggerBaseImageBuild",
             service_token=build_trigger_lambda.function_arn,
             properties={
-                "ProjectName": agent2_build_project.project_name,
-                "WaitForCompletion": "true"
+                "ProjectNames": [base_build_project.project_name],
+                # Rebuild whenever the source changes
+                "SourceHash": base_source_asset.asset_hash,
+                "ImageDigestAttributes": {
+                    "BaseImageDigest": base_build_project.project_name
+                }
             }
         )
-        trigger_agent2_build.node.add_dependency(ecr_repository_agent2)
-        trigger_agent2_build.node.add_dependency(agent2_build_project)
+        trigger_base_image_build.node.add_dependency(ecr_repository_base)
+        trigger_base_image_build.node.add_dependency(ecr_repository_build_cache)
+        trigger_base_image_build.node.add_dependency(build_state_rule)
+        trigger_base_image_build.node.add_dependency(base_image_cache_rule)
+
+        # Both agents build FROM the base image pinned to the digest just pushed
+        agent_build_args = f"--build-arg BASE_IMAGE={ecr_repository_base.repository_uri}@{trigger_base_image_build.get_att_string('BaseImageDigest')}"
+
+        # Agent2 Build Project
+        agent2_build_project = self._image_build_project("Agent2ImageBuildProject",
+            stack_name=stack_name,
+            image_name="agent2",
+            role=codebuild_role,
+            source_asset=agent2_source_asset,
+            repository=ecr_repository_agent2,
+            environment_variables=build_environment_variables,
+            build_args=agent_build_args
+        )
+        # Agent1 Build Project (orchestrator that calls agent2)
+        agent1_build_project = self._image_build_project("Agent1ImageBuildProject",
+            stack_name=stack_name,
+            image_name="agent1",
+            role=codebuild_role,
+            source_asset=agent1_source_asset,
+            repository=ecr_repository_agent1,
+            environment_variables=build_environment_variables,
+            build_args=agent_build_args + " -f agent1/Dockerfile"
+        )
 
-        trigger_agent1_build = CustomResource(self, "TriggerAgent1ImageBuild",
+        # Custom Resource to trigger both agent builds; they share no build-time
+        # dependency so they run concurrently in a single invocation
+        trigger_image_builds = CustomResource(self, "TriggerAllImageBuilds",
             service_token=build_trigger_lambda.function_arn,
             properties={
-                "ProjectName": agent1_build_project.project_name,
-                "WaitForCompletion": "true"
+                "ProjectNames": [
+                    agent1_build_project.project_name,
+                    agent2_build_project.project_name
+                ],
+                # Rebuild whenever either agent's source changes (agent1's asset covers
+                # the whole agent-code directory, base image sources included)
+                "SourceHash": f"{agent1_source_asset.asset_hash},{agent2_source_asset.asset_hash}",
+                # Returned as attributes holding each project's pushed image digest
+                "ImageDigestAttributes": {
+                    "Agent1ImageDigest": agent1_build_project.project_name,
+                    "Agent2ImageDigest": agent2_build_project.project_name
+                }
             }
         )
-        trigger_agent1_build.node.add_dependency(ecr_repository_agent1)
-        trigger_agent1_build.node.add_dependency(agent1_build_project)
+        trigger_image_builds.node.add_dependency(ecr_repository_agent1)
+        trigger_image_builds.node.add_dependency(ecr_repository_agent2)
+        trigger_image_builds.node.add_dependency(ecr_repository_build_cache)
+        trigger_image_builds.node.add_dependency(agent1_build_project)
+        trigger_image_builds.node.add_dependency(agent2_build_project)
+        trigger_image_builds.node.add_dependency(build_state_rule)
 
         # Agent2 Runtime (deploy first as agent1 depends on it)
         agent2_runtime = bedrockagentcore.CfnRuntime(self, "Agent2Runtime",
-            agent_runtime_name=f"{self.stack_name.replace('-', '_')}_{agent2_name.value_as_string}",
+            agent_runtime_name=f"{stack_name.replace('-', '_')}_{agent2_name.value_as_string}",
             agent_runtime_artifact=bedrockagentcore.CfnRuntime.AgentRuntimeArtifactProperty(
                 container_configuration=bedrockagentcore.CfnRuntime.ContainerConfigurationProperty(
-                    container_uri=f"{ecr_repository_agent2.repository_uri}:{image_tag.value_as_string}"
+                    container_uri=f"{ecr_repository_agent2.repository_uri}@{trigger_image_builds.get_att_string('Agent2ImageDigest')}"
                 )
             ),
             role_arn=agent2_execution_role.role_arn,
             network_configuration=bedrockagentcore.CfnRuntime.NetworkConfigurationProperty(
                 network_mode=network_mode.value_as_string
             ),
-            description=f"Specialist agent runtime for {self.stack_name}"
+            description=f"Specialist agent runtime for {stack_name}",
+            environment_variables={
+                "BEDROCK_LATENCY": bedrock_latency.value_as_string
+            }
         )
-        agent2_runtime.node.add_dependency(trigger_agent2_build)
+        agent2_runtime.node.add_dependency(trigger_image_builds)
 
         # Agent1 Runtime (orchestrator with agent2 ARN as environment variable)
         agent1_runtime = bedrockagentcore.CfnRuntime(self, "Agent1Runtime",
-            agent_runtime_name=f"{self.stack_name.replace('-', '_')}_{agent1_name.value_as_string}",
+            agent_runtime_name=f"{stack_name.replace('-', '_')}_{agent1_name.value_as_string}",
             agent_runtime_artifact=bedrockagentcore.CfnRuntime.AgentRuntimeArtifactProperty(
                 container_configuration=bedrockagentcore.CfnRuntime.ContainerConfigurationProperty(
-                    container_uri=f"{ecr_repository_agent1.repository_uri}:{image_tag.value_as_string}"
+                    container_uri=f"{ecr_repository_agent1.repository_uri}@{trigger_image_builds.get_att_string('Agent1ImageDigest')}"
                 )
             ),
             role_arn=agent1_execution_role.role_arn,
             network_configuration=bedrockagentcore.CfnRuntime.NetworkConfigurationProperty(
                 network_mode=network_mode.value_as_string
             ),
-            description=f"Orchestrator agent runtime for {self.stack_name}",
+            description=f"Orchestrator agent runtime for {stack_name}",
             environment_variables={
-                "AGENT2_ARN": agent2_runtime.attr_agent_runtime_arn
+                "AGENT2_ARN": agent2_runtime.attr_agent_runtime_arn,
+                "BEDROCK_LATENCY": bedrock_latency.value_as_string
             }
         )
-        agent1_runtime.node.add_dependency(trigger_agent1_build)
+        agent1_runtime.node.add_dependency(trigger_image_builds)
         agent1_runtime.node.add_dependency(agent2_runtime)
-        # Outputs
-        CfnOutput(self, "Agent1RuntimeId",
-            description="ID of agent1 (orchestrator) runtime",
-            value=agent1_runtime.attr_agent_runtime_id,
-            export_name=f"{self.stack_name}-Agent1RuntimeId"
-        )
 
-        CfnOutput(self, "Agent1RuntimeArn",
-            description="ARN of agent1 (orchestrator) runtime",
-            value=agent1_runtime.attr_agent_runtime_arn,
-            export_name=f"{self.stack_name}-Agent1RuntimeArn"
+        # Warm-up Lambda Role (separate from the custom resource role, which the
+        # runtimes already depend on through the image build trigger)
+        warmup_role = iam.Role(self, "RuntimeWarmupRole",
+            role_name=f"{stack_name}-runtime-warmup-role",
+            assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
+            managed_policies=[
+                iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSLambdaBasicExecutionRole")
+            ],
+            inline_policies={
+                "RuntimeWarmupPolicy": iam.PolicyDocument(
+                    statements=[
+                        iam.PolicyStatement(
+                            sid="InvokeAgentRuntimes",
+                            effect=iam.Effect.ALLOW,
+                            actions=["bedrock-agentcore:InvokeAgentRuntime"],
+                            resources=[
+                                agent1_runtime.attr_agent_runtime_arn,
+                                f"{agent1_runtime.attr_agent_runtime_arn}/*",
+                                agent2_runtime.attr_agent_runtime_arn,
+                                f"{agent2_runtime.attr_agent_runtime_arn}/*"
+                            ]
+                        )
+                    ]
+                )
+            }
         )
 
-        CfnOutput(self, "Agent2RuntimeId",
-            description="ID of agent2 (specialist) runtime",
-            value=agent2_runtime.attr_agent_runtime_id,
-            export_name=f"{self.stack_name}-Agent2RuntimeId"
+        # Lambda Function that invokes both runtimes once after deployment
+        warmup_lambda = lambda_.Function(self, "RuntimeWarmupFunction",
+            function_name=f"{stack_name}-runtime-warmup",
+            runtime=lambda_.Runtime.PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
+            handler="runtime_warmup_lambda.handler",
+            code=lambda_.Code.from_asset(os.path.join(os.path.dirname(__file__), "infra_utils")),
+            timeout=Duration.minutes(5),
+            role=warmup_role
         )
 
-        CfnOutput(self, "Agent2RuntimeArn",
-            description="ARN of agent2 (specialist) runtime",
-            value=agent2_runtime.attr_agent_runtime_arn,
-            export_name=f"{self.stack_name}-Agent2RuntimeArn"
+        # Custom Resource to pay the cold start during deploy instead of on the first request
+        warmup_runtimes = CustomResource(self, "WarmupAgentRuntimes",
+            service_token=warmup_lambda.function_arn,
+            properties={
+                "Arns": [
+                    agent1_runtime.attr_agent_runtime_arn,
+                    agent2_runtime.attr_agent_runtime_arn
+                ]
+            }
+        )
+        warmup_runtimes.node.add_dependency(agent1_runtime)
+        warmup_runtimes.node.add_dependency(agent2_runtime)
+
+        # Outputs (a single JSON map keeps the template small)
+        stack_info = {
+            "Agent1RuntimeId": agent1_runtime.attr_agent_runtime_id,
+            "Agent1RuntimeArn": agent1_runtime.attr_agent_runtime_arn,
+            "Agent2RuntimeId": agent2_runtime.attr_agent_runtime_id,
+            "Agent2RuntimeArn": agent2_runtime.attr_agent_runtime_arn,
+            "Agent1ECRRepositoryUri": ecr_repository_agent1.repository_uri,
+            "Agent2ECRRepositoryUri": ecr_repository_agent2.repository_uri
+        }
+        CfnOutput(self, "StackInfo",
+            description="JSON map of agent runtime IDs, ARNs and ECR repository URIs",
+            value=self.to_json_string(stack_info)
         )
 
-        CfnOutput(self, "Agent1ECRRepositoryUri",
-            description="URI of the ECR repository for agent1",
-            value=ecr_repository_agent1.repository_uri,
-            export_name=f"{self.stack_name}-Agent1ECRRepositoryUri"
+    def _image_build_project(self, construct_id: str, *, stack_name: str, image_name: str,
+                             role: iam.IRole, source_asset: s3_assets.Asset,
+                             repository: ecr.Repository, environment_variables: dict,
+                             build_args: str) -> codebuild.Project:
+        """ARM64 CodeBuild project that builds one image with buildx and exports its digest"""
+        return codebuild.Project(self, construct_id,
+            project_name=f"{stack_name}-{image_name}-build",
+            description=f"Build {image_name} Docker image for {stack_name}",
+            role=role,
+            environment=codebuild.BuildEnvironment(
+                build_image=codebuild.LinuxArmBuildImage.AMAZON_LINUX_2_STANDARD_3_0,
+                compute_type=codebuild.ComputeType.MEDIUM,
+                privileged=True
+            ),
+            environment_variables={
+                **environment_variables,
+                "IMAGE_REPO_NAME": codebuild.BuildEnvironmentVariable(value=repository.repository_name)
+            },
+            source=codebuild.Source.s3(
+                bucket=source_asset.bucket,
+                path=source_asset.s3_object_key
+            ),
+            build_spec=codebuild.BuildSpec.from_object({
+                "version": "0.2",
+                "env": {
+                    "exported-variables": ["IMAGE_DIGEST"]
+                },
+                "phases": {
+                    "pre_build": {
+                        "commands": ECR_LOGIN_COMMANDS
+                    },
+                    "build": {
+                        "commands": [
+                            "echo Build started on `date`",
+                            f"echo Building the Docker image for {image_name} ARM64...",
+                            # Layer cache lives in the build cache repository under the image name;
+                            # zstd level 0 keeps cache export cheap on MEDIUM compute. Tags are
+                            # immutable, so every build pushes a new one and exports the pushed digest
+                            f"docker buildx build --platform linux/arm64 --cache-from type=registry,ref=$CACHE_URI:{image_name} --cache-to type=registry,ref=$CACHE_URI:{image_name},mode=max,image-manifest=true,oci-mediatypes=true,compression=zstd,compression-level=0 {build_args} -t $ECR_URI:$IMAGE_TAG-$CODEBUILD_BUILD_NUMBER --metadata-file build-metadata.json --push ."
+                        ]
+                    },
+                    "post_build": {
+                        "commands": [
+                            "echo Build completed on `date`",
+                            "export IMAGE_DIGEST=$(jq -r '.\"containerimage.digest\"' build-metadata.json)",
+                            "echo ARM64 Docker image pushed successfully: $IMAGE_DIGEST"
+                        ]
+                    }
+                }
+            })
         )
 
-        CfnOutput(self, "Agent2ECRRepositoryUri",
-            description="URI of the ECR repository for agent2",
-            value=ecr_repository_agent2.repository_uri,
-            export_name=f"{self.stack_name}-Agent2ECRRepositoryUri"
+    @staticmethod
+    def _ecr_image_access_statement(repository_arn: str) -> iam.PolicyStatement:
+        """Image pull permissions for a single agent's ECR repository"""
+        return iam.PolicyStatement(
+            sid="ECRImageAccess",
+            effect=iam.Effect.ALLOW,
+            actions=[
+                "ecr:BatchGetImage",
+                "ecr:GetDownloadUrlForLayer",
+                "ecr:BatchCheckLayerAvailability"
+            ],
+            resources=[repository_arn]
         )
+
+    @staticmethod
+    def _shared_agent_statements(ac_prefix: str) -> list:
+        """Policy statements common to every agent execution role"""
+        return [
+            iam.PolicyStatement(
+                sid="ECRTokenAccess",
+                effect=iam.Effect.ALLOW,
+                actions=["ecr:GetAuthorizationToken"],
+                resources=["*"]
+            ),
+            iam.PolicyStatement(
+                sid="CloudWatchLogs",
+                effect=iam.Effect.ALLOW,
+                actions=[
+                    "logs:DescribeLogStreams",
+                    "logs:CreateLogGroup",
+                    "logs:DescribeLogGroups",
+                    "logs:CreateLogStream",
+                    "logs:PutLogEvents"
+                ],
+                resources=["*"]
+            ),
+            iam.PolicyStatement(
+                sid="XRayTracing",
+                effect=iam.Effect.ALLOW,
+                actions=[
+                    "xray:PutTraceSegments",
+                    "xray:PutTelemetryRecords",
+                    "xray:GetSamplingRules",
+                    "xray:GetSamplingTargets"
+                ],
+                resources=["*"]
+            ),
+            iam.PolicyStatement(
+                sid="CloudWatchMetrics",
+                effect=iam.Effect.ALLOW,
+                actions=["cloudwatch:PutMetricData"],
+                resources=["*"],
+                conditions={
+                    "StringEquals": {
+                        "cloudwatch:namespace": "bedrock-agentcore"
+                    }
+                }
+            ),
+            iam.PolicyStatement(
+                sid="GetAgentAccessToken",
+                effect=iam.Effect.ALLOW,
+                actions=[
+                    "bedrock-agentcore:GetWorkloadAccessToken",
+                    "bedrock-agentcore:GetWorkloadAccessTokenForJWT",
+                    "bedrock-agentcore:GetWorkloadAccessTokenForUserId"
+                ],
+                resources=[
+                    f"{ac_prefix}:workload-identity-directory/default",
+                    f"{ac_prefix}:workload-identity-directory/default/workload-identity/*"
+                ]
+            ),
+            iam.PolicyStatement(
+                sid="BedrockModelInvocation",
+                effect=iam.Effect.ALLOW,
+                actions=[
+                    "bedrock:InvokeModel",
+                    "bedrock:InvokeModelWithResponseStream"
+                ],
+                resources=["*"]
+            )
+        ]
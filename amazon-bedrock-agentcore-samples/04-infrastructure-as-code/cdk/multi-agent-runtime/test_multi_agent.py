@@ -1,120 +1,94 @@
 #!/usr/bin/env python3
 
 import boto3
+import jmespath
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-def test_multi_agent():
-    """Test the multi-agent system"""
-    
-    # Get runtime ARNs from CloudFormation outputs
-    cf_client = boto3.client('cloudformation', region_name='us-east-1')
-    
-    try:
-        response = cf_client.describe_stacks(StackName='MultiAgentDemo')
-        outputs = response['Stacks'][0]['Outputs']
-        
-        agent1_arn = None
-        agent2_arn = None
-        
-        for output in outputs:
-            if output['OutputKey'] == 'Agent1RuntimeArn':
-                agent1_arn = output['OutputValue']
-            elif output['OutputKey'] == 'Agent2RuntimeArn':
-                agent2_arn = output['OutputValue']
-        
-        print(f"Agent1 (Orchestrator) ARN: {agent1_arn}")
-        print(f"Agent2 (Specialist) ARN: {agent2_arn}")
-        
-    except Exception as e:
-        print(f"Error getting stack outputs: {e}")
-        return
-    
-    # Create bedrock-agentcore client
-    agentcore_client = boto3.client('bedrock-agentcore', region_name='us-east-1')
+REGION = 'us-east-1'
+
+# Selects the StackInfo output value from a describe_stacks response
+STACK_INFO_QUERY = jmespath.compile("Stacks[0].Outputs[?OutputKey=='StackInfo'].OutputValue | [0]")
+
+session = boto3.Session(region_name=REGION)
+
+@lru_cache(maxsize=None)
+def resolve_arns(stack_name, region=REGION):
+    """Return (agent1_arn, agent2_arn) for a stack from its CloudFormation outputs"""
+    # Without a StackName, describe_stacks lists every stack in the account
+    assert stack_name, "stack_name is required"
     
-    # Test 1: Simple query (should be handled by Agent1 directly)
-    print("\n" + "="*60)
-    print("TEST 1: Simple greeting (Agent1 handles directly)")
-    print("="*60)
+    # Only memoized in memory, so a redeployed stack is always read fresh on the next run
+    cf_client = session.client('cloudformation', region_name=region)
+    response = cf_client.describe_stacks(StackName=stack_name)
+    stack_info = json.loads(STACK_INFO_QUERY.search(response) or '{}')
+    return (stack_info.get('Agent1RuntimeArn'), stack_info.get('Agent2RuntimeArn'))
+
+def run_test(agentcore_client, title, runtime_arn, prompt, label):
+    """Invoke one runtime and return the printable report for it"""
+    lines = ["\n" + "="*60, title, "="*60]
     
     try:
         response = agentcore_client.invoke_agent_runtime(
-            agentRuntimeArn=agent1_arn,
+            agentRuntimeArn=runtime_arn,
             qualifier="DEFAULT",
-            payload=json.dumps({"prompt": "Hello, how are you?"})
+            payload=json.dumps({"prompt": prompt})
         )
         
-        print("Response received:")
-        print(f"Content Type: {response.get('contentType', 'N/A')}")
+        lines.append("Response received:")
+        lines.append(f"Content Type: {response.get('contentType', 'N/A')}")
         
         # Handle the response
         if response.get('contentType') == 'application/json':
-            response_body = response['response'].read()
-            result = json.loads(response_body.decode('utf-8'))
-            print(f"Result: {json.dumps(result, indent=2)}")
+            # json.load reads straight from the StreamingBody, skipping the separate decode copy
+            result = json.load(response['response'])
+            lines.append(f"Result: {json.dumps(result, indent=2)}")
         else:
-            print("Response body:")
-            for chunk in response['response']:
-                print(chunk.decode('utf-8'))
+            # Join the raw chunks and decode once, so multi-byte characters split
+            # across chunk boundaries are not garbled
+            lines.append("Response body:")
+            lines.append(b"".join(response['response'].iter_chunks(64 * 1024)).decode('utf-8'))
                 
     except Exception as e:
-        print(f"Error testing Agent1 simple query: {e}")
+        lines.append(f"Error testing {label}: {e}")
     
-    # Test 2: Complex query (should trigger Agent2 delegation)
-    print("\n" + "="*60)
-    print("TEST 2: Complex analysis (Agent1 delegates to Agent2)")
-    print("="*60)
+    return "\n".join(lines)
+
+def test_multi_agent(stack_name='MultiAgentDemo'):
+    """Test the multi-agent system"""
     
+    # Get runtime ARNs from CloudFormation outputs
     try:
-        response = agentcore_client.invoke_agent_runtime(
-            agentRuntimeArn=agent1_arn,
-            qualifier="DEFAULT",
-            payload=json.dumps({"prompt": "Provide a detailed analysis of the benefits and drawbacks of serverless architecture"})
-        )
+        agent1_arn, agent2_arn = resolve_arns(stack_name)
         
-        print("Response received:")
-        print(f"Content Type: {response.get('contentType', 'N/A')}")
+        print(f"Agent1 (Orchestrator) ARN: {agent1_arn}")
+        print(f"Agent2 (Specialist) ARN: {agent2_arn}")
         
-        # Handle the response
-        if response.get('contentType') == 'application/json':
-            response_body = response['response'].read()
-            result = json.loads(response_body.decode('utf-8'))
-            print(f"Result: {json.dumps(result, indent=2)}")
-        else:
-            print("Response body:")
-            for chunk in response['response']:
-                print(chunk.decode('utf-8'))
-                
     except Exception as e:
-        print(f"Error testing Agent1 complex query: {e}")
+        print(f"Error getting stack outputs: {e}")
+        return
     
-    # Test 3: Direct Agent2 test
-    print("\n" + "="*60)
-    print("TEST 3: Direct Agent2 test (Specialist)")
-    print("="*60)
+    # One bedrock-agentcore client shared by all three tests (clients are thread-safe)
+    agentcore_client = session.client('bedrock-agentcore')
     
-    try:
-        response = agentcore_client.invoke_agent_runtime(
-            agentRuntimeArn=agent2_arn,
-            qualifier="DEFAULT",
-            payload=json.dumps({"prompt": "Explain quantum computing in detail"})
-        )
-        
-        print("Response received:")
-        print(f"Content Type: {response.get('contentType', 'N/A')}")
-        
-        # Handle the response
-        if response.get('contentType') == 'application/json':
-            response_body = response['response'].read()
-            result = json.loads(response_body.decode('utf-8'))
-            print(f"Result: {json.dumps(result, indent=2)}")
-        else:
-            print("Response body:")
-            for chunk in response['response']:
-                print(chunk.decode('utf-8'))
-                
-    except Exception as e:
-        print(f"Error testing Agent2 directly: {e}")
+    tests = [
+        # Test 1: Simple query (should be handled by Agent1 directly)
+        ("TEST 1: Simple greeting (Agent1 handles directly)", agent1_arn,
+         "Hello, how are you?", "Agent1 simple query"),
+        # Test 2: Complex query (should trigger Agent2 delegation)
+        ("TEST 2: Complex analysis (Agent1 delegates to Agent2)", agent1_arn,
+         "Provide a detailed analysis of the benefits and drawbacks of serverless architecture", "Agent1 complex query"),
+        # Test 3: Direct Agent2 test
+        ("TEST 3: Direct Agent2 test (Specialist)", agent2_arn,
+         "Explain quantum computing in detail", "Agent2 directly")
+    ]
+    
+    # The tests are independent, so run them concurrently and print each report in order
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [executor.submit(run_test, agentcore_client, *test) for test in tests]
+        for future in futures:
+            print(future.result())
 
 if __name__ == "__main__":
     test_multi_agent()
@@ -5,6 +5,7 @@
 # external imports start creating loggers with their own default levels, formats, etc.
 import logging
 from os import environ
+import orjson
 import structlog
 
 # Basic terminal logging:
@@ -14,6 +15,24 @@ logging.basicConfig(
     datefmt="%Y-%m-%dT%H:%M:%S",
 )
 
+_render_stack_info = structlog.processors.StackInfoRenderer()
+
+
+def _render_stack_and_exc_info(logger, method_name, event_dict):
+    """Run the stack/exception renderers only for events that carry that info"""
+    if "stack_info" in event_dict or "exc_info" in event_dict:
+        event_dict = _render_stack_info(logger, method_name, event_dict)
+        event_dict = structlog.processors.format_exc_info(
+            logger, method_name, event_dict
+        )
+    return event_dict
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """orjson-backed serializer for JSONRenderer (stdlib loggers expect str)"""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode()
+
+
 # Structured logging:
 structlog.configure(
     processors=[
@@ -22,10 +41,9 @@ structlog.configure(
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
+        _render_stack_and_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer(),
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps),
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -3,12 +3,17 @@
 import uvicorn
 
 from cx_agent_backend.infrastructure.config.settings import settings
-from cx_agent_backend.server import create_app
 
+# The app is passed as an import string with factory=True so uvicorn can start it
+# in each worker process (and reload it in debug mode)
 uvicorn.run(
-    create_app(),
+    "cx_agent_backend.server:create_app",
+    factory=True,
     host=settings.host,
     port=settings.port,
     reload=settings.debug,
     log_level=settings.log_level.lower(),
+    loop="uvloop",
+    http="httptools",
+    workers=1 if settings.debug else settings.workers,
 )
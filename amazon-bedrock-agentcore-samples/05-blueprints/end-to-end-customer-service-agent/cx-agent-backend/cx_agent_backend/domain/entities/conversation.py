@@ -1,11 +1,23 @@
 """Domain entities for conversation management."""
 
+import os
+import random
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 from uuid import UUID, uuid4
 
+# Message IDs are opaque keys, not secrets, so they come from a seeded PRNG instead
+# of os.urandom on every call. Reseeded after fork so worker processes never collide.
+_rng = random.Random(os.urandom(32))
+os.register_at_fork(after_in_child=lambda: _rng.seed(os.urandom(32)))
+
+
+def _fast_uuid4() -> UUID:
+    """Generate a random version 4 UUID without a syscall."""
+    return UUID(int=_rng.getrandbits(128), version=4)
+
 
 class MessageRole(str, Enum):
     """Message role enumeration."""
@@ -23,7 +35,7 @@ class ConversationStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Message:
     """Immutable message entity."""
 
@@ -39,10 +51,10 @@ class Message:
     ) -> "Message":
         """Create a user message."""
         return cls(
-            id=uuid4(),
+            id=_fast_uuid4(),
             content=content,
             role=MessageRole.USER,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
             metadata=metadata or {},
         )
 
@@ -52,15 +64,15 @@ class Message:
     ) -> "Message":
         """Create an assistant message."""
         return cls(
-            id=uuid4(),
+            id=_fast_uuid4(),
             content=content,
             role=MessageRole.ASSISTANT,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
             metadata=metadata or {},
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     """Mutable conversation aggregate."""
 
@@ -80,7 +92,7 @@ class Conversation:
         conversation_id: UUID | None = None,
     ) -> "Conversation":
         """Create a new conversation."""
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         return cls(
             id=conversation_id or uuid4(),
             user_id=user_id,
@@ -94,14 +106,15 @@ class Conversation:
     def add_message(self, message: Message) -> None:
         """Add a message to the conversation."""
         self.messages.append(message)
-        self.updated_at = datetime.utcnow()
+        # The message was just stamped; reuse its time instead of reading the clock
+        self.updated_at = message.timestamp
 
     def complete(self) -> None:
         """Mark conversation as completed."""
         self.status = ConversationStatus.COMPLETED
-        self.updated_at = datetime.utcnow()
+        self.updated_at = datetime.now(timezone.utc)
 
     def fail(self) -> None:
         """Mark conversation as failed."""
         self.status = ConversationStatus.FAILED
-        self.updated_at = datetime.utcnow()
+        self.updated_at = datetime.now(timezone.utc)
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 
@@ -6,3 +7,7 @@ class SecretReader(ABC):
     def read_secret(self, name: str) -> str:
         """Get secret value by name."""
         pass
+
+    async def read_secret_async(self, name: str) -> str:
+        """Get secret value by name without blocking the event loop."""
+        return await asyncio.to_thread(self.read_secret, name)
@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
-from cx_agent_backend.domain.entities.conversation import Conversation
+from cx_agent_backend.domain.entities.conversation import Conversation, Message
 
 
 class ConversationRepository(ABC):
@@ -14,6 +14,11 @@ class ConversationRepository(ABC):
         """Save a conversation."""
         pass
 
+    @abstractmethod
+    async def append_message(self, conversation_id: UUID, message: Message) -> None:
+        """Persist a single new message of an already saved conversation."""
+        pass
+
     @abstractmethod
     async def get_by_id(self, conversation_id: UUID) -> Conversation | None:
         """Get conversation by ID."""
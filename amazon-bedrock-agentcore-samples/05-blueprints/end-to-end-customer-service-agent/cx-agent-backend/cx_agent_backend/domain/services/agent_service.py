@@ -15,11 +15,11 @@ class AgentType(str, Enum):
     GENERAL = "general"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentRequest:
     """Request for agent processing."""
 
-    messages: list[Message]
+    messages: tuple[Message, ...]
     agent_type: AgentType
     user_id: str
     model: str
@@ -29,9 +29,10 @@ class AgentRequest:
     jwt_token: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentResponse:
-    ("""Response from agent processing.""",)
+    """Response from agent processing."""
+
     content: str
     agent_type: AgentType
     tools_used: list[str]
@@ -44,7 +45,11 @@ class AgentService(ABC):
 
     @abstractmethod
     async def process_request(self, request: AgentRequest) -> AgentResponse:
-        """Process request through agent."""
+        """Process request through agent.
+
+        Implementations apply the output guardrails to the reply and return the
+        refusal, with ``blocked_categories`` in the metadata, when it is blocked.
+        """
         pass
 
     @abstractmethod
@@ -1,8 +1,11 @@
 """Domain service for conversation business logic."""
 
+import asyncio
 import logging
 from uuid import UUID
 
+import orjson
+
 from cx_agent_backend.domain.entities.conversation import Conversation, Message
 from cx_agent_backend.domain.repositories.conversation_repository import (
     ConversationRepository,
@@ -14,12 +17,42 @@ from cx_agent_backend.domain.services.agent_service import (
 )
 from cx_agent_backend.domain.services.guardrail_service import (
     GuardrailAssessment,
+    GuardrailResult,
     GuardrailService,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _csv(items: list[str]) -> str:
+    """Comma-join items, skipping str.join for the common empty and single cases."""
+    if not items:
+        return ""
+    if len(items) == 1:
+        return items[0]
+    return ",".join(items)
+
+
+_ALLOWED = GuardrailResult(
+    assessment=GuardrailAssessment.ALLOWED,
+    blocked_categories=[],
+    message="",
+)
+
+
+async def _allowed_result() -> GuardrailResult:
+    """Stand-in for the input check when no guardrail service is configured."""
+    return _ALLOWED
+
+
+def _blocked_reply(guardrail_result: GuardrailResult) -> Message:
+    """Assistant message returned in place of blocked content."""
+    return Message.create_assistant_message(
+        content=guardrail_result.message,
+        metadata={"blocked_categories": _csv(guardrail_result.blocked_categories)},
+    )
+
+
 class ConversationService:
     """Service for conversation business logic."""
 
@@ -49,37 +82,37 @@ class ConversationService:
         jwt_token: str = None,
     ) -> tuple[Message, list[str]]:
         """Send a message and get AI response."""
-        # Get or create conversation
-        conversation = await self._conversation_repo.get_by_id(conversation_id)
-        if not conversation:
-            conversation = Conversation.create(user_id, conversation_id=conversation_id)
-            await self._conversation_repo.save(conversation)
-
-        # Add user message
         user_message = Message.create_user_message(content)
 
-        # Check input guardrails
-        if self._guardrail_service:
-            guardrail_result = await self._guardrail_service.check_input(user_message)
-            if guardrail_result.assessment == GuardrailAssessment.BLOCKED:
-                blocked_message = Message.create_assistant_message(
-                    content=guardrail_result.message,
-                    metadata={
-                        "blocked_categories": ",".join(
-                            guardrail_result.blocked_categories
-                        )
-                    },
-                )
-                conversation.add_message(user_message)
-                conversation.add_message(blocked_message)
-                await self._conversation_repo.save(conversation)
-                return blocked_message, []
+        # Fetch the conversation and check input guardrails concurrently
+        conversation, guardrail_result = await asyncio.gather(
+            self._conversation_repo.get_by_id(conversation_id),
+            self._guardrail_service.check_input(user_message)
+            if self._guardrail_service
+            else _allowed_result(),
+        )
+
+        # Create the conversation if it does not exist yet; it is saved together with
+        # the first turn's messages rather than in a separate write
+        is_new = conversation is None
+        if is_new:
+            conversation = Conversation.create(user_id, conversation_id=conversation_id)
+
+        if guardrail_result.assessment is GuardrailAssessment.BLOCKED:
+            blocked_message = _blocked_reply(guardrail_result)
+            conversation.add_message(user_message)
+            conversation.add_message(blocked_message)
+            await self._persist_turn(
+                conversation, is_new, user_message, blocked_message
+            )
+            return blocked_message, []
 
         conversation.add_message(user_message)
 
-        # Generate AI response through agent
+        # Generate AI response through agent; the request holds an immutable snapshot
+        # so later additions to the conversation do not change it
         agent_request = AgentRequest(
-            messages=conversation.messages,
+            messages=tuple(conversation.messages),
             agent_type=AgentType.CUSTOMER_SERVICE,
             user_id=user_id,
             model=model,
@@ -93,24 +126,26 @@ class ConversationService:
         # Create AI message with citations
         ai_metadata = {
             "agent_type": agent_response.agent_type.value,
-            "tools_used": ",".join(agent_response.tools_used),
+            "tools_used": _csv(agent_response.tools_used),
         }
 
         # Add citations if available
-        if "citations" in agent_response.metadata:
-            import json
-
+        response_metadata = agent_response.metadata
+        if "citations" in response_metadata:
+            # Stored as a JSON string for downstream consumers
             ai_metadata["citations"] = (
-                json.dumps(agent_response.metadata["citations"])
-                if isinstance(agent_response.metadata["citations"], list)
-                else agent_response.metadata["citations"]
+                orjson.dumps(cits).decode()
+                if isinstance(cits := response_metadata["citations"], list)
+                else cits
             )
-        if "knowledge_base_id" in agent_response.metadata:
-            ai_metadata["knowledge_base_id"] = agent_response.metadata[
-                "knowledge_base_id"
-            ]
+        if "knowledge_base_id" in response_metadata:
+            ai_metadata["knowledge_base_id"] = response_metadata["knowledge_base_id"]
         if agent_response.trace_id:
             ai_metadata["trace_id"] = agent_response.trace_id
+        # The agent service checks its own reply against the output guardrails and
+        # returns the refusal in place of blocked content
+        if "blocked_categories" in response_metadata:
+            ai_metadata["blocked_categories"] = response_metadata["blocked_categories"]
 
         logger.info("AI metadata: %s", ai_metadata)
 
@@ -119,26 +154,22 @@ class ConversationService:
             metadata=ai_metadata,
         )
 
-        # Check output guardrails
-        if self._guardrail_service:
-            guardrail_result = await self._guardrail_service.check_output(ai_message)
-            if guardrail_result.assessment == GuardrailAssessment.BLOCKED:
-                ai_message = Message.create_assistant_message(
-                    content=guardrail_result.message,
-                    metadata={
-                        "blocked_categories": ",".join(
-                            guardrail_result.blocked_categories
-                        )
-                    },
-                )
-
         conversation.add_message(ai_message)
 
-        # Save conversation
-        await self._conversation_repo.save(conversation)
+        await self._persist_turn(conversation, is_new, user_message, ai_message)
 
         return ai_message, agent_response.tools_used
 
+    async def _persist_turn(
+        self, conversation: Conversation, is_new: bool, *messages: Message
+    ) -> None:
+        """Persist a turn: one save for a new conversation, else append its messages."""
+        if is_new:
+            await self._conversation_repo.save(conversation)
+            return
+        for message in messages:
+            await self._conversation_repo.append_message(conversation.id, message)
+
     async def get_conversation(self, conversation_id: UUID) -> Conversation | None:
         """Get conversation by ID."""
         return await self._conversation_repo.get_by_id(conversation_id)
@@ -1,5 +1,7 @@
 """Bedrock Guardrails implementation."""
 
+import asyncio
+
 import boto3
 import structlog
 
@@ -12,14 +14,29 @@ from cx_agent_backend.domain.services.guardrail_service import (
 
 logger = structlog.get_logger()
 
+# Shared result for the disabled (no guardrail ID) case
+_ALLOWED = GuardrailResult(
+    assessment=GuardrailAssessment.ALLOWED,
+    blocked_categories=[],
+    message="",
+)
+
 
 class BedrockGuardrailService(GuardrailService):
     """Bedrock Guardrails implementation."""
 
     def __init__(self, guardrail_id: str, region: str | None = None):
         self._guardrail_id = guardrail_id
+        if not guardrail_id:
+            # Decided once here rather than on every check
+            self.check_input = self.check_output = self._allow
+            return
         self._client = boto3.client("bedrock-runtime", region_name=region)
 
+    async def _allow(self, message: Message) -> GuardrailResult:
+        """Allow everything when no guardrail is configured."""
+        return _ALLOWED
+
     async def check_input(self, message: Message) -> GuardrailResult:
         """Check user input against Bedrock Guardrails."""
         return await self._check_content(message.content, "INPUT")
@@ -30,22 +47,20 @@ class BedrockGuardrailService(GuardrailService):
 
     async def _check_content(self, content: str, source: str) -> GuardrailResult:
         """Check content against Bedrock Guardrails."""
-        if not self._guardrail_id:
-            return GuardrailResult(
-                assessment=GuardrailAssessment.ALLOWED,
-                blocked_categories=[],
-                message="",
-            )
-
         try:
-            response = self._client.apply_guardrail(
+            # boto3 is blocking; run it off the event loop so other requests proceed
+            response = await asyncio.to_thread(
+                self._client.apply_guardrail,
                 guardrailIdentifier=self._guardrail_id,
                 guardrailVersion="DRAFT",
                 source=source,
                 content=[{"text": {"text": content}}],
             )
 
-            logger.info("Guardrail response", response=response)
+            # Only the verdict at INFO; the full response is rendered only when DEBUG
+            # is enabled (filter_by_level drops the event before serialization)
+            logger.info("Guardrail response", source=source, action=response["action"])
+            logger.debug("Guardrail response details", response=response)
 
             if response["action"] == "GUARDRAIL_INTERVENED":
                 blocked_categories = []
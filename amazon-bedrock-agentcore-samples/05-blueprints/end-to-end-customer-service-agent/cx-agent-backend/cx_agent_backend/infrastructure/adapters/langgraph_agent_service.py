@@ -1,12 +1,29 @@
 """LangGraph implementation of agent service."""
 
-import json
+import asyncio
+import hashlib
 import logging
 import os
-
-from langchain_core.messages import AIMessage, HumanMessage
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+from uuid import uuid4
+
+import orjson
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    ToolMessage,
+)
+from langchain_core.messages.utils import trim_messages
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
+from langgraph.checkpoint.memory import MemorySaver
 from langgraph.prebuilt import create_react_agent
 from langchain_aws import ChatBedrock
 from bedrock_agentcore.memory import MemoryClient
@@ -20,6 +37,7 @@ from cx_agent_backend.domain.services.agent_service import (
 )
 from cx_agent_backend.domain.services.guardrail_service import (
     GuardrailAssessment,
+    GuardrailResult,
     GuardrailService,
 )
 from cx_agent_backend.domain.services.llm_service import LLMService
@@ -28,11 +46,14 @@ from cx_agent_backend.infrastructure.aws.parameter_store_reader import (
     AWSParameterStoreReader,
 )
 from cx_agent_backend.infrastructure.aws.secret_reader import AWSSecretsReader
+from cx_agent_backend.infrastructure.config.settings import settings
 
 try:
-    from mcp import ClientSession
-    from mcp.client.streamable_http import streamablehttp_client
-    import requests
+    import httpx
+
+    from cx_agent_backend.infrastructure.adapters.mcp_session_pool import (
+        MCPSessionPool,
+    )
 
     GATEWAY_AVAILABLE = True
 except ImportError:
@@ -43,6 +64,383 @@ logger = logging.getLogger(__name__)
 
 parameter_store_reader = AWSParameterStoreReader()
 secret_reader = AWSSecretsReader()
+mcp_session_pool = MCPSessionPool() if GATEWAY_AVAILABLE else None
+# Conversation state per thread_id, shared by every cached agent; see _keep_thread
+checkpointer = MemorySaver()
+_http = (
+    httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.mcp_client_max_connections,
+            max_keepalive_connections=settings.mcp_client_max_keepalive_connections,
+            keepalive_expiry=30,
+        ),
+        timeout=httpx.Timeout(20.0),
+    )
+    if GATEWAY_AVAILABLE
+    else None
+)
+
+# Compiled agents are reused across requests; bound the cache because the
+# model name comes from the client request.
+AGENT_CACHE_SIZE = 32
+
+# Only the most recent messages of a conversation are sent to the model, and a
+# runaway tool loop is stopped after this many graph steps.
+MAX_HISTORY_MESSAGES = 20
+AGENT_RECURSION_LIMIT = 10
+
+# Conversations whose agent state is kept between turns, least recently used
+# first; older ones are re-seeded from the stored conversation when they return.
+CHECKPOINT_THREAD_LIMIT = 1000
+_checkpoint_threads: OrderedDict[str, None] = OrderedDict()
+
+# Output guardrail verdicts are reused for identical replies for a few minutes.
+OUTPUT_VERDICT_CACHE_SIZE = 1024
+OUTPUT_VERDICT_TTL = 300
+
+_SYSTEM_MESSAGE = (
+    "You are a professional customer service agent for AnyCompany. Your goal is to provide accurate, helpful responses while following company protocols.\n\n"
+    "TOOL USAGE STRATEGY:\n"
+    "1. For COMPANY-RELATED queries (products, services, policies, procedures, support): Use retrieve_context to search our knowledge base\n"
+    "2. For GENERIC queries (general information, current events, how-to guides): Use tavily_search via gateway\n"
+    "3. If retrieve_context returns no results or insufficient information, fallback to tavily_search\n"
+    "   When several independent web lookups are needed, run them together with batch_tavily_search\n"
+    "4. For ticket requests: Use create_support_ticket with complete details\n"
+    "5. For ticket status: Use get_support_tickets\n\n"
+    "DO NOT use both retrieve_context and tavily_search for the same query - choose the most appropriate tool based on the query type.\n\n"
+    "RESPONSE GUIDELINES:\n"
+    "- Be concise but thorough in explanations\n"
+    "- Always cite sources when using knowledge base or web information\n"
+    "- For ticket creation, gather: subject, description, priority, and contact info\n"
+    "- If knowledge base has no relevant information, clearly state this and use web search\n"
+    "- Maintain a professional, empathetic tone throughout interactions"
+)
+
+# Upper bound on searches a single batch_tavily_search call runs at once.
+BATCH_MAX_CONCURRENT = 4
+
+# Refresh the gateway access token this many seconds before it expires.
+TOKEN_EXPIRY_MARGIN = 60
+
+
+@dataclass(slots=True)
+class _TokenCache:
+    """Gateway access token shared by all tavily_search calls."""
+
+    token: str | None = None
+    expires_at: float = 0.0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+_token_cache = _TokenCache()
+
+
+_gateway_config_cache: tuple[str, str, str, str] | None = None
+
+
+async def _gateway_config() -> tuple[str, str, str, str]:
+    """Return gateway URL, client id, client secret and token URL.
+
+    The four reads run concurrently on first use; a complete configuration is
+    then kept for the lifetime of the process.
+    """
+    global _gateway_config_cache
+    if _gateway_config_cache is None:
+        config = tuple(
+            await asyncio.gather(
+                parameter_store_reader.get_parameter_async("/amazon/gateway_url", True),
+                parameter_store_reader.get_parameter_async("/cognito/client_id", True),
+                secret_reader.read_secret_async("cognito_client_secret"),
+                parameter_store_reader.get_parameter_async(
+                    "/cognito/oauth_token_url", True
+                ),
+            )
+        )
+        if not all(config):
+            return config
+        _gateway_config_cache = config
+    return _gateway_config_cache
+
+
+async def _gateway_access_token(
+    token_url: str, client_id: str, client_secret: str
+) -> tuple[str, float]:
+    """Return a cached client-credentials token and the time it should be replaced.
+
+    The time is on the ``time.monotonic()`` clock, TOKEN_EXPIRY_MARGIN before
+    the token actually expires; a new token is fetched once it has passed.
+    """
+    if _token_cache.token and time.monotonic() < _token_cache.expires_at:
+        return _token_cache.token, _token_cache.expires_at
+    async with _token_cache.lock:
+        if _token_cache.token and time.monotonic() < _token_cache.expires_at:
+            return _token_cache.token, _token_cache.expires_at
+
+        token_response = await _http.post(
+            token_url,
+            data={
+                "grant_type": "client_credentials",
+                "client_id": client_id,
+                "client_secret": client_secret,
+            },
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        if token_response.status_code != 200:
+            raise ValueError(f"Failed to get access token: {token_response.text}")
+
+        token_data = token_response.json()
+        access_token = token_data.get("access_token")
+        if not access_token:
+            raise ValueError("No access token received")
+
+        _token_cache.token = access_token
+        _token_cache.expires_at = (
+            time.monotonic()
+            + int(token_data.get("expires_in", 3600))
+            - TOKEN_EXPIRY_MARGIN
+        )
+        return access_token, _token_cache.expires_at
+
+
+# Name of the Tavily tool exposed by each gateway, discovered once per URL.
+_tool_name_cache: dict[str, str] = {}
+
+
+async def _tavily_tool_name(session, gateway_url: str) -> str | None:
+    """Return the gateway's Tavily tool name, listing tools only on a cache miss."""
+    tool_name = _tool_name_cache.get(gateway_url)
+    if tool_name is None:
+        tools_list = await session.list_tools()
+        logger.info(f"Available MCP tools: {[t.name for t in tools_list.tools]}")
+        tool_name = next(
+            (t.name for t in tools_list.tools if "tavily" in t.name.lower()), None
+        )
+        if tool_name:
+            logger.info(f"Using tool: {tool_name}")
+            _tool_name_cache[gateway_url] = tool_name
+    return tool_name
+
+
+@asynccontextmanager
+async def _gateway_session():
+    """Borrow an authenticated MCP session for the configured gateway.
+
+    Raises ValueError with a user-facing message when the gateway is not
+    configured or no access token can be obtained.
+    """
+    gateway_url, client_id, client_secret, token_url = await _gateway_config()
+    if not all([gateway_url, client_id, client_secret, token_url]):
+        raise ValueError("Gateway not configured properly")
+
+    access_token, token_expires_at = await _gateway_access_token(
+        token_url, client_id, client_secret
+    )
+    # Pooled sessions keep the token they were opened with; retire them with it
+    async with mcp_session_pool.session(
+        gateway_url,
+        {"Authorization": f"Bearer {access_token}"},
+        expires_at=token_expires_at,
+    ) as session:
+        yield session, gateway_url
+
+
+async def _call_tavily(session, gateway_url: str, query: str) -> str:
+    """Run one Tavily search on a gateway session and return its text."""
+    tool_name = await _tavily_tool_name(session, gateway_url)
+    if not tool_name:
+        return "Tavily search tool not found in gateway"
+
+    try:
+        result = await session.call_tool(tool_name, {"query": query})
+    except Exception:
+        # The gateway may have renamed or dropped the tool
+        _tool_name_cache.pop(gateway_url, None)
+        raise
+    if getattr(result, "isError", False):
+        _tool_name_cache.pop(gateway_url, None)
+    logger.debug("MCP tool result: %s", result)
+
+    # Handle different result types
+    if hasattr(result, 'content'):
+        if isinstance(result.content, list):
+            return '\n'.join(str(item.text) if hasattr(item, 'text') else str(item) for item in result.content)
+        else:
+            return str(result.content)
+    else:
+        return str(result)
+
+
+async def close_gateway_clients() -> None:
+    """Close the pooled MCP sessions and the shared gateway HTTP client on shutdown."""
+    if mcp_session_pool is not None:
+        await mcp_session_pool.close()
+    if _http is not None:
+        await _http.aclose()
+
+
+# Recently listed memory events per (memory, actor, session); a session's entry
+# is dropped whenever a new turn is written to it. The tool fills it from
+# executor threads while turns are persisted on the event loop, hence the lock.
+HISTORY_CACHE_SIZE = 256
+HISTORY_CACHE_TTL = 30
+_history_cache: dict[tuple[str, str, str], tuple[float, str]] = {}
+_history_cache_lock = threading.Lock()
+
+# Background memory writes; tasks remove themselves when they finish.
+_pending_memory_writes: set[asyncio.Task] = set()
+
+
+@lru_cache(maxsize=1)
+def _memory_client() -> MemoryClient:
+    """Shared AgentCore Memory client."""
+    return MemoryClient(region_name=os.getenv("AWS_REGION", "us-east-1"))
+
+
+@tool
+def get_conversation_history(config: RunnableConfig) -> str:
+    """Retrieve recent conversation history when needed for context"""
+    # Memory, actor and session are per request, so they come from the run
+    # config rather than being captured when the agent is built.
+    configurable = config.get("configurable", {})
+    memory_id = configurable.get("memory_id")
+    actor_id = configurable.get("user_id")
+    session_id = configurable.get("thread_id")
+    if not (memory_id and actor_id and session_id):
+        return "Conversation history is not available"
+
+    key = (memory_id, actor_id, session_id)
+    with _history_cache_lock:
+        cached = _history_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    try:
+        events = _memory_client().list_events(
+            memory_id=memory_id,
+            actor_id=actor_id,
+            session_id=session_id,
+            max_results=10,
+        )
+    except Exception as e:
+        return f"Could not retrieve history: {str(e)}"
+
+    history = f"Recent conversation history: {events}"
+    with _history_cache_lock:
+        _history_cache.pop(key, None)
+        _history_cache[key] = (time.monotonic() + HISTORY_CACHE_TTL, history)
+        if len(_history_cache) > HISTORY_CACHE_SIZE:
+            _history_cache.pop(next(iter(_history_cache)), None)
+    return history
+
+
+async def _persist_turn(
+    memory_id: str,
+    actor_id: str,
+    session_id: str,
+    user_message: str,
+    assistant_message: str,
+) -> None:
+    """Write one user/assistant exchange to AgentCore Memory."""
+    try:
+        await asyncio.to_thread(
+            _memory_client().create_event,
+            memory_id=memory_id,
+            actor_id=actor_id,
+            session_id=session_id,
+            messages=[
+                (user_message, "USER"),
+                (assistant_message, "ASSISTANT"),
+            ],
+        )
+        with _history_cache_lock:
+            _history_cache.pop((memory_id, actor_id, session_id), None)
+    except Exception as e:
+        logger.warning(f"Failed to save conversation to memory: {e}")
+
+
+async def wait_for_memory_writes() -> None:
+    """Wait for background memory writes to finish before shutdown."""
+    if _pending_memory_writes:
+        await asyncio.gather(*_pending_memory_writes)
+
+
+# Tools shared by every agent; gateway tools are added when the agent is built.
+_BASE_TOOLS = (*tools, get_conversation_history)
+
+
+def _history_window(messages: tuple[Message, ...]) -> tuple[Message, ...]:
+    """Return the most recent messages, starting at a user turn."""
+    window = messages[-MAX_HISTORY_MESSAGES:]
+    start = next(
+        (i for i, m in enumerate(window) if m.role is MessageRole.USER), len(window)
+    )
+    return window[start:]
+
+
+# The agent's system prompt is set when it is built, so only user and
+# assistant turns are forwarded.
+_LC_MESSAGE_TYPES = {
+    MessageRole.USER: HumanMessage,
+    MessageRole.ASSISTANT: AIMessage,
+}
+
+
+def _to_lc_messages(messages: tuple[Message, ...]) -> list:
+    """Convert domain messages to LangChain format."""
+    return [
+        _LC_MESSAGE_TYPES[m.role](content=m.content)
+        for m in messages
+        if m.role in _LC_MESSAGE_TYPES
+    ]
+
+
+async def _turn_input(
+    agent: Any, config: RunnableConfig, messages: tuple[Message, ...]
+) -> tuple[list, int]:
+    """Return the messages to send for this turn and the checkpointed count.
+
+    A thread the checkpointer already knows only needs the new user message;
+    an unknown one (new conversation or restarted process) is seeded with the
+    recent history.
+    """
+    state = await agent.aget_state(config)
+    prior_count = len(state.values.get("messages", ()))
+    if prior_count:
+        return _to_lc_messages(messages[-1:]), prior_count
+    return _to_lc_messages(_history_window(messages)), 0
+
+
+def _forget_thread(thread_id: str) -> None:
+    """Drop a thread's checkpoints; its next turn is seeded from the conversation."""
+    _checkpoint_threads.pop(thread_id, None)
+    checkpointer.delete_thread(thread_id)
+
+
+async def _keep_thread(agent: Any, config: RunnableConfig, messages: list) -> None:
+    """Store ``messages`` as the thread's only checkpoint.
+
+    MemorySaver keeps every checkpoint of every thread, so after each turn the
+    thread is replaced by a single checkpoint holding the recent window, and the
+    least recently used threads are dropped beyond CHECKPOINT_THREAD_LIMIT.
+    """
+    thread_id = config["configurable"]["thread_id"]
+    checkpointer.delete_thread(thread_id)
+    window = trim_messages(
+        messages,
+        strategy="last",
+        token_counter=len,
+        max_tokens=MAX_HISTORY_MESSAGES,
+        start_on="human",
+    )
+    await agent.aupdate_state(config, {"messages": window}, as_node="agent")
+    _checkpoint_threads[thread_id] = None
+    _checkpoint_threads.move_to_end(thread_id)
+    while len(_checkpoint_threads) > CHECKPOINT_THREAD_LIMIT:
+        checkpointer.delete_thread(_checkpoint_threads.popitem(last=False)[0])
+
+
+async def _no_check() -> None:
+    """Stand-in for a guardrail check that does not apply."""
+    return None
 
 
 class LangGraphAgentService(AgentService):
@@ -55,92 +453,55 @@ class LangGraphAgentService(AgentService):
     ):
         self._guardrail_service = guardrail_service
         self._llm_service = llm_service
+        self._agents: dict[tuple[AgentType, str], Any] = {}
+        self._output_verdicts: OrderedDict[bytes, tuple[float, GuardrailResult]] = (
+            OrderedDict()
+        )
 
-    async def _create_gateway_tool(self):
-        """Create a wrapper tool that manages its own MCP session."""
+    async def _create_gateway_tools(self):
+        """Create wrapper tools that borrow pooled MCP sessions."""
 
         @tool
         async def tavily_search(query: str) -> str:
             """Search the web using Tavily API via gateway"""
             try:
-                # Get gateway URL and credentials (decrypt encrypted parameters)
-                gateway_url = parameter_store_reader.get_parameter(
-                    "/amazon/gateway_url", decrypt=True
-                )
-                client_id = parameter_store_reader.get_parameter("/cognito/client_id", decrypt=True)
-                client_secret = secret_reader.read_secret("cognito_client_secret")
-                token_url = parameter_store_reader.get_parameter(
-                    "/cognito/oauth_token_url", decrypt=True
-                )
-
-                if not all([gateway_url, client_id, client_secret, token_url]):
-                    return "Gateway not configured properly"
-
-                # Get access token
-                token_response = requests.post(
-                    token_url,
-                    data={
-                        "grant_type": "client_credentials",
-                        "client_id": client_id,
-                        "client_secret": client_secret,
-                    },
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                    timeout=20
-                )
+                async with _gateway_session() as (session, gateway_url):
+                    return await _call_tavily(session, gateway_url, query)
+            except ValueError as e:
+                return str(e)
+            except httpx.HTTPError as e:
+                logger.warning("HTTP request error: %s", e)
+                return f"Network error during authentication: {str(e)}"
+            except Exception as e:
+                logger.warning("Gateway tool error: %s", e)
+                return f"Web search failed: {str(e)}"
 
-                if token_response.status_code != 200:
-                    return f"Failed to get access token: {token_response.text}"
-
-                access_token = token_response.json().get("access_token")
-                if not access_token:
-                    return "No access token received"
-
-                # Use MCP session for this single call
-                async with streamablehttp_client(
-                    gateway_url, headers={"Authorization": f"Bearer {access_token}"}
-                ) as (read, write, _):
-                    async with ClientSession(read, write) as session:
-                        await session.initialize()
-
-                        # List available tools first
-                        tools_list = await session.list_tools()
-                        logger.info(f"Available MCP tools: {[tool.name for tool in tools_list.tools]}")
-                        
-                        # Find the correct tool name
-                        tavily_tool = None
-                        for tool in tools_list.tools:
-                            if "tavily" in tool.name.lower():
-                                tavily_tool = tool
-                                break
-                        
-                        if not tavily_tool:
-                            return "Tavily search tool not found in gateway"
-                        
-                        logger.info(f"Using tool: {tavily_tool.name}")
-                        
-                        # Call the tool with proper name
-                        result = await session.call_tool(
-                            tavily_tool.name, {"query": query}
-                        )
-                        logger.info(f"MCP tool result: {result}")
-                        
-                        # Handle different result types
-                        if hasattr(result, 'content'):
-                            if isinstance(result.content, list):
-                                return '\n'.join(str(item.text) if hasattr(item, 'text') else str(item) for item in result.content)
-                            else:
-                                return str(result.content)
-                        else:
-                            return str(result)
-
-            except requests.exceptions.RequestException as e:
-                logger.error(f"HTTP request error: {e}")
+        @tool
+        async def batch_tavily_search(queries: list[str]) -> str:
+            """Run several independent web searches at once using Tavily API via gateway"""
+            try:
+                async with _gateway_session() as (session, gateway_url):
+                    limit = asyncio.Semaphore(BATCH_MAX_CONCURRENT)
+
+                    async def search(query: str) -> str:
+                        async with limit:
+                            return await _call_tavily(session, gateway_url, query)
+
+                    results = await asyncio.gather(*(search(q) for q in queries))
+            except ValueError as e:
+                return str(e)
+            except httpx.HTTPError as e:
+                logger.warning("HTTP request error: %s", e)
                 return f"Network error during authentication: {str(e)}"
             except Exception as e:
-                logger.error(f"Gateway tool error: {e}", exc_info=True)
+                logger.warning("Gateway tool error: %s", e)
                 return f"Web search failed: {str(e)}"
+            return "\n\n".join(
+                f"Results for {query!r}:\n{result}"
+                for query, result in zip(queries, results)
+            )
 
-        return tavily_search
+        return [tavily_search, batch_tavily_search]
 
     async def _get_gateway_tools(self, user_jwt_token: str = None):
         """Get gateway tools using wrapper approach."""
@@ -149,21 +510,23 @@ class LangGraphAgentService(AgentService):
             return []
 
         try:
-            gateway_tool = await self._create_gateway_tool()
-            return [gateway_tool]
+            return await self._create_gateway_tools()
         except Exception as e:
             logger.warning(f"Failed to create gateway tools: {e}")
             return []
 
-    async def _create_agent(
-        self,
-        agent_type: AgentType,
-        model: str,
-        memory_id: str = None,
-        actor_id: str = None,
-        session_id: str = None,
-        user_jwt_token: str = None,
-    ) -> any:
+    async def _get_or_create_agent(self, agent_type: AgentType, model: str) -> Any:
+        """Return the compiled agent for this agent type and model."""
+        key = (agent_type, model)
+        agent = self._agents.get(key)
+        if agent is None:
+            agent = await self._create_agent(agent_type, model)
+            if len(self._agents) >= AGENT_CACHE_SIZE:
+                self._agents.pop(next(iter(self._agents)))
+            self._agents[key] = agent
+        return agent
+
+    async def _create_agent(self, agent_type: AgentType, model: str) -> Any:
         """Create agent with specific model."""
         # Use ChatBedrock directly
         llm = ChatBedrock(
@@ -172,67 +535,35 @@ class LangGraphAgentService(AgentService):
             temperature=0.7,
         )
 
-        # Add memory tool if memory parameters provided
-        memory_tools = []
-        memory_client = None
-        if memory_id and actor_id and session_id:
-            memory_client = MemoryClient(
-                region_name=os.getenv("AWS_REGION", "us-east-1")
-            )
-
-            @tool
-            def get_conversation_history():
-                """Retrieve recent conversation history when needed for context"""
-                try:
-                    events = memory_client.list_events(
-                        memory_id=memory_id,
-                        actor_id=actor_id,
-                        session_id=session_id,
-                        max_results=10,
-                    )
-                    return f"Recent conversation history: {events}"
-                except Exception as e:
-                    return f"Could not retrieve history: {str(e)}"
-
-            memory_tools = [get_conversation_history]
-
-        system_message = (
-            "You are a professional customer service agent for AnyCompany. Your goal is to provide accurate, helpful responses while following company protocols.\n\n"
-            "TOOL USAGE STRATEGY:\n"
-            "1. For COMPANY-RELATED queries (products, services, policies, procedures, support): Use retrieve_context to search our knowledge base\n"
-            "2. For GENERIC queries (general information, current events, how-to guides): Use tavily_search via gateway\n"
-            "3. If retrieve_context returns no results or insufficient information, fallback to tavily_search\n"
-            "4. For ticket requests: Use create_support_ticket with complete details\n"
-            "5. For ticket status: Use get_support_tickets\n\n"
-            "DO NOT use both retrieve_context and tavily_search for the same query - choose the most appropriate tool based on the query type.\n\n"
-            "RESPONSE GUIDELINES:\n"
-            "- Be concise but thorough in explanations\n"
-            "- Always cite sources when using knowledge base or web information\n"
-            "- For ticket creation, gather: subject, description, priority, and contact info\n"
-            "- If knowledge base has no relevant information, clearly state this and use web search\n"
-            "- Maintain a professional, empathetic tone throughout interactions"
-        )
-
-        # Get gateway tools for this request using user's JWT token
-        gateway_tools = await self._get_gateway_tools(user_jwt_token)
+        gateway_tools = await self._get_gateway_tools()
 
         # Log gateway tools for debugging
-        logger.info("=== GATEWAY TOOLS DEBUG ===")
-        for gateway_tool in gateway_tools:
-            logger.info(f"Tool name: {gateway_tool.name}")
-            logger.info(f"Tool description: {gateway_tool.description}")
-            logger.info(f"Tool args_schema: {gateway_tool.args_schema}")
-            if hasattr(gateway_tool, "func"):
-                logger.info(f"Tool func: {gateway_tool.func}")
-        logger.info("=== END GATEWAY TOOLS DEBUG ===")
-
-        # Combine existing tools with memory tools and gateway tools
-        all_tools = tools + memory_tools + gateway_tools
-        # all_tools = gateway_tools
+        logger.debug("Gateway tools: %s", [t.name for t in gateway_tools])
 
         return create_react_agent(
-            llm, tools=all_tools, prompt=system_message
-        ), memory_client
+            llm,
+            tools=[*_BASE_TOOLS, *gateway_tools],
+            prompt=_SYSTEM_MESSAGE,
+            checkpointer=checkpointer,
+        )
+
+    async def _check_output(self, content: str) -> GuardrailResult:
+        """Check agent output, reusing a recent verdict for identical content."""
+        key = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        now = time.monotonic()
+        cached = self._output_verdicts.get(key)
+        if cached is not None and cached[0] > now:
+            self._output_verdicts.move_to_end(key)
+            return cached[1]
+
+        result = await self._guardrail_service.check_output(
+            Message.create_assistant_message(content)
+        )
+        self._output_verdicts[key] = (now + OUTPUT_VERDICT_TTL, result)
+        self._output_verdicts.move_to_end(key)
+        if len(self._output_verdicts) > OUTPUT_VERDICT_CACHE_SIZE:
+            self._output_verdicts.popitem(last=False)
+        return result
 
     async def process_request(self, request: AgentRequest) -> AgentResponse:
         """Process request through appropriate agent."""
@@ -243,74 +574,98 @@ class LangGraphAgentService(AgentService):
             request.agent_type,
         )
 
-        # Check input guardrails if enabled
-        if self._guardrail_service and request.messages:
-            last_user_message = None
-            for msg in reversed(request.messages):
-                if msg.role == MessageRole.USER:
-                    last_user_message = msg
-                    break
-
-            if last_user_message:
-                input_result = await self._guardrail_service.check_input(
-                    last_user_message
-                )
-                if input_result.assessment == GuardrailAssessment.BLOCKED:
-                    return AgentResponse(
-                        content=input_result.message,
-                        agent_type=request.agent_type,
-                        tools_used=[],
-                        metadata={
-                            "blocked_categories": ",".join(
-                                input_result.blocked_categories
-                            )
-                        },
-                        trace_id=None,
-                    )
+        last_user_message = None
+        if self._guardrail_service:
+            last_user_message = next(
+                (m for m in reversed(request.messages) if m.role is MessageRole.USER),
+                None,
+            )
+
+        # The input check overlaps with reading the memory id and loading the
+        # agent; the agent itself only runs once the input is known to be allowed
+        input_result, stm_memory_id, agent = await asyncio.gather(
+            self._guardrail_service.check_input(last_user_message)
+            if last_user_message
+            else _no_check(),
+            parameter_store_reader.get_parameter_async(
+                "/amazon/ac_stm_memory_id", True
+            ),
+            self._get_or_create_agent(request.agent_type, request.model),
+        )
+        if input_result and input_result.assessment is GuardrailAssessment.BLOCKED:
+            return AgentResponse(
+                content=input_result.message,
+                agent_type=request.agent_type,
+                tools_used=[],
+                metadata={
+                    "blocked_categories": ",".join(input_result.blocked_categories)
+                },
+                trace_id=None,
+            )
 
-        # Get memory parameters from environment or request
-        stm_memory_id = parameter_store_reader.get_parameter("/amazon/ac_stm_memory_id", decrypt=True)
         if not stm_memory_id:
             logger.error("STM Memory ID not configured in parameter store")
             raise ValueError("STM Memory ID not configured")
 
         actor_id = request.user_id
         session_id = request.session_id
-
-        # Extract user JWT token from request
-        user_jwt_token = request.jwt_token
-
-        agent, memory_client = await self._create_agent(
-            request.agent_type,
-            request.model,
-            stm_memory_id,
-            actor_id,
-            session_id,
-            user_jwt_token,
-        )
-
-        # Convert domain messages to LangChain format
-        lc_messages = []
-        for msg in request.messages:
-            if msg.role == MessageRole.USER:
-                lc_messages.append(HumanMessage(content=msg.content))
-            elif msg.role == MessageRole.ASSISTANT:
-                lc_messages.append(AIMessage(content=msg.content))
+        # Requests without a session get a throwaway thread
+        thread_id = session_id or str(uuid4())
 
         # Create config
         config = RunnableConfig(
             configurable={
-                "thread_id": f"{request.session_id}",
+                "thread_id": thread_id,
                 "user_id": request.user_id,
+                "memory_id": stm_memory_id,
             },
+            recursion_limit=AGENT_RECURSION_LIMIT,
         )
 
+        # Send only the new turn when the checkpointer already holds the thread
+        lc_messages, prior_count = await _turn_input(agent, config, request.messages)
+
         # Invoke agent with recursion limit
         logger.debug("Invoking agent with %s messages", len(lc_messages))
-        response = await agent.ainvoke({"messages": lc_messages}, config)
+        try:
+            response = await agent.ainvoke({"messages": lc_messages}, config)
+            # The checkpointed state holds earlier turns too; only look at this one
+            response_messages = response["messages"][prior_count:]
+            last_message = response_messages[-1]
+
+            # Check output guardrails if enabled; an empty reply has nothing to assess
+            output_result = None
+            if self._guardrail_service and last_message.content.strip():
+                output_result = await self._check_output(last_message.content)
+        except BaseException:
+            # A failed run can leave an unanswered tool call in the thread
+            _forget_thread(thread_id)
+            raise
+
+        blocked = (
+            output_result is not None
+            and output_result.assessment is GuardrailAssessment.BLOCKED
+        )
+        reply = output_result.message if blocked else last_message.content
+        if not session_id:
+            _forget_thread(thread_id)
+        elif blocked:
+            # Later turns must see the refusal the user got, not the blocked reply
+            # or the tool output behind it
+            await _keep_thread(
+                agent,
+                config,
+                [
+                    *response["messages"][: prior_count + len(lc_messages)],
+                    AIMessage(content=reply),
+                ],
+            )
+        else:
+            await _keep_thread(agent, config, response["messages"])
 
-        # Save conversation to memory if available
-        if memory_client and lc_messages:
+        # Save conversation to memory if available; a session-less request has no
+        # memory session to write to
+        if session_id and lc_messages:
             try:
                 last_user_msg = next(
                     (
@@ -320,62 +675,46 @@ class LangGraphAgentService(AgentService):
                     ),
                     None,
                 )
-                assistant_response = (
-                    response["messages"][-1].content if response["messages"] else ""
-                )
 
-                if last_user_msg and assistant_response:
-                    memory_client.create_event(
-                        memory_id=stm_memory_id,
-                        actor_id=actor_id,
-                        session_id=session_id,
-                        messages=[
-                            (last_user_msg, "USER"),
-                            (assistant_response, "ASSISTANT"),
-                        ],
+                if last_user_msg and reply:
+                    # Memory is written in the background, off the response path
+                    task = asyncio.create_task(
+                        _persist_turn(
+                            stm_memory_id,
+                            actor_id,
+                            session_id,
+                            last_user_msg,
+                            reply,
+                        )
                     )
+                    _pending_memory_writes.add(task)
+                    task.add_done_callback(_pending_memory_writes.discard)
             except Exception as e:
                 logger.warning(f"Failed to save conversation to memory: {e}")
-        # Extract response
-        last_message = response["messages"][-1]
-        tools_used = []
+        # Collect tool usage and citations in a single pass over the messages
+        tools_used: set[str] = set()
         citations = []
         knowledge_base_id = None
 
-        # Check all messages for tool usage and extract citations
-
-        message_types = []
-        for msg in response["messages"]:
-            message_types.append(type(msg).__name__)
-
-            if isinstance(msg, AIMessage) and hasattr(msg, "tool_calls"):
+        for msg in response_messages:
+            if isinstance(msg, AIMessage):
                 if msg.tool_calls:
                     for tool_call in msg.tool_calls:
-                        logger.info("=== TOOL CALL DEBUG ===")
-                        logger.info(f"Tool call name: {tool_call.get('name')}")
-                        logger.info(f"Tool call args: {tool_call.get('args')}")
-                        logger.info(f"Full tool call: {tool_call}")
-                        logger.info("=== END TOOL CALL DEBUG ===")
-                        tools_used.append(tool_call["name"])
+                        logger.debug("Tool call: %s", tool_call.get("name"))
+                        tools_used.add(tool_call["name"])
 
             # Extract citations from ToolMessage responses
-            from langchain_core.messages import ToolMessage
-
-            if isinstance(msg, ToolMessage):
-                logger.info("=== TOOL RESPONSE DEBUG ===")
-                logger.info(f"Tool message name: {getattr(msg, 'name', 'Unknown')}")
-                logger.info(f"Tool message content: {msg.content}")
-                logger.info(f"Tool message type: {type(msg.content)}")
-                logger.info("=== END TOOL RESPONSE DEBUG ===")
+            elif isinstance(msg, ToolMessage):
+                logger.debug("Tool response from %s", getattr(msg, "name", "Unknown"))
                 try:
-                    # Parse tool response content
-                    if isinstance(msg.content, str):
-                        tool_response = json.loads(msg.content)
+                    # Only JSON objects can carry citations; skip plain-text output
+                    if isinstance(msg.content, str) and msg.content.startswith("{"):
+                        tool_response = orjson.loads(msg.content)
                         if "citations" in tool_response:
                             citations.extend(tool_response["citations"])
                         if "knowledge_base_id" in tool_response:
                             knowledge_base_id = tool_response["knowledge_base_id"]
-                except (json.JSONDecodeError, TypeError, AttributeError) as exc:
+                except (orjson.JSONDecodeError, TypeError, AttributeError) as exc:
                     logger.debug(
                         "Failed to parse tool message content for citations; "
                         "content=%r; error=%s",
@@ -383,23 +722,16 @@ class LangGraphAgentService(AgentService):
                         exc,
                     )
 
-        # Remove duplicates
-        tools_used = list(set(tools_used))
-
-        # Check output guardrails if enabled
-        if self._guardrail_service:
-            output_message = Message.create_assistant_message(last_message.content)
-            output_result = await self._guardrail_service.check_output(output_message)
-            if output_result.assessment == GuardrailAssessment.BLOCKED:
-                return AgentResponse(
-                    content=output_result.message,
-                    agent_type=request.agent_type,
-                    tools_used=tools_used,
-                    metadata={
-                        "blocked_categories": ",".join(output_result.blocked_categories)
-                    },
-                    trace_id=None,
-                )
+        if blocked:
+            return AgentResponse(
+                content=reply,
+                agent_type=request.agent_type,
+                tools_used=list(tools_used),
+                metadata={
+                    "blocked_categories": ",".join(output_result.blocked_categories)
+                },
+                trace_id=None,
+            )
 
         # Add trace metadata
         metadata = {
@@ -415,34 +747,45 @@ class LangGraphAgentService(AgentService):
         return AgentResponse(
             content=last_message.content,
             agent_type=request.agent_type,
-            tools_used=tools_used,
+            tools_used=list(tools_used),
             metadata=metadata,
             trace_id=None,
         )
 
     async def stream_response(self, request: AgentRequest):
         """Stream response from agent."""
-        agent, _ = self._create_agent(request.agent_type, request.model)
-
-        # Convert domain messages to LangChain format
-        lc_messages = []
-        for msg in request.messages:
-            if msg.role == MessageRole.USER:
-                lc_messages.append(HumanMessage(content=msg.content))
-            elif msg.role == MessageRole.ASSISTANT:
-                lc_messages.append(AIMessage(content=msg.content))
+        agent = await self._get_or_create_agent(request.agent_type, request.model)
+        thread_id = request.session_id or str(uuid4())
 
         # Create config
         config = RunnableConfig(
             configurable={
-                "thread_id": f"{request.session_id}",
+                "thread_id": thread_id,
                 "user_id": request.user_id,
-            }
+            },
+            recursion_limit=AGENT_RECURSION_LIMIT,
         )
 
-        # Stream agent response
-        async for chunk in agent.astream({"messages": lc_messages}, config=config):
-            if "messages" in chunk:
-                for message in chunk["messages"]:
-                    if hasattr(message, "content") and message.content:
-                        yield message.content
+        lc_messages, _ = await _turn_input(agent, config, request.messages)
+
+        # Stream the model's tokens only, not every intermediate graph state
+        try:
+            async for message, metadata in agent.astream(
+                {"messages": lc_messages}, config=config, stream_mode="messages"
+            ):
+                if (
+                    isinstance(message, AIMessageChunk)
+                    and metadata.get("langgraph_node") == "agent"
+                    and isinstance(message.content, str)
+                    and message.content
+                ):
+                    yield message.content
+        except BaseException:
+            _forget_thread(thread_id)
+            raise
+
+        if request.session_id:
+            state = await agent.aget_state(config)
+            await _keep_thread(agent, config, state.values["messages"])
+        else:
+            _forget_thread(thread_id)
@@ -0,0 +1,153 @@
+"""Pool of initialized MCP client sessions shared across tool calls."""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _PooledSession:
+    """An open session and the event that tells its owner task to close it."""
+
+    session: ClientSession
+    expires_at: float
+    closed: asyncio.Event
+
+
+class MCPSessionPool:
+    """Keeps initialized MCP sessions open per gateway URL.
+
+    The streamable HTTP transport runs inside an anyio task group that must be
+    exited by the task that entered it, so every session is owned by a small
+    background task which opens it, waits until the pool discards it and then
+    closes it.
+    """
+
+    def __init__(
+        self,
+        max_sessions_per_url: int = 10,
+        session_ttl: float = 300,
+        close_timeout: float = 5,
+    ):
+        self._max_sessions_per_url = max_sessions_per_url
+        self._session_ttl = session_ttl
+        self._close_timeout = close_timeout
+        self._idle: dict[str, asyncio.Queue[_PooledSession]] = {}
+        self._limits: dict[str, asyncio.Semaphore] = {}
+        self._owners: set[asyncio.Task] = set()
+
+    async def close(self) -> None:
+        """Close every idle session and wait for the owner tasks to finish.
+
+        Owners of sessions still borrowed after ``close_timeout`` are cancelled.
+        """
+        for idle in self._idle.values():
+            while not idle.empty():
+                idle.get_nowait().closed.set()
+        owners = set(self._owners)
+        if not owners:
+            return
+        _, pending = await asyncio.wait(owners, timeout=self._close_timeout)
+        for owner in pending:
+            owner.cancel()
+        await asyncio.gather(*owners, return_exceptions=True)
+
+    @asynccontextmanager
+    async def session(
+        self, url: str, headers: dict[str, str], expires_at: float | None = None
+    ) -> AsyncIterator[ClientSession]:
+        """Borrow a session for ``url``; it is discarded if the block raises."""
+        pooled = await self.acquire(url, headers, expires_at)
+        try:
+            yield pooled.session
+        except BaseException:
+            self.discard(url, pooled)
+            raise
+        self.release(url, pooled)
+
+    async def acquire(
+        self, url: str, headers: dict[str, str], expires_at: float | None = None
+    ) -> _PooledSession:
+        """Return an idle session for ``url`` or open a new one.
+
+        ``headers`` are only used when a new session has to be opened. A session
+        keeps the headers it was opened with, so ``expires_at`` (a
+        ``time.monotonic()`` deadline, e.g. when its bearer token expires) caps
+        how long it is reused, on top of the pool's session TTL.
+        """
+        limit = self._limits.setdefault(
+            url, asyncio.Semaphore(self._max_sessions_per_url)
+        )
+        await limit.acquire()
+        try:
+            idle = self._idle.setdefault(url, asyncio.Queue())
+            while not idle.empty():
+                pooled = idle.get_nowait()
+                if time.monotonic() < pooled.expires_at:
+                    return pooled
+                pooled.closed.set()
+            return await self._open(url, headers, expires_at)
+        except BaseException:
+            limit.release()
+            raise
+
+    def release(self, url: str, pooled: _PooledSession) -> None:
+        """Return a healthy session to the pool."""
+        self._idle[url].put_nowait(pooled)
+        self._limits[url].release()
+
+    def discard(self, url: str, pooled: _PooledSession) -> None:
+        """Close a session that must not be reused."""
+        pooled.closed.set()
+        self._limits[url].release()
+
+    async def _open(
+        self, url: str, headers: dict[str, str], expires_at: float | None
+    ) -> _PooledSession:
+        ready: asyncio.Future[ClientSession] = (
+            asyncio.get_running_loop().create_future()
+        )
+        closed = asyncio.Event()
+        owner = asyncio.create_task(self._own(url, headers, ready, closed))
+        self._owners.add(owner)
+        owner.add_done_callback(self._owners.discard)
+        session = await ready
+        deadline = time.monotonic() + self._session_ttl
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+        return _PooledSession(session, deadline, closed)
+
+    @staticmethod
+    async def _own(
+        url: str,
+        headers: dict[str, str],
+        ready: asyncio.Future[ClientSession],
+        closed: asyncio.Event,
+    ) -> None:
+        try:
+            async with streamablehttp_client(url, headers=headers) as (read, write, _):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    if ready.cancelled():
+                        return
+                    ready.set_result(session)
+                    await closed.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning("MCP session for %s closed with error: %s", url, e)
+        except BaseException:
+            # Cancelled (e.g. on shutdown) before the session was handed out; do
+            # not leave _open waiting on it forever
+            if not ready.done():
+                ready.cancel()
+            raise
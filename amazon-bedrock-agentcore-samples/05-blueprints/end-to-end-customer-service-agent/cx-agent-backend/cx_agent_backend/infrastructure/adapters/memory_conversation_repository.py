@@ -1,33 +1,70 @@
 """In-memory implementation of conversation repository."""
 
+from collections import OrderedDict, defaultdict
 from uuid import UUID
 
-from cx_agent_backend.domain.entities.conversation import Conversation
+from cx_agent_backend.domain.entities.conversation import Conversation, Message
 from cx_agent_backend.domain.repositories.conversation_repository import (
     ConversationRepository,
 )
 
 
 class MemoryConversationRepository(ConversationRepository):
-    """In-memory conversation repository for development."""
+    """In-memory conversation repository for development.
 
-    def __init__(self):
-        self._conversations: dict[UUID, Conversation] = {}
+    Holds at most ``maxsize`` conversations; the least recently used one is
+    dropped when a new conversation would exceed the limit.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        self._maxsize = maxsize
+        self._conversations: OrderedDict[UUID, Conversation] = OrderedDict()
+        # Insertion-ordered so a user's conversations come back in creation order
+        self._by_user: defaultdict[str, dict[UUID, None]] = defaultdict(dict)
 
     async def save(self, conversation: Conversation) -> None:
         """Save conversation to memory."""
+        previous = self._conversations.get(conversation.id)
+        if previous is not None and previous.user_id != conversation.user_id:
+            self._unindex(previous.user_id, conversation.id)
         self._conversations[conversation.id] = conversation
+        self._conversations.move_to_end(conversation.id)
+        self._by_user[conversation.user_id][conversation.id] = None
+        if len(self._conversations) > self._maxsize:
+            evicted_id, evicted = self._conversations.popitem(last=False)
+            self._unindex(evicted.user_id, evicted_id)
+
+    async def append_message(self, conversation_id: UUID, message: Message) -> None:
+        """Append message to the stored conversation."""
+        conversation = self._conversations.get(conversation_id)
+        if conversation is None:
+            return
+        # The stored aggregate is usually the instance the caller already appended
+        # the whole turn to; new messages sit at the end, so scan from there
+        if not any(m.id == message.id for m in reversed(conversation.messages)):
+            conversation.add_message(message)
 
     async def get_by_id(self, conversation_id: UUID) -> Conversation | None:
         """Get conversation by ID."""
-        return self._conversations.get(conversation_id)
+        conversation = self._conversations.get(conversation_id)
+        if conversation is not None:
+            self._conversations.move_to_end(conversation_id)
+        return conversation
 
     async def get_by_user_id(self, user_id: str) -> list[Conversation]:
         """Get conversations by user ID."""
-        return [
-            conv for conv in self._conversations.values() if conv.user_id == user_id
-        ]
+        return [self._conversations[cid] for cid in self._by_user.get(user_id, ())]
 
     async def delete(self, conversation_id: UUID) -> None:
         """Delete conversation."""
-        self._conversations.pop(conversation_id, None)
+        conversation = self._conversations.pop(conversation_id, None)
+        if conversation is not None:
+            self._unindex(conversation.user_id, conversation_id)
+
+    def _unindex(self, user_id: str, conversation_id: UUID) -> None:
+        """Remove a conversation from its user's index bucket."""
+        bucket = self._by_user.get(user_id)
+        if bucket is not None:
+            bucket.pop(conversation_id, None)
+            if not bucket:
+                del self._by_user[user_id]
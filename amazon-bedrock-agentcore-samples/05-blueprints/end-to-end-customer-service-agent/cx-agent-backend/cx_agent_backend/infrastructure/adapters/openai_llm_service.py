@@ -3,13 +3,24 @@
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 
-from cx_agent_backend.domain.entities.conversation import MessageRole
+from cx_agent_backend.domain.entities.conversation import Message, MessageRole
 from cx_agent_backend.domain.services.llm_service import (
     LLMRequest,
     LLMResponse,
     LLMService,
 )
 
+_LC_MESSAGE_TYPES = {
+    MessageRole.USER: HumanMessage,
+    MessageRole.ASSISTANT: AIMessage,
+    MessageRole.SYSTEM: SystemMessage,
+}
+
+
+def _to_lc_messages(messages: list[Message]) -> list:
+    """Convert domain messages to LangChain format."""
+    return [_LC_MESSAGE_TYPES[msg.role](content=msg.content) for msg in messages]
+
 
 class OpenAILLMService(LLMService):
     """OpenAI implementation of LLM service."""
@@ -17,7 +28,7 @@ class OpenAILLMService(LLMService):
     def __init__(self, api_key: str, model: str, base_url: str | None = None):
         self.api_key = api_key
         self.base_url = base_url
-        self.model = ChatOpenAI(
+        self._client = ChatOpenAI(
             api_key=api_key,
             base_url=base_url,
             model=model,
@@ -27,15 +38,7 @@ class OpenAILLMService(LLMService):
 
     async def generate_response(self, request: LLMRequest) -> LLMResponse:
         """Generate response using OpenAI."""
-        # Convert domain messages to LangChain format
-        lc_messages = []
-        for msg in request.messages:
-            if msg.role == MessageRole.USER:
-                lc_messages.append(HumanMessage(content=msg.content))
-            elif msg.role == MessageRole.ASSISTANT:
-                lc_messages.append(AIMessage(content=msg.content))
-            elif msg.role == MessageRole.SYSTEM:
-                lc_messages.append(SystemMessage(content=msg.content))
+        lc_messages = _to_lc_messages(request.messages)
 
         # Generate response
         response = await self._client.ainvoke(lc_messages)
@@ -51,15 +54,7 @@ class OpenAILLMService(LLMService):
 
     async def stream_response(self, request: LLMRequest):
         """Stream response using OpenAI."""
-        # Convert domain messages to LangChain format
-        lc_messages = []
-        for msg in request.messages:
-            if msg.role == MessageRole.USER:
-                lc_messages.append(HumanMessage(content=msg.content))
-            elif msg.role == MessageRole.ASSISTANT:
-                lc_messages.append(AIMessage(content=msg.content))
-            elif msg.role == MessageRole.SYSTEM:
-                lc_messages.append(SystemMessage(content=msg.content))
+        lc_messages = _to_lc_messages(request.messages)
 
         # Stream response
         async for chunk in self._client.astream(lc_messages):
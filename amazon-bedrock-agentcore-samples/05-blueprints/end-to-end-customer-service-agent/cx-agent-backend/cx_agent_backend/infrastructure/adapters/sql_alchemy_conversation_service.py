@@ -1,7 +1,7 @@
 # infrastructure/sqlalchemy_conversation_repository.py
 import uuid
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from cx_agent_backend.domain.repositories.conversation_repository import (
     ConversationRepository,
@@ -15,6 +15,12 @@ from cx_agent_backend.presentation.schemas.conversation_schemas import (
 
 
 class SQLAlchemyConversationRepository(ConversationRepository):
+    """Commits once per use case.
+
+    ``save`` writes a conversation together with the messages it already holds in
+    a single commit, so the first turn of a new conversation is one transaction.
+    """
+
     def __init__(self, session: Session):
         self.session = session
 
@@ -22,14 +28,24 @@ class SQLAlchemyConversationRepository(ConversationRepository):
         convo_db = ConversationSchema(
             id=conversation.id, created_at=conversation.created_at
         )
-        for uid in conversation.user_ids:
-            convo_db.users.append(ConversationUserDB(user_id=uid))
+        convo_db.users = [
+            ConversationUserDB(user_id=uid) for uid in conversation.user_ids
+        ]
         self.session.add(convo_db)
+        for message in conversation.messages:
+            self._stage_message(conversation.id, message)
         self.session.commit()
 
     def get_by_id(self, conversation_id: uuid.UUID) -> Conversation:
+        # Load users and messages with the conversation instead of lazily per row
         convo_db = (
-            self.session.query(ConversationSchema).filter_by(id=conversation_id).first()
+            self.session.query(ConversationSchema)
+            .options(
+                joinedload(ConversationSchema.users),
+                selectinload(ConversationSchema.messages),
+            )
+            .filter_by(id=conversation_id)
+            .first()
         )
         if not convo_db:
             return None
@@ -45,7 +61,14 @@ class SQLAlchemyConversationRepository(ConversationRepository):
             created_at=convo_db.created_at,
         )
 
+    async def append_message(self, conversation_id: uuid.UUID, message: Message) -> None:
+        self.add_message(conversation_id, message)
+
     def add_message(self, conversation_id: uuid.UUID, message: Message) -> None:
+        self._stage_message(conversation_id, message)
+        self.session.commit()
+
+    def _stage_message(self, conversation_id: uuid.UUID, message: Message) -> None:
         msg_db = MessageSchema(
             id=message.id,
             conversation_id=conversation_id,
@@ -54,4 +77,3 @@ class SQLAlchemyConversationRepository(ConversationRepository):
             created_at=message.created_at,
         )
         self.session.add(msg_db)
-        self.session.commit()
@@ -1,10 +1,21 @@
 """Tools for agent operations."""
 
+import asyncio
+import base64
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
+
 import boto3
-from langchain_aws import AmazonKnowledgeBasesRetriever
+import httpx
+import numpy as np
+import orjson
+from langchain_aws import AmazonKnowledgeBasesRetriever, BedrockEmbeddings
 from langchain_core.tools import tool
-import logging
-import json
+from tavily import AsyncTavilyClient
 
 from cx_agent_backend.infrastructure.config.settings import settings
 from cx_agent_backend.infrastructure.aws.secret_reader import AWSSecretsReader
@@ -12,17 +23,94 @@ from cx_agent_backend.infrastructure.aws.parameter_store_reader import (
     AWSParameterStoreReader,
 )
 
-# Configure logging for local development
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
 secret_reader = AWSSecretsReader()
 parameter_store_reader = AWSParameterStoreReader()
 
+# Shared by the ticket tools so Zendesk connections stay open across calls and
+# the event loop is never blocked. Transport retries only cover failed connects,
+# so a ticket is never created twice.
+_http = httpx.AsyncClient(
+    timeout=httpx.Timeout(30.0),
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    transport=httpx.AsyncHTTPTransport(retries=2),
+)
+
+
+async def close_tool_clients() -> None:
+    """Close the shared tool HTTP client on application shutdown."""
+    await _http.aclose()
+
+
+@lru_cache(maxsize=1)
+def _zendesk_config(secret: str) -> tuple[str, dict[str, str]] | None:
+    """Parse the Zendesk secret into its subdomain and request headers.
+
+    Keyed on the raw secret string, so the headers are built once and rebuilt
+    only when a rotated value comes back from the secrets reader's TTL cache.
+    """
+    credentials = orjson.loads(secret)
+    subdomain = credentials.get("zendesk_domain")
+    email = credentials.get("zendesk_email")
+    api_token = credentials.get("zendesk_api_token")
+    if not all([subdomain, email, api_token]):
+        return None
+    auth = base64.b64encode(f"{email}/token:{api_token}".encode()).decode("ascii")
+    return subdomain, {
+        "Content-Type": "application/json",
+        "Authorization": f"Basic {auth}",
+    }
+
+
+async def _get_zendesk_config() -> tuple[str, dict[str, str]] | None:
+    """Return ``(subdomain, headers)`` for Zendesk, or None if not configured."""
+    try:
+        secret = await secret_reader.read_secret_async("zendesk_credentials")
+        return _zendesk_config(secret)
+    except Exception:
+        logger.error("Failed to retrieve Zendesk credentials")
+        return None
+
+
+async def warm_tool_clients() -> None:
+    """Load tool credentials and clients concurrently ahead of the first call.
+
+    The Zendesk secret, the Knowledge Base retriever (and its id) and the query
+    embedder are independent, so they load in parallel rather than one after
+    another inside the first tool calls. Failures are only logged; each tool
+    loads what it needs again on first use.
+    """
+    results = await asyncio.gather(
+        _get_zendesk_config(),
+        asyncio.to_thread(_get_kb_retriever),
+        asyncio.to_thread(_query_embedder),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning("Tool warm-up step failed: %s", result)
+
+
+_kb_retriever_lock = threading.Lock()
+
+
+def _get_kb_retriever() -> tuple[AmazonKnowledgeBasesRetriever, str]:
+    """Return the shared retriever and its Knowledge Base id, built on first use."""
+    with _kb_retriever_lock:
+        return _build_kb_retriever()
 
-def _get_kb_retriever():
-    """Create and return a Knowledge Base retriever instance."""
+
+def clear_kb_retriever() -> None:
+    """Drop the shared retriever so the next call rebuilds it (e.g. new KB id)."""
+    with _kb_retriever_lock:
+        _build_kb_retriever.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _build_kb_retriever() -> tuple[AmazonKnowledgeBasesRetriever, str]:
+    """Create a Knowledge Base retriever and return it with its KB id."""
     logger.debug("Initializing Knowledge Base retriever")
 
     try:
@@ -47,24 +135,126 @@ def _get_kb_retriever():
             },
         )
         logger.debug("Knowledge Base retriever initialized successfully")
-        return retriever
+        return retriever, kb_id
 
     except Exception as e:
         logger.error("Failed to initialize Knowledge Base retriever: %s", str(e))
         raise
 
 
+# Retrievals in flight by query; concurrent identical queries share one call
+_inflight_retrievals: dict[str, asyncio.Future] = {}
+
+
+def _retrieve_documents_sync(query: str) -> tuple[list, str]:
+    retriever, kb_id = _get_kb_retriever()
+    return retriever.invoke(input=query), kb_id
+
+
+async def _retrieve_documents(query: str) -> tuple[list, str]:
+    """Query the Knowledge Base off the event loop, coalescing duplicates.
+
+    Returns the documents and the id of the Knowledge Base they came from.
+    """
+    future = _inflight_retrievals.get(query)
+    if future is None:
+        future = asyncio.ensure_future(
+            asyncio.to_thread(_retrieve_documents_sync, query)
+        )
+        _inflight_retrievals[query] = future
+        future.add_done_callback(lambda _: _inflight_retrievals.pop(query, None))
+    # A cancelled caller must not cancel the retrieval other callers wait on
+    return await asyncio.shield(future)
+
+
+# Recent retrieval results keyed by query, reused for the same query or one whose
+# embedding is at least settings.semantic_cache_threshold similar. Entries expire
+# so Knowledge Base updates show up.
+SEMANTIC_CACHE_SIZE = 256
+SEMANTIC_CACHE_TTL = 600
+# A slow embedding call skips the cache rather than delaying the retrieval
+QUERY_EMBEDDING_TIMEOUT = 0.5
+_semantic_cache: OrderedDict[str, tuple[float, np.ndarray, dict]] = OrderedDict()
+
+
+@lru_cache(maxsize=1)
+def _query_embedder() -> BedrockEmbeddings:
+    """Shared embeddings client for the semantic retrieval cache."""
+    return BedrockEmbeddings(
+        model_id="amazon.titan-embed-text-v2:0",
+        region_name=settings.aws_region,
+        normalize=True,
+    )
+
+
+async def _embed_query(query: str) -> np.ndarray | None:
+    """Embed a query for cache lookups; None disables the cache for this call."""
+    try:
+        embedding = await asyncio.wait_for(
+            asyncio.to_thread(_query_embedder().embed_query, query),
+            timeout=QUERY_EMBEDDING_TIMEOUT,
+        )
+        return np.asarray(embedding, dtype=np.float32)
+    except TimeoutError:
+        logger.debug("Query embedding timed out, skipping retrieval cache")
+        return None
+    except Exception as e:
+        logger.debug("Query embedding failed, skipping retrieval cache: %s", e)
+        return None
+
+
+def _exact_cache_get(query: str) -> dict | None:
+    """Return the cached result of this exact query, if it has not expired."""
+    entry = _semantic_cache.get(query)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    _semantic_cache.move_to_end(query)
+    return entry[2]
+
+
+def _semantic_cache_get(embedding: np.ndarray) -> dict | None:
+    """Return the cached result of the most similar recent query, if close enough."""
+    now = time.monotonic()
+    for key in [k for k, entry in _semantic_cache.items() if entry[0] <= now]:
+        del _semantic_cache[key]
+    if not _semantic_cache:
+        return None
+
+    keys = list(_semantic_cache)
+    similarities = np.stack([_semantic_cache[k][1] for k in keys]) @ embedding
+    best = int(np.argmax(similarities))
+    if similarities[best] < settings.semantic_cache_threshold:
+        return None
+    _semantic_cache.move_to_end(keys[best])
+    return _semantic_cache[keys[best]][2]
+
+
+def _semantic_cache_put(query: str, embedding: np.ndarray, result: dict) -> None:
+    _semantic_cache.pop(query, None)
+    _semantic_cache[query] = (time.monotonic() + SEMANTIC_CACHE_TTL, embedding, result)
+    if len(_semantic_cache) > SEMANTIC_CACHE_SIZE:
+        _semantic_cache.popitem(last=False)
+
+
 @tool
-def retrieve_context(query: str) -> dict:
+async def retrieve_context(query: str) -> dict:
     """Retrieve context from the Knowledge Base to answer frequently asked questions."""
     logger.info("Retrieving context for query: %s...", query[:100])
 
-    try:
-        retriever = _get_kb_retriever()
-        kb_id = parameter_store_reader.get_parameter("/amazon/kb_id", decrypt=True)
-        logger.debug("Knowledge Base retriever initialized successfully")
+    cached = _exact_cache_get(query)
+    if cached is not None:
+        logger.info("Reusing cached Knowledge Base results for the same query")
+        return cached
 
-        retrieved_docs = retriever.invoke(input=query)
+    embedding = await _embed_query(query)
+    if embedding is not None:
+        cached = _semantic_cache_get(embedding)
+        if cached is not None:
+            logger.info("Reusing cached Knowledge Base results for a similar query")
+            return cached
+
+    try:
+        retrieved_docs, kb_id = await _retrieve_documents(query)
         logger.info("Retrieved %s documents from knowledge base", len(retrieved_docs))
 
         document_summaries = []
@@ -97,18 +287,21 @@ def retrieve_context(query: str) -> dict:
                 "relevance_score": summary["relevance_score"],
             }
             citations.append(citation)
-            print(json.dumps(citation))
+            logger.debug("Citation: %s", citation)
 
             logger.debug("Processed document %s: %s...", i, summary["title"][:50])
 
         logger.info(
             "Successfully retrieved and processed %s documents", len(document_summaries)
         )
-        return {
+        result = {
             "retrieved_documents": document_summaries,
             "citations": citations,
             "knowledge_base_id": kb_id,
         }
+        if embedding is not None:
+            _semantic_cache_put(query, embedding, result)
+        return result
 
     except Exception as e:
         logger.error("Failed to retrieve context: %s", str(e))
@@ -120,7 +313,7 @@ def retrieve_context(query: str) -> dict:
 
 
 @tool
-def create_support_ticket(
+async def create_support_ticket(
     subject: str,
     description: str,
     requester_name: str = None,
@@ -128,11 +321,6 @@ def create_support_ticket(
     priority: str = "normal",
 ) -> dict:
     """Create a support ticket in Zendesk."""
-    import json
-    import requests
-    import base64
-    import uuid
-
     logger.info("Creating support ticket with subject: %s...", subject[:50])
     logger.debug(
         "Ticket details - Priority: %s, Requester: %s (%s)",
@@ -141,17 +329,10 @@ def create_support_ticket(
         requester_email or "N/A",
     )
 
-    try:
-        # Get Zendesk credentials
-        zendesk_credentials = secret_reader.read_secret("zendesk_credentials")
-        subdomain = zendesk_credentials["zendesk_domain"]
-        email = zendesk_credentials["zendesk_email"]
-        api_token = zendesk_credentials["zendesk_api_token"]
-    except Exception:
-        logger.error("Failed to retrieve Zendesk credentials")
+    zendesk = await _get_zendesk_config()
 
     # If credentials not configured, return mock response
-    if not all([subdomain, email, api_token]):
+    if zendesk is None:
         logger.warning("Zendesk credentials not configured, returning mock response")
         ticket_id = str(uuid.uuid4())[:8]
         mock_response = {
@@ -172,8 +353,7 @@ def create_support_ticket(
 
     # Real Zendesk integration
     logger.info("Attempting to create real Zendesk ticket")
-    auth = base64.b64encode(f"{email}/token:{api_token}".encode()).decode("ascii")
-    headers = {"Content-Type": "application/json", "Authorization": f"Basic {auth}"}
+    subdomain, headers = zendesk
 
     ticket_data = {
         "subject": subject,
@@ -193,19 +373,19 @@ def create_support_ticket(
         url = f"https://{subdomain}.zendesk.com/api/v2/tickets.json"
         logger.debug("Making POST request to Zendesk API endpoint")
 
-        response = requests.post(
-            url, headers=headers, data=json.dumps({"ticket": ticket_data}), timeout=61
+        response = await _http.post(
+            url, headers=headers, content=orjson.dumps({"ticket": ticket_data})
         )
 
         logger.info("Zendesk API response status: %s", response.status_code)
         response.raise_for_status()
 
-        result = response.json()
+        result = orjson.loads(response.content)
         ticket_id = result.get("ticket", {}).get("id", "unknown")
         logger.info("Successfully created Zendesk ticket with ID")
 
         return result
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error("Zendesk API request failed: %s", str(e))
         return {"error": f"Failed to create ticket: {str(e)}"}
     except Exception as e:
@@ -214,34 +394,22 @@ def create_support_ticket(
 
 
 @tool
-def get_support_tickets(
+async def get_support_tickets(
     status: str = None,
     sort_by: str = "created_at",
     sort_order: str = "desc",
     limit: int = 25,
 ) -> dict:
     """Fetch tickets from Zendesk with optional filtering."""
-    import requests
-    import base64
-
     logger.info(
         "Fetching support tickets - Status: %s, Limit: %s", status or "all", limit
     )
     logger.debug("Sort parameters - By: %s, Order: %s", sort_by, sort_order)
 
-    try:
-        # Get Zendesk credentials
-        zendesk_credentials = secret_reader.read_secret("zendesk_credentials")
-        subdomain = zendesk_credentials["zendesk_domain"]
-        email = zendesk_credentials["zendesk_email"]
-        api_token = zendesk_credentials["zendesk_api_token"]
-        logger.debug("Retrieved Zendesk credentials for domain")
-    except Exception:
-        logger.error("Failed to retrieve Zendesk credentials")
-
+    zendesk = await _get_zendesk_config()
 
     # If credentials not configured, return mock response
-    if not all([subdomain, email, api_token]):
+    if zendesk is None:
         logger.warning("Zendesk credentials not configured, returning mock tickets")
         mock_response = {
             "tickets": [
@@ -259,8 +427,7 @@ def get_support_tickets(
 
     # Real Zendesk integration
     logger.info("Fetching tickets from Zendesk API")
-    auth = base64.b64encode(f"{email}/token:{api_token}".encode()).decode("ascii")
-    headers = {"Content-Type": "application/json", "Authorization": f"Basic {auth}"}
+    subdomain, headers = zendesk
 
     params = {"sort_by": sort_by, "sort_order": sort_order, "per_page": min(limit, 100)}
     if status:
@@ -271,17 +438,17 @@ def get_support_tickets(
         url = f"https://{subdomain}.zendesk.com/api/v2/tickets.json"
         logger.debug("Making GET request to Zendesk tickets API endpoint")
 
-        response = requests.get(url, headers=headers, params=params, timeout=61)
+        response = await _http.get(url, headers=headers, params=params)
         logger.info("Zendesk API response status: %s", response.status_code)
 
         response.raise_for_status()
-        result = response.json()
+        result = orjson.loads(response.content)
 
         ticket_count = len(result.get("tickets", []))
         logger.info("Successfully fetched %s tickets from Zendesk", ticket_count)
 
         return result
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error("Zendesk API request failed: %s", str(e))
         return {"error": f"Failed to fetch tickets: {str(e)}"}
     except Exception as e:
@@ -290,13 +457,13 @@ def get_support_tickets(
 
 
 @tool
-def web_search(query: str) -> str:
+async def web_search(query: str) -> str:
     """Search the web for information using Tavily API."""
     logger.info("Performing web search for query: %s...", query[:100])
 
     try:
-        tavily_secret = secret_reader.read_secret("tavily_key")
-        tavily_api_key = json.loads(tavily_secret)["tavily_key"]
+        tavily_secret = await secret_reader.read_secret_async("tavily_key")
+        tavily_api_key = orjson.loads(tavily_secret)["tavily_key"]
         logger.debug("Retrieved Tavily API credentials")
     except Exception:
         logger.error("Failed to retrieve Tavily credentials")
@@ -310,14 +477,10 @@ def web_search(query: str) -> str:
         return mock_result
 
     try:
-        from tavily import TavilyClient
-
-        logger.debug("Tavily client imported successfully")
-
-        client = TavilyClient(api_key=tavily_api_key)
+        client = AsyncTavilyClient(api_key=tavily_api_key)
         logger.debug("Tavily client initialized")
 
-        response = client.search(query)
+        response = await client.search(query)
         logger.info("Web search completed successfully for query: %s...", query[:50])
 
         # Log response summary without full content
@@ -325,10 +488,7 @@ def web_search(query: str) -> str:
             result_count = len(response.get("results", []))
             logger.debug("Web search returned %s results", result_count)
 
-        return str(response)
-    except ImportError as e:
-        logger.error("Tavily client not installed: %s", str(e))
-        return f"Tavily client not installed. Mock results for: {query}"
+        return orjson.dumps(response).decode()
     except Exception as e:
         logger.error("Web search failed: %s", str(e))
         return f"Web search failed: {str(e)}"
@@ -1,13 +1,92 @@
+import asyncio
+import logging
+import threading
+import time
+from functools import lru_cache
+
 import boto3
 
 from cx_agent_backend.infrastructure.config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _client():
+    """Create the SSM client on first use and reuse it afterwards."""
+    return boto3.client("ssm", region_name=settings.aws_region)
+
+
+# Parameter values by (name, decrypt) with their expiry time and the timer that
+# re-reads them shortly before they expire, so requests rarely wait on SSM. Only
+# parameters read from the cache since they were stored are refreshed; the rest
+# expire and are fetched again on demand.
+_cache: dict[tuple[str, bool], tuple[float, str, threading.Timer]] = {}
+_read_since_store: set[tuple[str, bool]] = set()
+_cache_lock = threading.Lock()
+_REFRESH_AHEAD = 10
+
+
+def _fetch(name: str, decrypt: bool) -> str:
+    try:
+        response = _client().get_parameter(Name=name, WithDecryption=decrypt)
+        return response["Parameter"]["Value"]
+    except _client().exceptions.ParameterNotFound:
+        raise ValueError(f"Parameter {name} not found")
+
+
+def _store(key: tuple[str, bool], value: str) -> None:
+    ttl = settings.ssm_cache_ttl
+    timer = threading.Timer(max(ttl - _REFRESH_AHEAD, 1), _refresh, (key,))
+    timer.daemon = True
+    with _cache_lock:
+        previous = _cache.pop(key, None)
+        _cache[key] = (time.monotonic() + ttl, value, timer)
+        _read_since_store.discard(key)
+        evicted = None
+        if len(_cache) > settings.ssm_cache_size:
+            evicted_key = next(iter(_cache))
+            evicted = _cache.pop(evicted_key)
+            _read_since_store.discard(evicted_key)
+    for entry in (previous, evicted):
+        if entry is not None:
+            entry[2].cancel()
+    timer.start()
+
+
+def _refresh(key: tuple[str, bool]) -> None:
+    with _cache_lock:
+        if key not in _cache or key not in _read_since_store:
+            return
+    try:
+        _store(key, _fetch(*key))
+    except Exception as e:
+        # Keep the current value; it expires normally and is re-read on demand
+        logger.warning("Error refreshing parameter %s: %s", key[0], e)
+
+
+def _cached(key: tuple[str, bool]) -> str | None:
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is None or cached[0] <= time.monotonic():
+            return None
+        _read_since_store.add(key)
+    return cached[1]
+
 
 class AWSParameterStoreReader:
     def get_parameter(self, name: str, decrypt: bool = False) -> str:
-        client = boto3.client("ssm", region_name=settings.aws_region)
-        try:
-            response = client.get_parameter(Name=name, WithDecryption=decrypt)
-            return response["Parameter"]["Value"]
-        except client.exceptions.ParameterNotFound:
-            raise ValueError(f"Parameter {name} not found")
+        value = _cached((name, decrypt))
+        if value is not None:
+            return value
+
+        value = _fetch(name, decrypt)
+        _store((name, decrypt), value)
+        return value
+
+    async def get_parameter_async(self, name: str, decrypt: bool = False) -> str:
+        """Return a cached parameter directly; fetch it on a worker thread otherwise."""
+        value = _cached((name, decrypt))
+        if value is not None:
+            return value
+        return await asyncio.to_thread(self.get_parameter, name, decrypt)
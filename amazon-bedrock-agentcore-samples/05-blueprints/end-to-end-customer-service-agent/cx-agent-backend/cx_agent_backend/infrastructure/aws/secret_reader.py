@@ -1,19 +1,65 @@
+import asyncio
+import logging
+import threading
+import time
+from functools import lru_cache
+
 import boto3
 
 from cx_agent_backend.domain.ports.secret_reader import SecretReader
 from cx_agent_backend.infrastructure.config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _client():
+    """Create the Secrets Manager client on first use and reuse it afterwards."""
+    return boto3.client("secretsmanager", region_name=settings.aws_region)
+
+
+# Secret values by name with their expiry time, shared by all readers
+_cache: dict[str, tuple[float, str]] = {}
+_cache_lock = threading.Lock()
+
+
+def _cached(name: str) -> str | None:
+    with _cache_lock:
+        cached = _cache.get(name)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
 
 class AWSSecretsReader(SecretReader):
     def read_secret(self, name: str) -> str:
-        client = boto3.client("secretsmanager", region_name=settings.aws_region)
+        value = _cached(name)
+        if value is not None:
+            return value
+
         try:
-            print(f"Reading secret: {name} in region: {settings.aws_region}")
-            response = client.get_secret_value(SecretId=name)
-            return response["SecretString"]
-        except client.exceptions.ResourceNotFoundException:
-            print(f"Secret not found: {name} in region: {settings.aws_region}")
+            logger.debug("Reading secret: %s in region: %s", name, settings.aws_region)
+            response = _client().get_secret_value(SecretId=name)
+        except _client().exceptions.ResourceNotFoundException:
+            logger.error(
+                "Secret not found: %s in region: %s", name, settings.aws_region
+            )
             raise ValueError(f"Missing secret value for {name}")
         except Exception as e:
-            print(f"Error reading secret {name}: {str(e)}")
+            logger.error("Error reading secret %s: %s", name, e)
             raise
+
+        value = response["SecretString"]
+        with _cache_lock:
+            _cache.pop(name, None)
+            _cache[name] = (time.monotonic() + settings.secrets_cache_ttl, value)
+            if len(_cache) > settings.secrets_cache_size:
+                _cache.pop(next(iter(_cache)))
+        return value
+
+    async def read_secret_async(self, name: str) -> str:
+        """Return a cached secret directly; read it on a worker thread otherwise."""
+        value = _cached(name)
+        if value is not None:
+            return value
+        return await asyncio.to_thread(self.read_secret, name)
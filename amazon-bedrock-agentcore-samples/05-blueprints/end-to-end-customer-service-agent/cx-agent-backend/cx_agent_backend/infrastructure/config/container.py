@@ -21,15 +21,23 @@ from cx_agent_backend.infrastructure.aws.parameter_store_reader import (
 )
 
 
+def _read_json_secret(secret_reader: AWSSecretsReader, name: str) -> dict:
+    """Read a secret and parse its JSON payload."""
+    return json.loads(secret_reader.read_secret(name))
+
+
 class Container(containers.DeclarativeContainer):
     """Dependency injection container."""
 
     # Configuration
     config = providers.Configuration()
-    secret_reader = AWSSecretsReader()
-    parameter_store_reader = AWSParameterStoreReader()
+    secret_reader = providers.Singleton(AWSSecretsReader)
+    parameter_store_reader = providers.Singleton(AWSParameterStoreReader)
 
-    gateway_secret = json.loads(secret_reader.read_secret("gateway_credentials"))
+    # Read from AWS when first needed, not when this module is imported
+    gateway_secret = providers.Singleton(
+        _read_json_secret, secret_reader, "gateway_credentials"
+    )
 
     # Repositories
     conversation_repository = providers.Singleton(MemoryConversationRepository)
@@ -38,7 +46,9 @@ class Container(containers.DeclarativeContainer):
     guardrail_service = (
         providers.Singleton(
             BedrockGuardrailService,
-            guardrail_id=parameter_store_reader.get_parameter("/amazon/guardrail_id", decrypt=True),
+            guardrail_id=parameter_store_reader.provided.get_parameter.call(
+                "/amazon/guardrail_id", decrypt=True
+            ),
             region=settings.aws_region,
         )
         if settings.guardrails_enabled
@@ -47,8 +57,8 @@ class Container(containers.DeclarativeContainer):
 
     llm_service = providers.Singleton(
         OpenAILLMService,
-        api_key=gateway_secret["api_key"],
-        base_url=gateway_secret["gateway_url"],
+        api_key=gateway_secret.provided["api_key"],
+        base_url=gateway_secret.provided["gateway_url"],
         model=settings.default_model,
     )
 
@@ -22,6 +22,9 @@ class Settings(BaseSettings):
     host: str = Field(default="0.0.0.0", description="Server host")  # nosec B104
     port: int = Field(default=8080, description="Server port")
     debug: bool = Field(default=False, description="Debug mode")
+    # Conversations are kept in process memory, so more than one worker only suits
+    # deployments with a shared conversation repository or sticky sessions
+    workers: int = Field(default=1, description="Number of uvicorn worker processes")
 
     # LLM Settings
     default_model: str = Field(
@@ -37,6 +40,14 @@ class Settings(BaseSettings):
         description="AWS region",
     )
 
+    # Secrets Manager values are cached in process for this many seconds
+    secrets_cache_ttl: int = Field(default=600, description="Secret cache TTL")
+    secrets_cache_size: int = Field(default=64, description="Max cached secrets")
+
+    # Parameter Store values are cached in process and refreshed before expiry
+    ssm_cache_ttl: int = Field(default=300, description="Parameter cache TTL")
+    ssm_cache_size: int = Field(default=128, description="Max cached parameters")
+
     # Logging
     log_level: str = Field(default="INFO", description="Log level")
 
@@ -51,10 +62,24 @@ class Settings(BaseSettings):
         default=True, description="Enable content guardrails"
     )
 
+    # Gateway Settings
+    mcp_client_max_connections: int = Field(
+        default=500, description="Max connections of the gateway HTTP client"
+    )
+    mcp_client_max_keepalive_connections: int = Field(
+        default=100, description="Max keep-alive connections of the gateway HTTP client"
+    )
+
     # Knowledge Base Settings
     bedrock_kb_id: str | None = Field(
         default=None, description="Bedrock Knowledge Base ID"
     )
+    # Queries differing in one key term (an order number, a product name) can
+    # still score close to 1, so raise this if such queries share results
+    semantic_cache_threshold: float = Field(
+        default=0.95,
+        description="Cosine similarity above which a cached retrieval is reused",
+    )
 
 
 # Global settings instance
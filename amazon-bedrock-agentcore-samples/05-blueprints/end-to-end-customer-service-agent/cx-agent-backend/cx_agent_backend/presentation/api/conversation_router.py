@@ -2,6 +2,7 @@
 
 import logging
 import time
+from collections import OrderedDict
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
@@ -12,8 +13,10 @@ from cx_agent_backend.domain.services.conversation_service import ConversationSe
 from cx_agent_backend.infrastructure.config.container import Container
 from cx_agent_backend.presentation.schemas.conversation_schemas import (
     ConversationSchema,
+    ConversationStatusSchema,
     CreateConversationRequest,
     HealthResponse,
+    MessageRoleSchema,
     MessageSchema,
     SendMessageRequest,
     SendMessageResponse,
@@ -30,24 +33,43 @@ async def ping() -> HealthResponse:
     return HealthResponse(time_of_last_update=int(time.time()))
 
 
+# Messages never change once created, so their (frozen) schemas are converted
+# once and reused across reads of the same conversation
+MESSAGE_SCHEMA_CACHE_SIZE = 10_000
+_message_schemas: OrderedDict[UUID, MessageSchema] = OrderedDict()
+
+
 def _message_to_schema(message: Message) -> MessageSchema:
     """Convert domain message to schema."""
-    return MessageSchema(
+    schema = _message_schemas.get(message.id)
+    if schema is not None:
+        _message_schemas.move_to_end(message.id)
+        return schema
+
+    schema = MessageSchema.model_construct(
         id=message.id,
         content=message.content,
-        role=message.role.value,
+        role=MessageRoleSchema(message.role.value),
         timestamp=message.timestamp,
         metadata=message.metadata,
     )
+    _message_schemas[message.id] = schema
+    if len(_message_schemas) > MESSAGE_SCHEMA_CACHE_SIZE:
+        _message_schemas.popitem(last=False)
+    return schema
 
 
 def _conversation_to_schema(conversation: Conversation) -> ConversationSchema:
-    """Convert domain conversation to schema."""
-    return ConversationSchema(
+    """Convert domain conversation to schema.
+
+    The domain entities already enforce the schema's invariants, so the schemas
+    are built with ``model_construct`` and skip validation.
+    """
+    return ConversationSchema.model_construct(
         id=conversation.id,
         user_id=conversation.user_id,
         messages=[_message_to_schema(msg) for msg in conversation.messages],
-        status=conversation.status.value,
+        status=ConversationStatusSchema(conversation.status.value),
         created_at=conversation.created_at,
         updated_at=conversation.updated_at,
         metadata=conversation.metadata,
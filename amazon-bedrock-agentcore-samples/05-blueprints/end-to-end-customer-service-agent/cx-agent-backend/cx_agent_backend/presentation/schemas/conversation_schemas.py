@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MessageRoleSchema(str, Enum):
@@ -18,6 +18,8 @@ class MessageRoleSchema(str, Enum):
 class MessageSchema(BaseModel):
     """Message schema."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: UUID
     content: str
     role: MessageRoleSchema
@@ -1,12 +1,23 @@
 """FastAPI application definition"""
 
-from datetime import datetime
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 import time
 from uuid import UUID
 
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 import structlog
 
+from cx_agent_backend.infrastructure.adapters.langgraph_agent_service import (
+    close_gateway_clients,
+    wait_for_memory_writes,
+)
+from cx_agent_backend.infrastructure.adapters.tools import (
+    close_tool_clients,
+    warm_tool_clients,
+)
 from cx_agent_backend.infrastructure.config.container import Container
 from cx_agent_backend.infrastructure.config.settings import settings
 from cx_agent_backend.presentation.api.conversation_router import (
@@ -17,6 +28,17 @@ from cx_agent_backend.presentation.api.conversation_router import (
 logger = structlog.get_logger()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm tool clients in the background; finish writes and close them on shutdown."""
+    warmup = asyncio.create_task(warm_tool_clients())
+    yield
+    warmup.cancel()
+    await wait_for_memory_writes()
+    await close_gateway_clients()
+    await close_tool_clients()
+
+
 def create_app() -> FastAPI:
     """Create FastAPI application."""
     # Initialize container
@@ -28,6 +50,8 @@ def create_app() -> FastAPI:
         version=settings.api_version,
         description=settings.api_description,
         debug=settings.debug,
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Wire container
@@ -99,7 +123,7 @@ def create_app() -> FastAPI:
                 return {
                     "output": {
                         "message": "Feedback received",
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
                     }
                 }
 
@@ -115,7 +139,7 @@ def create_app() -> FastAPI:
             # Return agent contract format with metadata
             output = {
                 "message": message.content,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": message.timestamp.isoformat(),
                 "model": settings.default_model,
             }
 
@@ -125,17 +149,17 @@ def create_app() -> FastAPI:
                 # Extract trace_id from metadata if available
                 if "trace_id" in message.metadata:
                     output["trace_id"] = message.metadata["trace_id"]
-                    print(
-                        f"DEBUG: Added trace_id to output: {message.metadata['trace_id']}"
+                    logger.debug(
+                        "Added trace_id to output", trace_id=output["trace_id"]
                     )
                 else:
-                    print(
-                        f"DEBUG: No trace_id in metadata. Available keys: {list(message.metadata.keys())}"
+                    logger.debug(
+                        "No trace_id in metadata", keys=list(message.metadata)
                     )
             else:
-                print("DEBUG: No metadata available in message")
+                logger.debug("No metadata available in message")
 
-            print(f"DEBUG: Final output keys: {list(output.keys())}")
+            logger.debug("Final output keys", keys=list(output))
             return {"output": output}
 
         except ValueError as e:
@@ -0,0 +1,104 @@
+"""Tests for the conversation service with the in-memory repository."""
+
+import pytest
+
+from cx_agent_backend.domain.entities.conversation import Message
+from cx_agent_backend.domain.services.agent_service import (
+    AgentRequest,
+    AgentResponse,
+    AgentService,
+)
+from cx_agent_backend.domain.services.conversation_service import (
+    ConversationService,
+)
+from cx_agent_backend.domain.services.guardrail_service import (
+    GuardrailAssessment,
+    GuardrailResult,
+    GuardrailService,
+)
+from cx_agent_backend.infrastructure.adapters.memory_conversation_repository import (
+    MemoryConversationRepository,
+)
+
+
+class EchoAgentService(AgentService):
+    """Agent that answers every prompt by echoing it back."""
+
+    async def process_request(self, request: AgentRequest) -> AgentResponse:
+        return AgentResponse(
+            content=f"re: {request.messages[-1].content}",
+            agent_type=request.agent_type,
+            tools_used=[],
+            metadata={},
+        )
+
+    async def stream_response(self, request: AgentRequest):
+        yield ""
+
+
+class BlockingGuardrailService(GuardrailService):
+    """Guardrail that blocks every input."""
+
+    async def check_input(self, message: Message) -> GuardrailResult:
+        return GuardrailResult(
+            assessment=GuardrailAssessment.BLOCKED,
+            blocked_categories=["test"],
+            message="blocked",
+        )
+
+    async def check_output(self, message: Message) -> GuardrailResult:
+        return GuardrailResult(
+            assessment=GuardrailAssessment.ALLOWED,
+            blocked_categories=[],
+            message="",
+        )
+
+
+def _contents(conversation) -> list[str]:
+    return [m.content for m in conversation.messages]
+
+
+@pytest.mark.asyncio
+async def test_two_turns_store_each_message_once():
+    repository = MemoryConversationRepository()
+    service = ConversationService(
+        conversation_repo=repository, agent_service=EchoAgentService()
+    )
+    conversation = await service.start_conversation("user-1")
+
+    await service.send_message(conversation.id, "user-1", "q1", "model")
+    await service.send_message(conversation.id, "user-1", "q2", "model")
+
+    stored = await repository.get_by_id(conversation.id)
+    assert _contents(stored) == ["q1", "re: q1", "q2", "re: q2"]
+
+
+@pytest.mark.asyncio
+async def test_two_blocked_turns_store_each_message_once():
+    repository = MemoryConversationRepository()
+    service = ConversationService(
+        conversation_repo=repository,
+        agent_service=EchoAgentService(),
+        guardrail_service=BlockingGuardrailService(),
+    )
+    conversation = await service.start_conversation("user-1")
+
+    await service.send_message(conversation.id, "user-1", "q1", "model")
+    await service.send_message(conversation.id, "user-1", "q2", "model")
+
+    stored = await repository.get_by_id(conversation.id)
+    assert _contents(stored) == ["q1", "blocked", "q2", "blocked"]
+
+
+@pytest.mark.asyncio
+async def test_user_conversations_keep_creation_order():
+    repository = MemoryConversationRepository()
+    service = ConversationService(
+        conversation_repo=repository, agent_service=EchoAgentService()
+    )
+    started = [await service.start_conversation("user-1") for _ in range(5)]
+
+    await service.send_message(started[0].id, "user-1", "q1", "model")
+
+    conversations = await service.get_user_conversations("user-1")
+    assert [c.id for c in conversations] == [c.id for c in started]